@@ -31,10 +31,12 @@ __description__ = 'Python tree structure for data storage and iterations'
 from .itree_helpers import iTLink, NoTag, NoKey, NoValue, Tag, \
     iTFLAG, getter_to_list, INF, INF_PLUS, INF_MINUS, Any, TagIdx, ITER
 from .itree_main import iTree
+from .itree_path import iTCompiledPath
 
 from . import itree_data as Data
 itree_data=Data
 from . import itree_filters as Filters
 from .itree_serializer.itree_render_dot import _iTreeRenderDot
+from .itree_serializer.itree_binary_serialize import iTStdBinarySerializer
 
 iTreeRenderDot = _iTreeRenderDot().renders
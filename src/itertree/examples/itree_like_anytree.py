@@ -97,7 +97,7 @@ class NodeIT(iTree):
             return self._hc_tree
         except AttributeError:
             # The subclass is only instanced if it is first used
-            tree, tree._itree, tree.get = NodeITDeep(), self, self.get
+            tree, tree._itree = NodeITDeep(), self
             self._hc_tree = tree
             return tree
 
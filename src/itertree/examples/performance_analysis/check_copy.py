@@ -108,6 +108,22 @@ class TestCopyL1(BasePerformance):
         assert len(new)==len(tree)
         assert new.get.by_idx(0) is not tree.get.by_idx(0)
 
+    def it_copy_on_write(self,key,ro_tree):
+        # read-only source; the children of the copy are created when first accessed
+        new=ro_tree.copy(copy_on_write=True)
+        assert len(new)==len(ro_tree)
+
+    def it_copy_on_write_change(self,key,ro_tree):
+        new=ro_tree.copy(copy_on_write=True)
+        new[-1].append(new[0].copy())
+        assert len(new)==len(ro_tree)
+        assert new.get.by_idx(0) is not ro_tree.get.by_idx(0)
+
+    def it_persistent_version(self,key,ro_tree):
+        # new frozen version with one changed value (shares the untouched subtrees with ro_tree)
+        new=ro_tree.persistent.set_value('changed',-1)
+        assert len(new)==len(ro_tree)
+
     def it_copycopy(self,key):
         tree=self.trees[key]
         #new=tree.copy(levels=0)
@@ -229,6 +245,19 @@ class TestCopyL1(BasePerformance):
             else:
                 it_t3=float('inf')
                 self.print_time_meas_output(None,'%s'%(op_str3))
+
+            # copy-on-write copies of a tree read-only source compared with tree.copy()
+            ro_tree = self.trees[key].copy()
+            ro_tree.set_tree_read_only()
+            t = self.calc_timeit(self.it_copy_on_write, key, ro_tree)
+            self.print_time_meas_output(t, 'tree.copy(copy_on_write=True)', it_t1,
+                                        post_text='{:.3f}x faster as tree.copy()')
+            t = self.calc_timeit(self.it_copy_on_write_change, key, ro_tree)
+            self.print_time_meas_output(t, 'tree.copy(copy_on_write=True) + change of one child', it_t1,
+                                        post_text='{:.3f}x faster as tree.copy()')
+            t = self.calc_timeit(self.it_persistent_version, key, ro_tree)
+            self.print_time_meas_output(t, 'tree.persistent.set_value(value,-1) (new version)', it_t3,
+                                        post_text='{:.3f}x faster as copy.deepcopy(tree)')
         else:
 
             entry = False
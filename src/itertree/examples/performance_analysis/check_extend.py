@@ -54,6 +54,20 @@ class TestBuildByExtendL1(BasePerformance):
                        subtree=list(obj_class('%i' % i) for i in range(self.max_items)))
         assert self.max_items == len(tree)
 
+    def it_build_from_columns(self, key, obj_class):
+        tags = ['%i' % i for i in range(self.max_items)]
+        values = list(range(self.max_items))
+        tree = obj_class.from_columns(tags, values, 'root')
+        assert self.max_items == len(tree)
+
+    def it_build_extend_columns(self, key, obj_class):
+        # same input data as in from_columns() for comparison
+        tags = ['%i' % i for i in range(self.max_items)]
+        values = list(range(self.max_items))
+        tree = obj_class('root')
+        tree.extend(obj_class(tag, value) for tag, value in zip(tags, values))
+        assert self.max_items == len(tree)
+
     def list_build(self, key, obj_class):
         tree = obj_class((('%i' % i, i, obj_class()) for i in range(self.max_items)))
         assert self.max_items == len(tree)
@@ -102,6 +116,14 @@ class TestBuildByExtendL1(BasePerformance):
                 it_extend=t
                 self.print_time_meas_output(it_extend, ['%s:'%obj_data['str'],
                                                         op_str])
+                # bulk build from columns compared with extend() on same input
+                t = self.calc_timeit(self.it_build_extend_columns, key, cl)
+                self.print_time_meas_output(t, ['%s (columns):' % obj_data['str'],
+                                                'tree.extend(iTree(tag,value) for tag,value in zip(tags,values))'])
+                t2 = self.calc_timeit(self.it_build_from_columns, key, cl)
+                self.print_time_meas_output(t2, ['%s (columns):' % obj_data['str'],
+                                                 'tree=iTree.from_columns(tags,values)'],
+                                            t, post_text='{:.3f}x faster as extend()')
             elif key in {'XML.Element','LXML.Element'}:
                 t = self.calc_timeit(method, key, cl)
                 init = obj_data.get('init', key)
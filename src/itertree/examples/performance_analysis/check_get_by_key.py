@@ -347,6 +347,35 @@ class TestGetByKeyLn(BasePerformance):
         assert self.max_items*self.items_per_level == c,'Accessed item number: %i expect %i'%(c,self.max_items*self.items_per_level)
         return c
 
+    def it_key_paths(self):
+        # same target paths as used in it_get_by_key()
+        paths=[]
+        key_list=[]
+        for i in range(self.max_items):
+            key_list.append(None)
+            for ii in range(self.items_per_level):
+                key_list[-1]=('%i_%i'%(i,ii),0)
+                if ii==1:
+                    new_key_list=key_list.copy()
+                paths.append(tuple(key_list))
+            key_list=new_key_list
+        return paths
+
+    def it_get_many(self,key,paths):
+        tree=self.trees[key]
+        result=tree.get.many(paths)
+        assert self.max_items*self.items_per_level == len(result),'Accessed item number: %i expect %i'%(len(result),self.max_items*self.items_per_level)
+        return len(result)
+
+    def it_get_compiled(self,key,compiled_paths):
+        tree=self.trees[key]
+        c=0
+        for path in compiled_paths:
+            if path.get(tree) is not None:
+                c+=1
+        assert self.max_items*self.items_per_level == c,'Accessed item number: %i expect %i'%(c,self.max_items*self.items_per_level)
+        return c
+
     def dict_get_by_key(self,key,module):
         tree=self.trees[key]
         c=0
@@ -531,6 +560,28 @@ class TestGetByKeyLn(BasePerformance):
             self.print_time_meas_output(t,
                                         ['%s (tag_idx-specific access):'%obj_data['str'],
                                         '%s'%(op_str)],it_t2,post_text='{:.3f}x faster as common access')
+            # access via pre-compiled target paths
+            compiled_paths=[obj_data['class'].compile_path(*path) for path in self.it_key_paths()]
+            t = self.calc_timeit(self.it_get_compiled, key, compiled_paths)
+            self.print_time_meas_output(t,
+                                        ['%s (compiled target path):'%obj_data['str'],
+                                        'path=iTree.compile_path(*key_path); path.get(tree)'],it_t2,
+                                        post_text='{:.3f}x faster as common access')
+            # all paths resolved in one call (common prefixes are accessed only once)
+            t = self.calc_timeit(self.it_get_many, key, self.it_key_paths())
+            self.print_time_meas_output(t,
+                                        ['%s (batched target access):'%obj_data['str'],
+                                        'tree.get.many(key_paths)'],it_t2,
+                                        post_text='{:.3f}x faster as common access')
+            # repeated access of the same paths with active path cache (first run fills the cache)
+            tree = self.trees[key]
+            tree.get.enable_path_cache()
+            t = self.calc_timeit(caller[1][0], key)
+            tree.get.disable_path_cache()
+            self.print_time_meas_output(t,
+                                        ['%s (common target access, path cache):'%obj_data['str'],
+                                        'tree.get.enable_path_cache(); tree.get(*key_path)'],it_t2,
+                                        post_text='{:.3f}x faster as common access')
         else:
             if single:
                 if max_items>=self.max_items:
@@ -60,6 +60,14 @@ class TestBuildByInsertL1(BasePerformance):
             tree.insert(1,obj_class('%i' % i))
         assert self.max_items == len(tree)-1
 
+    def it_build_family(self, key, obj_class):
+        # all items are in the same family -> the family index must be searched for each insert
+        tree = obj_class('root')
+        tree.append(obj_class('fam',-1))
+        for i in range(self.max_items):
+            tree.insert(len(tree) // 2, obj_class('fam', i))
+        assert self.max_items == len(tree)-1
+
     def list_build(self, key, obj_class):
         tree = obj_class()
         tree.append(('-1', -1, obj_class()))
@@ -133,6 +141,10 @@ class TestBuildByInsertL1(BasePerformance):
                 it_insert=t
                 self.print_time_meas_output(it_insert, ['%s:'%obj_data['str'],
                                                         op_str])
+                # insert in the middle of one large family
+                t = self.calc_timeit(self.it_build_family, key, cl)
+                self.print_time_meas_output(t, ['%s (same family):' % obj_data['str'],
+                                                'tree=iTree(); tree.insert(len(tree)//2,iTree(same_tag,value)'])
             else:
                 init=obj_data.get('init', key)
                 op_str=op_str%(init,init)
@@ -20,12 +20,21 @@ CONTENT DESCRIPTION:
 Test performance of itertree specific methods.
 """
 
+import io
+import os
 import pytest
 import itertools
 import pickle
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from itertree.examples.performance_analysis.base_performance import BasePerformance
-from itertree import iTLink,iTree
+from itertree import iTLink,iTree,iTStdBinarySerializer
+from itertree.itree_serializer.itree_json_serialize import iTStdJSONSerializer2
+from itertree.itree_mathsets import mSetInterval
 
 
 class TestiTreeSpecificL1(BasePerformance):
@@ -204,10 +213,48 @@ class TestiTreeSpecificL1(BasePerformance):
             c += 1
             assert a is not None
 
+    def performance_it_find_by_value(self):
+        tree=self.trees['iTree']
+        find_by_value=tree.deep.find_by_value
+        for i in range(0, self.max_items, max(1, self.max_items // 10)):
+            assert find_by_value(i)
+
+    def performance_it_find_by_value_in(self):
+        tree=self.trees['iTree']
+        find_by_value_in=tree.deep.find_by_value_in
+        step = max(1, self.max_items // 10)
+        for i in range(0, self.max_items, step):
+            assert find_by_value_in(mSetInterval(lower=i, upper=i + step))
+
     def performance_it_dumps(self):
         tree=self.trees['iTree']
         a = tree.dumps()
 
+    def performance_it_dump_stream(self):
+        tree=self.trees['iTree']
+        tree.dump(io.BytesIO())
+
+    def performance_it_load_stream(self, itree_serializer=iTStdJSONSerializer2):
+        self.dump_fh.seek(0)
+        a = iTree().load(self.dump_fh, itree_serializer=itree_serializer)
+
+    def performance_it_load_lazy(self):
+        # open the file and access a single branch only
+        a = iTree().load(self.lazy_file_path, itree_serializer=iTStdBinarySerializer, lazy=True)
+        assert a[len(a) // 2][-1] is not None
+
+    def performance_it_load_target_path(self):
+        # decode a single branch only
+        a = iTree().load(self.lazy_file_path, itree_serializer=iTStdBinarySerializer, target_path=[('50', 0)])
+        assert len(a) == self.max_items // 100
+
+    def performance_it_dump_binary(self):
+        tree=self.trees['iTree']
+        tree.dump(io.BytesIO(), itree_serializer=iTStdBinarySerializer)
+
+    def performance_it_dump_arrays(self, itree_serializer):
+        self.array_tree.dump(io.BytesIO(), pack=False, itree_serializer=itree_serializer)
+
     def performance_it_pickle(self):
         tree=self.trees['iTree']
         a = pickle.dumps(tree)
@@ -271,10 +318,78 @@ class TestiTreeSpecificL1(BasePerformance):
                                     'tree[tag]                    # common family-tag access',
                                     t1, post_text = '{:.3f}x faster as specific' )
 
+        t1 = self.calc_timeit(self.performance_it_find_by_value)
+        self.print_time_meas_output(t1,
+                                    'tree.deep.find_by_value(v)   # search values without index')
+        self.trees['iTree'].deep.enable_value_index()
+        t = self.calc_timeit(self.performance_it_find_by_value)
+        self.trees['iTree'].deep.disable_value_index()
+        self.print_time_meas_output(t,
+                                    'tree.deep.find_by_value(v)   # with deep.enable_value_index()',
+                                    t1, post_text='{:.3f}x faster as without index')
+
+        t1 = self.calc_timeit(self.performance_it_find_by_value_in)
+        self.print_time_meas_output(t1,
+                                    'tree.deep.find_by_value_in(mSetInterval) # range queries without index')
+        self.trees['iTree'].deep.enable_sorted_index()
+        t = self.calc_timeit(self.performance_it_find_by_value_in)
+        self.trees['iTree'].deep.disable_sorted_index()
+        self.print_time_meas_output(t,
+                                    'tree.deep.find_by_value_in(mSetInterval) # with deep.enable_sorted_index()',
+                                    t1, post_text='{:.3f}x faster as without index')
+
         t = self.calc_timeit(self.performance_it_dumps)
         self.print_time_meas_output(t,
                                     'tree.dumps()                 # serialize into string (json)')
 
+        t = self.calc_timeit(self.performance_it_dump_stream)
+        self.print_time_meas_output(t,
+                                    'tree.dump(fh)                # streamed into gzip file handle')
+
+        t1 = self.calc_timeit(self.performance_it_dump_binary)
+        self.print_time_meas_output(t1,
+                                    'tree.dump(fh, itree_serializer=iTStdBinarySerializer)',
+                                    t, post_text='{:.3f}x faster as JSON')
+
+        if np is not None:
+            self.array_tree = iTree('arrays', subtree=[iTree('a', np.random.rand(10000)) for _ in range(10)])
+            t = self.calc_timeit(lambda: self.performance_it_dump_arrays(iTStdJSONSerializer2))
+            self.print_time_meas_output(t,
+                                        'tree.dump(fh)                # 10 numpy arrays (10000 floats)')
+            t1 = self.calc_timeit(lambda: self.performance_it_dump_arrays(iTStdBinarySerializer))
+            self.print_time_meas_output(t1,
+                                        'tree.dump(fh, itree_serializer=iTStdBinarySerializer) # numpy arrays',
+                                        t, post_text='{:.3f}x faster as JSON')
+
+        self.dump_fh = io.BytesIO()
+        self.trees['iTree'].dump(self.dump_fh)
+        t = self.calc_timeit(self.performance_it_load_stream)
+        self.print_time_meas_output(t,
+                                    'iTree().load(fh)             # streamed from gzip file handle')
+        self.dump_fh = io.BytesIO()
+        self.trees['iTree'].dump(self.dump_fh, itree_serializer=iTStdBinarySerializer)
+        t1 = self.calc_timeit(lambda: self.performance_it_load_stream(iTStdBinarySerializer))
+        self.print_time_meas_output(t1,
+                                    'iTree().load(fh, itree_serializer=iTStdBinarySerializer)',
+                                    t, post_text='{:.3f}x faster as JSON')
+        # nested tree (100 branches) -> the lazy loading creates only the accessed branch
+        self.lazy_file_path = os.path.join(self.tmp_folder, 'out_lazy.itb')
+        nested_tree = iTree('root', subtree=[iTree('%i' % i, i, subtree=[iTree('%i' % ii, ii)
+                                                                         for ii in range(self.max_items // 100)])
+                                             for i in range(100)])
+        nested_tree.dump(self.lazy_file_path, pack=False, overwrite=True, itree_serializer=iTStdBinarySerializer)
+        t = self.calc_timeit(lambda: iTree().load(self.lazy_file_path, itree_serializer=iTStdBinarySerializer))
+        self.print_time_meas_output(t,
+                                    'iTree().load(file, itree_serializer=iTStdBinarySerializer) # nested tree')
+        t1 = self.calc_timeit(self.performance_it_load_lazy)
+        self.print_time_meas_output(t1,
+                                    'iTree().load(file, ..., lazy=True) # access one branch',
+                                    t, post_text='{:.3f}x faster as full load')
+        t1 = self.calc_timeit(self.performance_it_load_target_path)
+        self.print_time_meas_output(t1,
+                                    'iTree().load(file, ..., target_path=[(tag, idx)]) # one branch',
+                                    t, post_text='{:.3f}x faster as full load')
+
         t = self.calc_timeit(self.performance_it_pickle)
         self.print_time_meas_output(t,
                                     'pickle.dumps(tree)           # serialize via pickle')
@@ -448,11 +563,32 @@ class TestiTreeSpecificLn(BasePerformance):
             c += 1
             assert a is not None
 
+    def performance_it_subtree_aggregates(self):
+        tree=self.trees['iTree']
+        assert len(tree.deep) == self.max_items * self.items_per_level
+        assert tree.max_depth == self.max_items
+
+    def performance_it_positions(self):
+        tree=self.trees['iTree']
+        for item in tree.deep:
+            a = item.level
+            b = item.idx_path
+
+    def performance_it_deep_tag_queries(self):
+        tree=self.trees['iTree']
+        deep=tree.deep
+        for i in range(0, self.max_items, max(1, self.max_items // 10)):
+            tag = '%i_5' % i
+            assert deep.is_tag_in(tag)
+            assert deep.find_by_tag(tag)
+
     def performance_it_dumps(self):
         tree=self.trees['iTree']
         a = tree.dumps()
 
-
+    def performance_it_render_stream(self):
+        tree=self.trees['iTree']
+        tree.render(stream=io.StringIO())
 
     def test_exec(self):
         t2 = self.calc_timeit(self.it_append)
@@ -480,6 +616,40 @@ class TestiTreeSpecificLn(BasePerformance):
                                     'tree[tag_idx]                # common tag-idx access',
                                     t2,post_text='{:.3f}x faster as specific' )
 
+        t1 = self.calc_timeit(self.performance_it_subtree_aggregates)
+        self.print_time_meas_output(t1,
+                                    'len(tree.deep); tree.max_depth # without aggregates')
+        self.trees['iTree'].deep.enable_aggregates()
+        t = self.calc_timeit(self.performance_it_subtree_aggregates)
+        self.trees['iTree'].deep.disable_aggregates()
+        self.print_time_meas_output(t,
+                                    'len(tree.deep); tree.max_depth # with deep.enable_aggregates()',
+                                    t1, post_text='{:.3f}x faster as without aggregates')
+
+        t1 = self.calc_timeit(self.performance_it_positions)
+        self.print_time_meas_output(t1,
+                                    'item.level; item.idx_path    # without position cache')
+        iTree.enable_position_cache()
+        t = self.calc_timeit(self.performance_it_positions)
+        iTree.disable_position_cache()
+        self.print_time_meas_output(t,
+                                    'item.level; item.idx_path    # with iTree.enable_position_cache()',
+                                    t1, post_text='{:.3f}x faster as without cache')
+
+        t1 = self.calc_timeit(self.performance_it_deep_tag_queries)
+        self.print_time_meas_output(t1,
+                                    'tree.deep.find_by_tag(tag)   # deep tag queries without index')
+        self.trees['iTree'].deep.enable_tag_index()
+        t = self.calc_timeit(self.performance_it_deep_tag_queries)
+        self.trees['iTree'].deep.disable_tag_index()
+        self.print_time_meas_output(t,
+                                    'tree.deep.find_by_tag(tag)   # with deep.enable_tag_index()',
+                                    t1, post_text='{:.3f}x faster as without index')
+
+        t = self.calc_timeit(self.performance_it_render_stream)
+        self.print_time_meas_output(t,
+                                    'tree.render(stream=stream)   # render into stream')
+
         t1 = self.calc_timeit(self.performance_it_get_tag_specific)
         self.print_time_meas_output(t1,
                                     'tree.get.by_tag(tag)         # specific family-tag access')
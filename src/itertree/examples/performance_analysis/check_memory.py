@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+This code is taken from the itertree package:
+  _ _____ _____ _____ _____ _____ _____ _____
+ | |_   _|   __| __  |_   _| __  |   __|   __|
+ |-| | | |   __|    -| | | |    -|   __|   __|
+ |_| |_| |_____|__|__| |_| |__|__|_____|_____|
+
+https://pypi.org/project/itertree/
+GIT Home:
+https://github.com/BR1py/itertree
+The documentation can be found here:
+https://itertree.readthedocs.io/en/latest/index.html
+
+The code is published under MIT license
+For more information see: https://en.wikipedia.org/wiki/MIT_License
+
+CONTENT DESCRIPTION:
+
+Test memory consumption (bytes per node) of iTree.
+"""
+
+import gc
+import tracemalloc
+
+from itertree.examples.performance_analysis.base_performance import BasePerformance
+from itertree import iTree
+
+
+class TestMemoryL1(BasePerformance):
+
+    def get_header(self):
+        out = 'Memory consumption per node'
+        out = '\n\n--- {} {:-^{width}}\n'.format(out, '', width=110 - len(out))
+        out = out + '-> Measured via tracemalloc, the given value is the allocated memory divided by the number of nodes\n'
+        out = out + '-> tag and value objects are created before the measurement and are not counted\n'
+        return out
+
+    def get_callers(self):
+        return {}
+
+    def measure_bytes_per_node(self, build_method, *args):
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start = tracemalloc.get_traced_memory()[0]
+            tree = build_method(*args)
+            size = tracemalloc.get_traced_memory()[0] - start
+        finally:
+            tracemalloc.stop()
+        nodes = len(tree.deep) + 1
+        return size / nodes
+
+    def print_memory_output(self, bytes_per_node, content_s, width=None):
+        if not width:
+            width = self.width
+        spaces = width - len(content_s)
+        if spaces < 0:
+            spaces = 1
+        print('{}{: ^{width}}{:.1f} bytes/node'.format(content_s, '', bytes_per_node, width=spaces))
+
+    def it_append(self, tags):
+        tree = iTree('root')
+        for tag in tags:
+            tree.append(iTree(tag, 0))
+        return tree
+
+    def it_extend(self, tags):
+        return iTree('root', subtree=[iTree(tag, 0) for tag in tags])
+
+    def it_nested(self, tags):
+        tree = iTree('root')
+        for sub_tags in zip(*[iter(tags)] * 10):
+            sub_tree = tree.append(iTree(sub_tags[0]))
+            sub_tree.extend([iTree(tag, 0) for tag in sub_tags[1:]])
+        return tree
+
+    def it_get_access(self, tags):
+        tree = self.it_extend(tags)
+        for item in tree:
+            item.get()
+        return tree
+
+    def test_exec(self):
+        tags = ['%i' % i for i in range(self.max_items)]
+        b = self.measure_bytes_per_node(self.it_append, tags)
+        self.print_memory_output(b, 'tree=iTree(); tree.append(iTree(tag,0))...')
+        b = self.measure_bytes_per_node(self.it_extend, tags)
+        self.print_memory_output(b, 'tree=iTree("root",subtree=[iTree(tag,0) ...])')
+        b = self.measure_bytes_per_node(self.it_nested, tags)
+        self.print_memory_output(b, 'nested tree (10 items per sub-tree)')
+        b = self.measure_bytes_per_node(self.it_get_access, tags)
+        self.print_memory_output(b, 'tree=iTree("root",subtree=[...]); item.get() on each leaf')
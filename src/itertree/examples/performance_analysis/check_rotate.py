@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+This code is taken from the itertree package:
+  _ _____ _____ _____ _____ _____ _____ _____
+ | |_   _|   __| __  |_   _| __  |   __|   __|
+ |-| | | |   __|    -| | | |    -|   __|   __|
+ |_| |_| |_____|__|__| |_| |__|__|_____|_____|
+
+https://pypi.org/project/itertree/
+GIT Home:
+https://github.com/BR1py/itertree
+The documentation can be found here:
+https://itertree.readthedocs.io/en/latest/index.html
+
+The code is published under MIT license
+For more information see: https://en.wikipedia.org/wiki/MIT_License
+
+CONTENT DESCRIPTION:
+
+Test performance of rotate().
+"""
+
+import pytest
+import itertools
+
+from itertree.examples.performance_analysis.base_performance import BasePerformance
+
+class TestRotateL1(BasePerformance):
+
+    def get_header(self):
+        out = 'Rotate level 1 children'
+        out='\n\n--- {} {:-^{width}}\n'.format(out, '', width=110 - len(out))
+        out=out+'-> the children are rotated forth and back by 10 positions (tree is unchanged afterwards)\n'
+        out=out+'-> list-like objects without rotate() method are rotated via slicing\n'
+        return out
+
+    def get_callers(self):
+        return {
+            'iTree':(self.tree_rotate,'tree.rotate(10); tree.rotate(-10)',float('inf')),
+
+            'list':(self.list_rotate,'tree[:]=tree[-10:]+tree[:-10]; ...',float('inf')),
+            'deque': (self.tree_rotate,'tree.rotate(10); tree.rotate(-10)',float('inf')),
+            'blist': (self.list_rotate,'tree[:]=tree[-10:]+tree[:-10]; ...',float('inf')),
+        }
+
+    def tree_rotate(self,key):
+        tree=self.trees[key]
+        first=tree[0]
+        tree.rotate(10)
+        tree.rotate(-10)
+        assert tree[0] is first
+
+    def list_rotate(self,key):
+        tree=self.trees[key]
+        first=tree[0]
+        tree[:]=tree[-10:]+tree[:-10]
+        tree[:]=tree[10:]+tree[:10]
+        assert tree[0] is first
+
+    def test_exec(self,key,it_t1=None,it_t2=None):
+        obj_data=self.objects[key]
+        caller = self.get_callers().get(key)
+        if caller is None:
+            # no action for this object
+            return self.trees,self.trees2,it_t1,it_t2
+        method,op_str,max_items=caller
+
+        if key=='iTree':
+            t = self.calc_timeit(method,key)
+            it_t1=t
+            self.print_time_meas_output(t,
+                                        ['%s:'%obj_data['str'],
+                                        op_str])
+        else:
+            if max_items>=self.max_items:
+                t = self.calc_timeit(method, key)
+                self.print_time_meas_output(t,
+                                            ['%s:'%obj_data['str'],
+                                            '%s'%(op_str)],
+                                            it_t1)
+            else:
+                self.print_time_meas_output(None,
+                                            ['%s:' % obj_data['str'],
+                                             '%s' % (op_str)],
+                                            )
+
+        return self.trees,self.trees2,it_t1,it_t2
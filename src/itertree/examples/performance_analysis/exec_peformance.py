@@ -44,7 +44,9 @@ SUB_EXEC_CONTROL = [1,  # append
                     9,
                     10,
                     11,  # specific
-                    12 # delete items
+                    12, # delete items
+                    13,  # memory consumption
+                    14  # rotate
                     ]
 CREATE_DOCS = [1]
 # EXEC_CONTROL = ['Ln_100','Ln_500','Ln_1000']
@@ -198,6 +200,8 @@ from itertree.examples.performance_analysis.check_iter import TestIterL1, TestIt
 from itertree.examples.performance_analysis.check_save_load import TestSaveLoadL1
 from itertree.examples.performance_analysis.check_itree_specific import TestiTreeSpecificL1, TestiTreeSpecificLn
 from itertree.examples.performance_analysis.check_delete import TestDeleteL1
+from itertree.examples.performance_analysis.check_memory import TestMemoryL1
+from itertree.examples.performance_analysis.check_rotate import TestRotateL1
 
 
 class Test_level1_tree():
@@ -424,6 +428,34 @@ class Test_level1_tree():
             print(test_item.get_header())
             print('Test (12) skipped')
 
+    def test_13_memory_tree(self):
+        test_item = self.instance_test_item(TestMemoryL1)
+        if self.exec_test(13):
+            print(test_item.get_header())
+            test_item.test_exec()
+        else:
+            print(test_item.get_header())
+            print('Test (13) skipped')
+
+    def test_14_rotate_tree(self):
+        test_item = self.instance_test_item(TestRotateL1)
+        if self.exec_test(14):
+            print(test_item.get_header())
+            it_t1, it_t2 = None, None
+            for key in TEST_OBJECTS.keys():
+                if key in self.trees:
+                    try:
+                        _, _, it_t1, it_t2 = test_item.test_exec(key, it_t1, it_t2)
+                    except AssertionError:
+                        print('*** Test issue in %s' % key)
+                        raise
+                else:
+                    print('%s no test source was build (append())                             '
+                          '-> operation skipped' % TEST_OBJECTS[key]['str'])
+        else:
+            print(test_item.get_header())
+            print('Test (14) skipped')
+
 
 class Test2_level1_tree(Test_level1_tree):
 
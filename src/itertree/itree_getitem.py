@@ -24,13 +24,41 @@ The specific getters are quicker compared with the common ones we have in iTree
 from .itree_helpers import BLIST_ACTIVE,NoTarget,TagIdx
 from .itree_private import _iTreePrivate
 
+
+def _target_key(target):
+    """
+    deliver a dict key for the given target which contains the types of the target (and of the items of
+    tuple, `TagIdx` and frozenset targets)
+
+    Equal targets of different types (e.g. `1`, `True` and `1.0`) target different items (index vs. tag)
+    and must not be merged in the dicts used for caching.
+
+    :param target: target object
+    :return: key tuple (type, target)
+    """
+    t = type(target)
+    if t is tuple or t is TagIdx:
+        return t, tuple(map(_target_key, target))
+    if t is frozenset:
+        return t, frozenset(map(_target_key, target))
+    return t, target
+
+
 class _iTreeGetitem():
-    __slots__ = ('_itree','getitem_by_idx','_getitem_fam','_get_fam')
-    # To win some speed we set self._itree after init of the class in the main iTree object
+    __slots__ = ('_itree','getitem_by_idx','_getitem_fam','_get_fam','_path_cache')
+    # To win some speed we take over the quick access methods of the main iTree object
+    # (the iTree object updates them in case they change)
 
     NoneSlice=slice(None)
     def __init__(self,itree):
         self._itree=itree
+        self._path_cache=None
+        self.getitem_by_idx=itree.getitem_by_idx
+        try:
+            self._getitem_fam, self._get_fam = itree._getitem_fam, itree._get_fam
+        except AttributeError:
+            # no children added yet
+            pass
 
     @staticmethod
     def _get_child_ren(itree, target):
@@ -276,6 +304,18 @@ class _iTreeGetitem():
         :rtype: Union[iTree,list]
         :return: iTree object or list of objects
         """
+        path_cache = self._path_cache
+        if path_cache is not None:
+            # path cache active (see `enable_path_cache()`)
+            # equal targets of different types (e.g. 1, True, 1.0) must not be mixed up (see `_target_key()`)
+            key = (_target_key(target),) + tuple(map(_target_key, target_path))
+            try:
+                return path_cache[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable targets are not cached
+                path_cache = None
         try:
             if target_path:
                 # create locals
@@ -300,7 +340,11 @@ class _iTreeGetitem():
                                 pass
                         item_s = result
                 if item_s.__class__ is cls:
-                    return item_s if single else [item_s]
+                    if single:
+                        if path_cache is not None:
+                            path_cache[key] = item_s
+                        return item_s
+                    return [item_s]
                 elif item_s:
                     return list(item_s)
                 else:
@@ -309,12 +353,124 @@ class _iTreeGetitem():
                 return self._itree
             else:
                 is_single,r=self._get_child_ren(self._itree,target)
-                return r if is_single else list(r)
+                if is_single:
+                    if path_cache is not None:
+                        path_cache[key] = r
+                    return r
+                return list(r)
         except (ValueError, KeyError, IndexError,AttributeError) as e:
             if target is NoTarget:
                 return self
             return _iTreePrivate._raise_exception(e) if (default is Exception) else default
 
+    def many(self, paths, default=Exception):
+        """
+        Call via **iTree().get.many()**
+
+        Get the items for multiple target paths in one operation. The result is the same as
+        `[itree.get(*path) for path in paths]` but target paths with common prefixes are resolved together
+        (the common levels are accessed only once).
+
+        ::
+
+            >>> root.get.many([(('sub', 0), 1), (('sub', 0), 2), (('sub', 1),)], default=None)
+            [iTree('subsub', value=5), None, iTree('sub', value=4)]
+
+        .. note:: Each path must be given as a tuple (or list) of targets even if it contains only one level,
+                  e.g. `[(('sub', 0),), (2,)]`.
+
+        :except: In case no default is given the exception of the first not matching path is raised
+
+        :type paths: Iterable
+        :param paths: target paths (each path is a tuple of targets like the arguments of `get()`)
+
+        :param default: The parameter must be given as keyword parameter! The object is delivered for all paths
+                        without a matching item. If the parameter is not set (`==Exception`) exceptions will
+                        be raised in case of issues.
+
+        :rtype: list
+        :return: list of results in the order of the given paths
+        """
+        itree = self._itree
+        paths = [tuple(path) for path in paths]
+        results = [default] * len(paths)
+        # prefix tree of the targets; each node is a list: [children dict, indexes of the paths ending here, target]
+        # -> the children are stored by type and target (equal targets of different types must not be merged)
+        trie = [{}, [], None]
+        for i, path in enumerate(paths):
+            node = trie
+            try:
+                for target in path:
+                    children = node[0]
+                    key = _target_key(target)
+                    node = children.get(key)
+                    if node is None:
+                        children[key] = node = [{}, [], target]
+            except TypeError:
+                # unhashable target -> path is resolved by the common get()
+                results[i] = self(*path, default=default)
+                continue
+            node[1].append(i)
+        for i in trie[1]:
+            # empty path
+            results[i] = itree
+        get_child_ren = self._get_child_ren
+        stack = [(itree, trie[0])]
+        while stack:
+            item, children = stack.pop()
+            for node in children.values():
+                try:
+                    single, r = get_child_ren(item, node[2])
+                except (ValueError, KeyError, IndexError, AttributeError) as e:
+                    if default is Exception:
+                        return _iTreePrivate._raise_exception(e)
+                    continue  # all paths below deliver the default
+                if single:
+                    for i in node[1]:
+                        results[i] = r
+                    if node[0]:
+                        stack.append((r, node[0]))
+                else:
+                    # not unique result -> the paths below are resolved by the common get()
+                    nodes = [node]
+                    while nodes:
+                        sub_node = nodes.pop()
+                        for i in sub_node[1]:
+                            results[i] = self(*paths[i], default=default)
+                        nodes.extend(sub_node[0].values())
+        return results
+
+    def enable_path_cache(self):
+        """
+        Call via **iTree().get.enable_path_cache()**
+
+        Activate the path cache for the `get()` method of this `iTree`-object. Unique results
+        (e.g. targeted by index or by (tag, family-index) pairs) are stored with the target path as key and
+        repeated calls with the same target path are answered with a single dict lookup. The key contains the
+        types of the targets (equal targets of different types like `1`, `True` and `1.0` are cached separately).
+        Creating the key takes time too, for short paths of (tag, family-index) pairs the direct access
+        (cache disabled) is quicker.
+
+        The cache is cleared by all structural changes in the subtree (append, insert, delete, move, rename, sort,
+        ...). Value changes do not affect the cache.
+
+        .. note:: As long as a path cache is active the structural changing methods of all `iTree`-objects must
+                  check their parents for caches. The cache should be disabled when not needed anymore.
+        """
+        if self._path_cache is None:
+            self._path_cache = {}
+            _iTreePrivate._path_cache_cnt += 1
+
+    def disable_path_cache(self):
+        """
+        Call via **iTree().get.disable_path_cache()**
+
+        Deactivate the path cache for the `get()` method of this `iTree`-object (see `enable_path_cache()`).
+        """
+        if self._path_cache is not None:
+            self._path_cache = None
+            _iTreePrivate._path_cache_cnt -= 1
+
     def single(self, target, *target_path, default=Exception):
         """
         Call via **iTree().get.single()**
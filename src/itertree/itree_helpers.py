@@ -270,6 +270,8 @@ class _iTFLAG():
     PLACEHOLDER = 0b10000
     LINK_ROOT = 0b100000
     FLAG_MASK = 0b111111
+    # source of copy-on-write copies (not part of the FLAG_MASK -> not taken over in copies or new instances)
+    SHARED = 0b1000000
 
 INF=float('inf')
 INF_PLUS=float('+inf')
@@ -24,8 +24,11 @@ import sys
 import warnings
 import copy
 from collections import deque
-from .itree_helpers import ORDER_PRE, ORDER_POST, ORDER_LEVEL, ITER
+from fnmatch import fnmatch
+from .itree_helpers import ORDER_PRE, ORDER_POST, ORDER_LEVEL, ITER, NoKey, NoValue
 from .itree_indepth_helpers.itree_indepth_iter import _iTreeIndepthIter
+from .itree_private import _iTreePrivate
+from .itree_sorted_index import _iTreeSortedIndex
 
 DOWN = ITER.DOWN
 UP = ITER.UP
@@ -40,7 +43,7 @@ NONE_TUPLE = (None,)
 
 
 class _iTreeIndepthTree(_iTreeIndepthIter):
-    __slots__ = ('_itree', 'get', '_active_iter')
+    __slots__ = ('_itree', '_active_iter', '_value_index', '_tag_index', '_sorted_indexes', '_aggregates')
 
     # To win some speed we set self._itree after init of the class in the main iTree object
 
@@ -75,6 +78,7 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
         flag in a children if the flag is not unset at the parent too.
 
         :except: If the parent contains the tree protection flag a PermissionError will be raised
+                 (same if the item is the source of copy-on-write copies)
 
         :type filter_method: Union[Callable,None]
         :param filter_method: filter method that checks for matching items
@@ -102,6 +106,9 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
         if itree._itree_prt_idx is not None and itree._itree_prt_idx[0]._flags & itree._READ_ONLY_TREE:
             raise PermissionError('The structural protection flag can only be unset in '
                                   'case the parent is not protected. But here the parent holds the protection flag')
+        if itree._flags & itree._SHARED:
+            raise PermissionError('The structural protection flag can not be unset, '
+                                  'the item is the source of copy-on-write copies')
         if filter_method:
             if filter_method(itree):
                 unset_flags(itree, read_only_tree_flag)
@@ -216,11 +223,53 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
 
         Delivers number of all items (in-depth) inside the `iTree`-object
 
+        In case the subtree aggregates are active (see `enable_aggregates()`) the number is read from the
+        aggregates and no iteration over the subtree is required.
+
         :rtype: int
         :return: number of children and sub-children in `iTree`-object
         """
+        itree = self._itree
+        if itree._deep_index_cnt:
+            aggregate = _iTreePrivate._get_aggregate(itree)
+            if aggregate is not None:
+                return aggregate[0]
         return sum(1 for _ in self)
 
+    def enable_aggregates(self):
+        """
+        Call via **iTree().deep.enable_aggregates()**
+
+        Activate the subtree aggregates (augmented-node mode) for the `iTree`-object. For the object and for all
+        in-depth children the subtree size (`len(item.deep)`) and the subtree height (`item.max_depth`) are stored
+        and the changing methods (append, insert, extend, delete, ...) update the stored values of the changed
+        items and of their parents. Reading the two properties is then a lookup instead of an iteration over the
+        whole subtree (for items inside the subtree the parents are searched for the aggregates (O(depth))).
+
+        After link loads or item replacements the aggregates are rebuild in the next read.
+        Calling the method again rebuilds the aggregates.
+
+        .. note:: As long as aggregates are active the changing methods of all `iTree`-objects must
+                  check their parents for aggregates. They should be disabled when not needed anymore.
+        """
+        try:
+            self._aggregates
+        except AttributeError:
+            _iTreePrivate._deep_index_cnt += 1
+        self._aggregates = _iTreePrivate._build_aggregates((self._itree,))
+
+    def disable_aggregates(self):
+        """
+        Call via **iTree().deep.disable_aggregates()**
+
+        Delete the subtree aggregates created by `enable_aggregates()`
+        """
+        try:
+            del self._aggregates
+        except AttributeError:
+            return
+        _iTreePrivate._deep_index_cnt -= 1
+
     def __lt__(self, other):
         """
         Call via **iTree().deep<other.deep**
@@ -347,9 +396,17 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
         Call via **iTree().deep.is_tag_in()**
 
         Checks if a iTree contains the given family-tag (in_depth (all levels))
+
+        If a tag index is active (see `enable_tag_index()`) the check is a single dict lookup.
+
         :param tag: family tag
         :return: True/False
         """
+        tag_index = self._get_current_tag_index()
+        if tag_index is not None:
+            return tag in tag_index[0]
+        if self._itree.is_tag_in(tag):
+            return True
         for i in self:  # iter over all items
             if i.is_tag_in(tag):
                 return True
@@ -379,6 +436,256 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
             p = p._itree_prt_idx is not None and p._itree_prt_idx[0] or None
         return False
 
+    def enable_value_index(self):
+        """
+        Call via **iTree().deep.enable_value_index()**
+
+        Create a hash index over the values of all in-depth children (the value of the object itself is
+        not part of the index). The index is used by `find_by_value()` and it is kept up to date by the
+        changing methods (`set_value()`, `set_key_value()`, `del_value()`, append, insert, delete, ...).
+        Calling the method on an already indexed `iTree` rebuilds the index.
+
+        Only hashable values are indexed. In case a `iTValueModel` is stored the value inside the model is indexed.
+
+        .. note:: Changes made directly on the value-objects (without using the `iTree`-methods) are not seen by
+                  the index. As long as a value index is active the changing methods of all `iTree`-objects must
+                  check their parents for indexes. The index should be disabled when not needed anymore.
+        """
+        try:
+            self._value_index
+        except AttributeError:
+            _iTreePrivate._deep_index_cnt += 1
+        self._value_index = _iTreePrivate._build_deep_index(self._itree, _iTreePrivate._get_index_value)
+
+    def disable_value_index(self):
+        """
+        Call via **iTree().deep.disable_value_index()**
+
+        Delete the value index created by `enable_value_index()`
+        """
+        try:
+            del self._value_index
+        except AttributeError:
+            return
+        _iTreePrivate._deep_index_cnt -= 1
+
+    def find_by_value(self, value):
+        """
+        Call via **iTree().deep.find_by_value()**
+
+        Find all in-depth children which contain the given value (in case a `iTValueModel` is
+        stored the value inside the model is compared).
+
+        The values must be equal and of the same type (e.g. `1`, `True` and `1.0` do not match each other).
+        If a value index is active (see `enable_value_index()`) the result is taken from the index
+        (O(1) expected time), the order of the items in the result is not defined in this case. Without an index
+        (or for unhashable values) all in-depth children are compared (O(n)) and the result is in the normal
+        in-depth iteration order.
+
+        :param value: value to be searched for
+
+        :rtype: list
+        :return: list of matching `iTree`-objects (empty list if no match is found)
+        """
+        try:
+            value_index = self._value_index
+        except AttributeError:
+            pass
+        else:
+            if value_index is None:
+                # outdated -> rebuild
+                self._value_index = value_index = _iTreePrivate._build_deep_index(self._itree,
+                                                                                  _iTreePrivate._get_index_value)
+            try:
+                bucket = value_index[0].get((type(value), value))
+            except TypeError:
+                # unhashable values are not in the index
+                pass
+            else:
+                return list(bucket.values()) if bucket else []
+        value_equal = _iTreePrivate._value_equal
+        return [i for i in self if value_equal(i.get_value(), value)]
+
+    def enable_sorted_index(self, key=NoKey):
+        """
+        Call via **iTree().deep.enable_sorted_index()**
+
+        Create a sorted index over the numerical values of all in-depth children (the value of the object itself
+        is not part of the index). The index is used by `find_by_value_in()` for range queries and it is kept up to
+        date by the changing methods (`set_value()`, `set_key_value()`, append, insert, delete, ...).
+        Multiple sorted indexes (with different keys) can be active in parallel. Calling the method again with
+        the same key rebuilds the index.
+
+        Only real numbers are indexed (NaN is ignored), items with other values are not part of the index.
+
+        .. note:: Changes made directly on the value-objects (without using the `iTree`-methods) are not seen by
+                  the index. As long as an index is active the changing methods of all `iTree`-objects must
+                  check their parents for indexes. The index should be disabled when not needed anymore.
+
+        :param key: `NoKey` - the value itself is indexed; other objects - the sub-value `value[key]` is indexed
+                    (for dict or list values)
+        """
+        try:
+            sorted_indexes = self._sorted_indexes
+        except AttributeError:
+            self._sorted_indexes = sorted_indexes = {}
+        if key not in sorted_indexes:
+            _iTreePrivate._deep_index_cnt += 1
+        sorted_indexes[key] = _iTreeSortedIndex(key, _iTreePrivate._iter_subtrees(self._itree))
+
+    def disable_sorted_index(self, key=NoKey):
+        """
+        Call via **iTree().deep.disable_sorted_index()**
+
+        Delete the sorted index created by `enable_sorted_index()`
+
+        :param key: key of the index (as given in `enable_sorted_index()`)
+        """
+        try:
+            sorted_indexes = self._sorted_indexes
+            del sorted_indexes[key]
+        except (AttributeError, KeyError):
+            return
+        _iTreePrivate._deep_index_cnt -= 1
+        if not sorted_indexes:
+            del self._sorted_indexes
+
+    def find_by_value_in(self, value_set, key=NoKey):
+        """
+        Call via **iTree().deep.find_by_value_in()**
+
+        Find all in-depth children with numerical values in the given set (like the filter
+        `itree_filters.is_item_value_in` but non-numerical values are always ignored).
+
+        ::
+
+            >>> root.deep.find_by_value_in(mSetInterval('[2,5)'))  # all items with 2 <= value < 5
+            >>> root.deep.find_by_value_in(mSetRoster(items=[1, 3]), key='time')  # items with value['time'] in {1,3}
+
+        If a sorted index with the given key is active (see `enable_sorted_index()`) `mSetInterval` and `mSetRoster`
+        queries are answered from the index in O(log n + k). Without an index (or for other sets) all in-depth
+        children are checked (O(n)).
+
+        :type value_set: Union[mSetInterval,mSetRoster,object]
+        :param value_set: set the values should be in (any object that supports "in" can be used)
+
+        :param key: `NoKey` - the value itself is checked; other objects - the sub-value `value[key]` is checked
+
+        :rtype: list
+        :return: list of matching `iTree`-objects sorted by value
+        """
+        try:
+            sorted_index = self._sorted_indexes[key]
+        except (AttributeError, KeyError):
+            pass
+        else:
+            if sorted_index is None:
+                # outdated -> rebuild
+                self._sorted_indexes[key] = sorted_index = _iTreeSortedIndex(key,
+                                                                             _iTreePrivate._iter_subtrees(self._itree))
+            result = sorted_index.find(value_set)
+            if result is not None:
+                return result
+        get_index_value = _iTreeSortedIndex.get_index_value
+        result = []
+        for i in self:
+            value = get_index_value(i, key)
+            if value is not NoValue and value in value_set:
+                result.append((value, i))
+        result.sort(key=lambda r: r[0])
+        return [i for _, i in result]
+
+    def enable_tag_index(self):
+        """
+        Call via **iTree().deep.enable_tag_index()**
+
+        Create an index over the family-tags of all in-depth children (the tag of the object itself is
+        not part of the index). The index is used by `find_by_tag()`, `find_by_tag_fnmatch()` and `is_tag_in()`
+        and it is kept up to date by the changing methods (append, insert, delete, rename, move, ...).
+        After link loads the index is rebuild in the next query. Calling the method on an already indexed `iTree`
+        rebuilds the index.
+
+        .. note:: As long as a tag index is active the changing methods of all `iTree`-objects must
+                  check their parents for indexes. The index should be disabled when not needed anymore.
+        """
+        try:
+            self._tag_index
+        except AttributeError:
+            _iTreePrivate._deep_index_cnt += 1
+        self._tag_index = _iTreePrivate._build_deep_index(self._itree, _iTreePrivate._get_index_tag)
+
+    def disable_tag_index(self):
+        """
+        Call via **iTree().deep.disable_tag_index()**
+
+        Delete the tag index created by `enable_tag_index()`
+        """
+        try:
+            del self._tag_index
+        except AttributeError:
+            return
+        _iTreePrivate._deep_index_cnt -= 1
+
+    def _get_current_tag_index(self):
+        """
+        deliver the tag index (outdated indexes are rebuild)
+
+        :return: tag index or None if no index is active
+        """
+        try:
+            tag_index = self._tag_index
+        except AttributeError:
+            return None
+        if tag_index is None:
+            self._tag_index = tag_index = _iTreePrivate._build_deep_index(self._itree, _iTreePrivate._get_index_tag)
+        return tag_index
+
+    def find_by_tag(self, tag):
+        """
+        Call via **iTree().deep.find_by_tag()**
+
+        Find all in-depth children with the given family-tag (on all levels).
+
+        If a tag index is active (see `enable_tag_index()`) the result is taken from the index (O(k) for k
+        matching items), the order of the items in the result is not defined in this case.
+        Without an index all in-depth children are checked (O(n)) and the result is in the normal in-depth
+        iteration order.
+
+        :param tag: family tag
+
+        :rtype: list
+        :return: list of matching `iTree`-objects (empty list if no match is found)
+        """
+        tag_index = self._get_current_tag_index()
+        if tag_index is not None:
+            bucket = tag_index[0].get(tag)
+            return list(bucket.values()) if bucket else []
+        return [i for i in self if i._tag == tag]
+
+    def find_by_tag_fnmatch(self, tag_match_pattern):
+        """
+        Call via **iTree().deep.find_by_tag_fnmatch()**
+
+        Find all in-depth children with family-tags matching to the given fnmatch pattern
+        (same matching as in `itree_filters.has_item_tag_fnmatch`).
+
+        If a tag index is active (see `enable_tag_index()`) only the indexed tags are matched against the pattern
+        (instead of all items), the order of the items in the result is not defined in this case.
+
+        :type tag_match_pattern: Union[str,bytes]
+        :param tag_match_pattern: str or bytes related to fnmatch pattern definitions
+
+        :rtype: list
+        :return: list of matching `iTree`-objects (empty list if no match is found)
+        """
+        pattern_type = type(tag_match_pattern)
+        tag_index = self._get_current_tag_index()
+        if tag_index is not None:
+            return [i for tag, bucket in tag_index[0].items()
+                    if type(tag) is pattern_type and fnmatch(tag, tag_match_pattern)
+                    for i in bucket.values()]
+        return [i for i in self if type(i._tag) is pattern_type and fnmatch(i._tag, tag_match_pattern)]
+
     def index(self, item, start=None, stop=None):
         """
         Call via **iTree().deep.index()**
@@ -454,6 +761,8 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
         .. note:: The implementation of this method is recursive for deep trees recursion limit might be reached.
         """
         itree = self._itree
+        if itree._path_cache_cnt:
+            itree._invalidate_path_caches(itree)
         flags = itree._flags
         if flags & itree._IS_TREE_PROTECTED:
             if not itree.is_link_root or itree._link.is_loaded:
@@ -473,9 +782,9 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
         sort operation running also over the deeper levels of the tree
         -> same behavior as sort of lists (parameter description is taken from list documentation)
 
-        In this operation internally a copied sorted list is created, the structure is cleared and rebuild
-        based on the sorted list. The default-operation is to the sort based on the list of keys (tag-family.family_index)
-        pair of the items. This might be modified by changing the target_type.
+        In each level the children are reordered in place (see `iTree.sort()`). The default-operation is to the sort
+        based on the list of keys (tag-family.family_index) pair of the items. This might be modified by changing
+        the target_type.
 
         .. Warning:: In case of really deep `iTree`s (depth >100) the sorting might take a lot of time.
                      We made a test with an `iTree` containing ~2500 items and a depth of 9000. Result was:
@@ -494,6 +803,8 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
 
         """
         itree = self._itree
+        if itree._path_cache_cnt:
+            itree._invalidate_path_caches(itree)
         flags = itree._flags
         if flags & itree._IS_TREE_PROTECTED:
             if not itree.is_link_root or itree._link.is_loaded:
@@ -536,8 +847,16 @@ class _iTreeIndepthTree(_iTreeIndepthIter):
         if hasattr(del_items, '_itree_prt_idx'):
             # single result
             return del_items.parent.pop(del_items.idx)
+        # we group the items by parent so that each parent is rebuild only once
+        parents = {}
         for i in del_items:
-            i.parent.remove(i)
+            parent = i._itree_prt_idx[0]
+            try:
+                parents[id(parent)][1].append(i)
+            except KeyError:
+                parents[id(parent)] = (parent, [i])
+        for parent, items in parents.values():
+            parent.remove(items)
         return del_items
 
     def __iter__(self):
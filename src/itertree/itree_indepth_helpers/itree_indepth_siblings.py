@@ -148,22 +148,26 @@ class _iTreeIndepthSiblings():
         else:
             empty_items = (i for i in iterator if not i)
             self_level = itree.level
+            # walk up from the leaf instead of creating the ancestors list for each leaf
+            steps = range(-level - 1)
             yielded_items = set()
             if incl_self:
                 for item in empty_items:
-                    ancestors = item.ancestors + [item]
-                    l = len(ancestors)
+                    l = item.level + 1
                     if l >= self_level and l >= -level:
-                        yield_item = ancestors[level]
+                        yield_item = item
+                        for _ in steps:
+                            yield_item = yield_item._itree_prt_idx[0]
                         if id(yield_item) not in yielded_items:
                             yield yield_item
                             yielded_items.add(id(yield_item))
             else:
                 for item in empty_items:
-                    ancestors = item.ancestors + [item]
-                    l = len(ancestors)
+                    l = item.level + 1
                     if l >= self_level and l >= -level:
-                        yield_item = ancestors[level]
+                        yield_item = item
+                        for _ in steps:
+                            yield_item = yield_item._itree_prt_idx[0]
                         if id(yield_item) not in yielded_items and yield_item is not itree:
                             yield yield_item
                             yielded_items.add(id(yield_item))
@@ -196,19 +200,23 @@ class _iTreeIndepthSiblings():
         else:
             empty_items = (i for i in iterator if not i)
             self_level = itree.level
+            # walk up from the leaf instead of creating the ancestors list for each leaf
+            steps = range(-level - 1)
             if incl_self:
                 for item in empty_items:
-                    ancestors = item.ancestors + [item]
-                    l = len(ancestors)
+                    l = item.level + 1
                     if l >= self_level and l >= -level:
-                        yield_item = ancestors[level]
+                        yield_item = item
+                        for _ in steps:
+                            yield_item = yield_item._itree_prt_idx[0]
                         yield yield_item
             else:
                 for item in empty_items:
-                    ancestors = item.ancestors + [item]
-                    l = len(ancestors)
+                    l = item.level + 1
                     if l >= self_level and l >= -level:
-                        yield_item = ancestors[level]
+                        yield_item = item
+                        for _ in steps:
+                            yield_item = yield_item._itree_prt_idx[0]
                         if yield_item is not itree:
                             yield yield_item
 
@@ -239,22 +247,26 @@ class _iTreeIndepthSiblings():
         else:
             empty_items = (i for i in iterator if not i)
             self_level = itree.level
+            # walk up from the leaf instead of creating the ancestors list for each leaf
+            steps = range(-level - 1)
             yielded_items = set()
             if incl_self:
                 for item in empty_items:
-                    ancestors = item.ancestors + [item]
-                    l = len(ancestors)
+                    l = item.level + 1
                     if l >= self_level and l >= -level:
-                        yield_item = ancestors[level]
+                        yield_item = item
+                        for _ in steps:
+                            yield_item = yield_item._itree_prt_idx[0]
                         if id(yield_item) not in yielded_items:
                             yield yield_item
                             yielded_items.add(id(yield_item))
             else:
                 for item in empty_items:
-                    ancestors = item.ancestors + [item]
-                    l = len(ancestors)
+                    l = item.level + 1
                     if l >= self_level and l >= -level:
-                        yield_item = ancestors[level]
+                        yield_item = item
+                        for _ in steps:
+                            yield_item = yield_item._itree_prt_idx[0]
                         if id(yield_item) not in yielded_items and yield_item is not itree:
                             yield yield_item
                             yielded_items.add(id(yield_item))
@@ -286,18 +298,22 @@ class _iTreeIndepthSiblings():
         else:
             empty_items = (i for i in iterator if not i)
             self_level = itree.level
+            # walk up from the leaf instead of creating the ancestors list for each leaf
+            steps = range(-level - 1)
             if incl_self:
                 for item in empty_items:
-                    ancestors = item.ancestors + [item]
-                    l = len(ancestors)
+                    l = item.level + 1
                     if l >= self_level and l >= -level:
-                        yield_item = ancestors[level]
+                        yield_item = item
+                        for _ in steps:
+                            yield_item = yield_item._itree_prt_idx[0]
                         yield yield_item
             else:
                 for item in empty_items:
-                    ancestors = item.ancestors + [item]
-                    l = len(ancestors)
+                    l = item.level + 1
                     if l >= self_level and l >= -level:
-                        yield_item = ancestors[level]
+                        yield_item = item
+                        for _ in steps:
+                            yield_item = yield_item._itree_prt_idx[0]
                         if yield_item is not itree:
                             yield yield_item
@@ -21,11 +21,13 @@ This part of code contains the main iTree object
 
 from __future__ import absolute_import
 import copy
+import gc
 import pickle
 import traceback
-from itertools import chain, dropwhile, zip_longest, takewhile, repeat, tee, product
+from itertools import chain, dropwhile, zip_longest, takewhile, repeat, tee, product, islice
 from contextlib import suppress
 from collections import OrderedDict, deque
+from operator import attrgetter
 from itertools import dropwhile
 # import fnmatch
 # import functools
@@ -49,22 +51,25 @@ from .itree_serializer.itree_renderer import iTreeRender
 from .itree_serializer.itree_json_serialize import iTStdJSONSerializer2
 from .itree_indepth import _iTreeIndepthTree
 from .itree_getitem import _iTreeGetitem
+from .itree_persistent import _iTreePersistent
+from .itree_path import iTCompiledPath
 from .itree_private import _iTreePrivate
 
+# path part getters used for the cached paths (see `iTree.enable_position_cache()`)
+_GET_IDX = attrgetter('idx')
+_GET_TAG_IDX = attrgetter('tag_idx')
+
 class iTree(_iTreePrivate):
     __slots__ = (  # Attributes
         '_tag', '_value', '_link', '_flags', '_coupled',
         # private helper classes
         '_itree_prt_idx', '_families', '_items',
-        # serializing objects
-        '__renderer', '__itree_serializer',
-        # quick access methods
-        '__len__', '__iter__', 'getitem_by_idx', '_is_list',
         # quick access methods
-        '_setitem_list',
+        '__len__', '__iter__', 'getitem_by_idx',
+        # quick access methods (set in the moment the first child is added)
         '_getitem_fam', '_setitem_fam',"_get_fam",
-        # helpers
-        '_hc_tree', 'get'
+        # helpers (instanced on first usage)
+        '_hc_tree', '_hc_get'
     )
 
     # we define some static private variables:
@@ -81,6 +86,7 @@ class iTree(_iTreePrivate):
     _LINK_ROOT = _iTFLAG.LINK_ROOT
     _PLACEHOLDER = _iTFLAG.PLACEHOLDER
     _FLAG_MASK = _iTFLAG.FLAG_MASK
+    _SHARED = _iTFLAG.SHARED
     _IS_TREE_PROTECTED = _READ_ONLY_TREE | _PLACEHOLDER | _LINKED | _LINK_ROOT
     _IS_VALUE_PROTECTED = _READ_ONLY_VALUE | _PLACEHOLDER | _LINKED
     _DEEP_FLAG_MASK = _LOAD_LINKS | _READ_ONLY_TREE
@@ -260,9 +266,9 @@ class iTree(_iTreePrivate):
         #   b. o._itree_prt_idx[1] -> cached absolute index in iTree parent-object (might be outdated!)
         #   c. o._itree_prt_idx[3] -> cached family index in iTree parent-object (might be outdated!)
         self._itree_prt_idx = None
-        self.get = getitem = _iTreeGetitem(self)
 
         # internals like self._families are created only in case elements added to the object
+        # helper objects like self.get or self.deep are created only in case they are used
 
         # load the subtree
         if subtree:
@@ -271,11 +277,17 @@ class iTree(_iTreePrivate):
                 sl = list(self._iter_extend(self, subtree, flags & self._DEEP_FLAG_MASK, init=True))
             else:
                 sl = list(self._iter_extend(self, subtree, init=True))
+        else:
+            sl = None
+        if sl:
             self._items = sl = itree_list(sl)
+            self.getitem_by_idx = sl.__getitem__
+            self.__len__, self.__iter__ = sl.__len__, sl.__iter__
         else:
-            self._items = sl = []
-        self.getitem_by_idx = getitem.getitem_by_idx = sl.__getitem__
-        self.__len__, self.__iter__ = sl.__len__, sl.__iter__
+            # empty items (leafs) share the same (immutable) empty children container and quick access methods
+            self._items = self._EMPTY_ITEMS
+            self.getitem_by_idx, self.__len__, self.__iter__ = \
+                self._EMPTY_GETITEM, self._EMPTY_LEN, self._EMPTY_ITER
 
         # links
         if link:
@@ -291,6 +303,101 @@ class iTree(_iTreePrivate):
             if flags & self._LOAD_LINKS:
                 self.load_links()
 
+    @classmethod
+    def from_columns(cls, tags, values=None, tag=NoTag, value=NoValue, flags=0):
+        """
+        Create a flat `iTree` (one level of children) from columnar data (e.g. columns of a table, numpy arrays,
+        pyarrow arrays or simple lists).
+
+        The children, the children list and the families are build in one pass. Compared with
+        `iTree(subtree=[iTree(tag,value),...])` or `extend()` the per element overhead (type checks, argument
+        handling in `__init__()`) is avoided which is much quicker for a large number of children.
+
+        .. note:: For arrays the column objects are converted via `tolist()` (numpy) or `to_pylist()` (pyarrow)
+                  first; so that the children contain normal Python objects as tags and values.
+
+        :except: ValueError in case the columns have different lengths; TypeError in case a tag is not hashable
+
+        :type tags: Iterable
+        :param tags: column of the family tags of the children
+
+        :type values: Optional[Iterable]
+        :param values: column of the values of the children (if None is given the children contain no value)
+
+        :type tag: Hashable
+        :param tag: family tag of the created parent `iTree`-object
+
+        :type value: object
+        :param value: value of the created parent `iTree`-object
+
+        :type flags: int
+        :param flags: flags of the created parent `iTree`-object (the deep flags are set in the children too)
+
+        :rtype: iTree
+        :return: new `iTree`-object containing the children
+        """
+        tags = cls._column_to_list(tags)
+        if values is None:
+            values = repeat(NoValue, len(tags))
+        else:
+            values = cls._column_to_list(values)
+            if len(values) != len(tags):
+                raise ValueError('The given columns have different lengths (%i tags, %i values)' %
+                                 (len(tags), len(values)))
+        parent = cls(tag, value, flags=flags)
+        if not tags:
+            return parent
+        child_flags = flags & cls._DEEP_FLAG_MASK
+        sl = []
+        append = sl.append
+        families = {}
+        get_family = families.get
+        idx = 0
+        # the garbage collector is paused during the build because it would be triggered very often by the
+        # large number of new container objects (without finding any garbage)
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if cls.__init__ is iTree.__init__ and not child_flags & cls._LOAD_LINKS:
+                # quick instance of the children (leafs) without calling __init__()
+                new = object.__new__
+                empty_items, empty_getitem = cls._EMPTY_ITEMS, cls._EMPTY_GETITEM
+                empty_len, empty_iter = cls._EMPTY_LEN, cls._EMPTY_ITER
+                for t, v in zip(tags, values):
+                    family = get_family(t)
+                    if family is None:
+                        families[t] = family = []
+                    item = new(cls)
+                    item._tag = t
+                    item._value = v
+                    item._flags = child_flags
+                    item._items = empty_items
+                    item.getitem_by_idx, item.__len__, item.__iter__ = empty_getitem, empty_len, empty_iter
+                    item._itree_prt_idx = [parent, idx, family.__len__()]
+                    family.append(item)
+                    append(item)
+                    idx = idx + 1
+            else:
+                for t, v in zip(tags, values):
+                    family = get_family(t)
+                    if family is None:
+                        families[t] = family = []
+                    item = cls(t, v, flags=child_flags)
+                    item._itree_prt_idx = [parent, idx, family.__len__()]
+                    family.append(item)
+                    append(item)
+                    idx = idx + 1
+            if BLIST_SWITCH != -1:
+                for t, family in families.items():
+                    if len(family) > BLIST_SWITCH:
+                        families[t] = itree_list(family)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        cls._set_items(parent, itree_list(sl))
+        cls._set_families(parent, families)
+        return parent
+
     # *** parent related properties and methods ************************************************************************
 
     @property
@@ -379,7 +486,11 @@ class iTree(_iTreePrivate):
 
         .. note::
             In general the item index is cached but in case of deleted items or reorder operations
-            the cache might be outdated. In this case the index update based on a search might take longer.
+            the cache might be outdated. Small shifts are found by a search in the near area of the cached index.
+            For larger shifts the index caches of all siblings are updated in one pass (O(n) for n siblings), so
+            that the following requests on the siblings will match the cache again. This pays off in case many
+            indexes are requested after a batch of structural changes. In case structural changes and index
+            requests alternate each request after a change can cost O(n).
 
         :rtype: Union[int, None]
         :return: unsigned integer representing the index (related to absolute order of iTree)
@@ -387,7 +498,7 @@ class iTree(_iTreePrivate):
         # Implementation state: ready, tested, doc ok
         parent_list = self._itree_prt_idx
         if parent_list:
-            parent, abs_idx, _ = parent_list
+            parent, abs_idx = parent_list[0], parent_list[1]
             siblings = parent._items
             # create locals for multi use functions
             size = len(siblings)
@@ -403,23 +514,12 @@ class iTree(_iTreePrivate):
                 if siblings[i] is self:
                     parent_list[1] = i
                     return i
-            if abs_idx < size / 2:
-                # start -> end
-                i = 0
-                for item in siblings:
-                    item._itree_prt_idx.__setitem__(1, i) # update items idx cache
-                    if item is self:
-                        return i
-                    i = i + 1
-                raise IndexError('Internal error for this iTree we found no related index in the parent-object!')
-            else:
-                # end -> start
-                for i in range((size - 1), -1, -1):
-                    item = siblings[i]
-                    item._itree_prt_idx.__setitem__(1, i) #update item idx cache
-                    if item is self:
-                        return i
-                raise IndexError('Internal error for this iTree we found no related index in the parent-object!')
+            # the siblings are shifted too -> update all siblings
+            self._update_idx_cache(siblings)
+            abs_idx = parent_list[1]
+            if abs_idx < size and siblings[abs_idx] is self:
+                return abs_idx
+            raise IndexError('Internal error for this iTree we found no related index in the parent-object!')
 
     @property
     def idx_path(self):
@@ -432,19 +532,27 @@ class iTree(_iTreePrivate):
                 We deliver here a tuple because it might be helpful if the object is hashable
                 (usage as a dict key)
 
+        .. note::
+                In case the position cache is active (see `iTree.enable_position_cache()`) the path is cached and
+                the same tuple object is delivered until the next structural change in the tree.
+
         :rtype: tuple
         :return: tuple of index integers (here we do not deliver an iterator!)
 
         """
         # Implementation state: ready, tested, doc ok
-        p = self
-        idx_list = deque()
-        while 1:
-            root, p = p, p.parent
-            if p is None:
-                break
-            else:
-                idx_list.appendleft(root.idx)
+        item = self
+        parent_list = item._itree_prt_idx
+        if parent_list is None:
+            return ()
+        if self._position_cache_active:
+            return self._get_cached_path(self, 5, _GET_IDX)
+        idx_list = []
+        while parent_list:
+            idx_list.append(item.idx)
+            item = parent_list[0]
+            parent_list = item._itree_prt_idx
+        idx_list.reverse()
         return tuple(idx_list)
 
     @property
@@ -455,6 +563,10 @@ class iTree(_iTreePrivate):
 
         If  the item is not part of a parent-tree (root-item) in this case the result will be `None`.
 
+        .. note::
+            The family index is cached like the absolute index (see `idx`), in case of larger shifts the caches of
+            all family members are updated in one pass (O(n) for n family members).
+
         :rtype: Union[tuple, None]
         :return: tuple (family-tag, family-index) or None (if item has no parent)
         """
@@ -480,24 +592,12 @@ class iTree(_iTreePrivate):
                     parent_list[2] = i
                     return tag, i
 
-            # update the whole list
-            if family_idx < size / 2:
-                # start -> end
-                i = 0
-                for item in family:
-                    item._itree_prt_idx.__setitem__(2, i)
-                    if item is self:
-                        return i
-                    i = i + 1
-                raise IndexError('Internal error for this iTree we found no related index in the parent-object!')
-            else:
-                # end -> start
-                for i in range((size - 1), -1, -1):
-                    item = family[i]
-                    item._itree_prt_idx.__setitem__(2, i)
-                    if item is self:
-                        return i
-                raise IndexError('Internal error for this iTree we found no related index in the parent-object!')
+            # the family members are shifted too -> update the whole family
+            self._update_fam_idx_cache(family)
+            family_idx = parent_list[2]
+            if family_idx < size and fm_getitem(family_idx) is self:
+                return tag, family_idx
+            raise IndexError('Internal error for this iTree we found no related index in the parent-object!')
 
     @property
     def tag_idx_path(self):
@@ -511,20 +611,27 @@ class iTree(_iTreePrivate):
                     We deliver here a tuple because it might be helpful if the object is hashable
                     (usage as a dict key)
 
+        .. note::
+                In case the position cache is active (see `iTree.enable_position_cache()`) the path is cached and
+                the same tuple object is delivered until the next structural change in the tree.
+
         :rtype: tuple
         :return: tuple of key tuples containing family-tag and family-index
 
         """
         # Implementation state: ready, tested, doc ok
-
-        p = self
-        key_list = deque()
-        while 1:
-            root, p = p, p.parent
-            if p is None:
-                break
-            else:
-                key_list.appendleft(root.tag_idx)
+        item = self
+        parent_list = item._itree_prt_idx
+        if parent_list is None:
+            return ()
+        if self._position_cache_active:
+            return self._get_cached_path(self, 6, _GET_TAG_IDX)
+        key_list = []
+        while parent_list:
+            key_list.append(item.tag_idx)
+            item = parent_list[0]
+            parent_list = item._itree_prt_idx
+        key_list.reverse()
         return tuple(key_list)
 
     def force_cache_update(self, idx=True, fam_keys=True, all_keys=True):
@@ -544,13 +651,12 @@ class iTree(_iTreePrivate):
         if parent_list:
             parent = parent_list[0]
             if idx:
-                list(item._itree_prt_idx.__setitem__(1, i) for i, item in enumerate(parent))
+                self._update_idx_cache(parent._items)
             if fam_keys and not all_keys:
-                family = self._getitem_fam(self._tag)
-                list(item._itree_prt_idx.__setitem__(2, i) for i, item in enumerate(family))
+                self._update_fam_idx_cache(parent._getitem_fam(self._tag))
             elif all_keys:
                 for family in parent._families.values():
-                    list(item._itree_prt_idx.__setitem__(2, i) for i, item in enumerate(family))
+                    self._update_fam_idx_cache(family)
 
     @property
     def pre_item(self):
@@ -606,12 +712,19 @@ class iTree(_iTreePrivate):
         deep in tree the item is positioned.
         In case item has no parent (is a root-item) this method will deliver 0.
 
+        .. note::
+                In case the position cache is active (see `iTree.enable_position_cache()`) the level is cached.
+
         :rtype: int
         :return: integer - number of levels (outer direction)
         """
         # Implementation state: ready, tested, doc ok
-        i = 0
         pt = self._itree_prt_idx
+        if pt is None:
+            return 0
+        if self._position_cache_active:
+            return self._get_position_cache(self)[4]
+        i = 0
         while (pt):
             p = pt[0]
             i = i + 1
@@ -627,6 +740,9 @@ class iTree(_iTreePrivate):
         If the user wants to now the maximum depth of the whole tree ensure that the property of the root-item is read.
         The user might use `my_tree.root.max_depth` to ensure this.
 
+        In case the subtree aggregates are active (see `deep.enable_aggregates()`) the value is read from the
+        aggregates and no iteration over the subtree is required.
+
         :rtype: int
 
         :return: integer maximal number of levels that exists in the tree (inner direction)
@@ -634,6 +750,11 @@ class iTree(_iTreePrivate):
         # Implementation state: ready, tested, doc ok
         if not self:
             return 0
+        if self._deep_index_cnt:
+            aggregate = self._get_aggregate(self)
+            if aggregate is not None:
+                # aggregates active (see `deep.enable_aggregates()`)
+                return aggregate[1]
         max_depth = 0
         items = [self]
         while 1:
@@ -755,10 +876,84 @@ class iTree(_iTreePrivate):
             return self._hc_tree
         except AttributeError:
             # The subclass is only instanced if it is first used
-            tree, tree._itree, tree.get = _iTreeIndepthTree(), self, self.get
+            tree, tree._itree = _iTreeIndepthTree(), self
             self._hc_tree = tree
             return tree
 
+    @property
+    def get(self):
+        """
+        Subclass containing the specific getter methods of iTree (`get()`, `get.by_idx()`, `get.by_tag_idx()`, ...)
+        :return:
+        """
+        try:
+            return self._hc_get
+        except AttributeError:
+            # The subclass is only instanced if it is first used
+            self._hc_get = getitem = _iTreeGetitem(self)
+            return getitem
+
+    @staticmethod
+    def compile_path(*targets):
+        """
+        Create a reusable accessor for the given target path. The targets are analyzed only once and the
+        accessor resolves the path without the type checks and fallbacks done in each `get()` call.
+
+        ::
+
+            >>> path = iTree.compile_path(('sub', 0), 2)
+            >>> path.get(tree)  # same as tree.get(('sub', 0), 2)
+            >>> path.exists(tree)
+            True
+
+        .. note:: Ambiguous targets are interpreted by the type (e.g. an integer is always an index),
+                  family-tags which look like index or key must be marked by `Tag(tag)`.
+
+        :param targets: target path (targets like in `get()`, each target is related to the next level)
+
+        :rtype: iTCompiledPath
+        :return: accessor object with the methods `get(itree)`, `iter(itree)` and `exists(itree)`
+        """
+        return iTCompiledPath(*targets)
+
+    @staticmethod
+    def enable_position_cache():
+        """
+        Activate the position cache for all `iTree`-objects. The properties `level`, `idx_path` and `tag_idx_path`
+        are cached in the items (the parent positions are reused), repeated accesses are answered without walking
+        up to the root. The paths are delivered as interned tuples (the same tuple object is delivered until the
+        next structural change).
+
+        The cached positions are outdated by all structural changes (append, insert, delete, move, rename, sort,
+        ...) and renewed in the next access. Value changes do not affect the cache.
+
+        .. note:: As long as the position cache is active the structural changing methods of all `iTree`-objects
+                  must outdate the cache. The cache should be disabled when not needed anymore.
+        """
+        if not _iTreePrivate._position_cache_active:
+            _iTreePrivate._position_cache_active = True
+            _iTreePrivate._position_epoch += 1
+            _iTreePrivate._path_cache_cnt += 1
+
+    @staticmethod
+    def disable_position_cache():
+        """
+        Deactivate the position cache (see `enable_position_cache()`).
+        """
+        if _iTreePrivate._position_cache_active:
+            _iTreePrivate._position_cache_active = False
+            _iTreePrivate._path_cache_cnt -= 1
+
+    @property
+    def persistent(self):
+        """
+        Subclass containing the persistent update methods of iTree (`persistent.append()`,
+        `persistent.set_value()`, ...). The methods work on tree read-only `iTree`-objects and deliver a new version
+        which shares the untouched subtrees with the original one.
+        :return:
+        """
+        return _iTreePersistent(self)
+
     # flags
 
     @property
@@ -836,7 +1031,8 @@ class iTree(_iTreePrivate):
         set_flags = _iTreePrivate._set_flags
         read_only_tree_flag = self._READ_ONLY_TREE
         set_flags(self, read_only_tree_flag)
-        for i in self.deep:
+        # not yet created children of copy-on-write copies will take over the protection when they are created
+        for i in self._iter_created(self):
             set_flags(i, read_only_tree_flag)
 
     def unset_tree_read_only(self):
@@ -845,11 +1041,15 @@ class iTree(_iTreePrivate):
         writable by this operation.
 
         :except: If the parent contains the tree protection flag a PermissionError will be raised
+                 (same if the item is the source of copy-on-write copies)
         """
         # Implementation state: ready, tested, doc ok
         if self._itree_prt_idx is not None and self._itree_prt_idx[0]._flags & self._READ_ONLY_TREE:
             raise PermissionError('The structural protection flag can only be unset in '
                                   'case the parent is not protected. But here the parent holds the protection flag')
+        if self._flags & self._SHARED:
+            raise PermissionError('The structural protection flag can not be unset, '
+                                  'the item is the source of copy-on-write copies')
 
         self._unset_flags(self, self._READ_ONLY_TREE)
 
@@ -921,6 +1121,8 @@ class iTree(_iTreePrivate):
         # Implementation state: ready, tested, doc ok
         if self._flags & self._IS_VALUE_PROTECTED:
             raise PermissionError('%s value is read only'%self.__class__.__name__)
+        if self._flags & self._READ_ONLY_TREE and self._is_shared(self):
+            raise PermissionError('%s value is read only (shared with copy-on-write copies)' % self.__class__.__name__)
         old_value = self._value
         # do we have a model?
         if (
@@ -932,6 +1134,8 @@ class iTree(_iTreePrivate):
             self._value = value
         else:
             old_value = old_value.set(value)
+        if self._deep_index_cnt:
+            self._reindex_value(self)
         return old_value
 
     def set_key_value(self, key, value):
@@ -977,27 +1181,32 @@ class iTree(_iTreePrivate):
         # Implementation state: ready, tested, doc ok
         if self._flags & self._IS_VALUE_PROTECTED:
             raise PermissionError('%s value is read only'%self.__class__.__name__)
+        if self._flags & self._READ_ONLY_TREE and self._is_shared(self):
+            raise PermissionError('%s value is read only (shared with copy-on-write copies)' % self.__class__.__name__)
         old_value = self._value
         try:
             old_value = old_value[key]
         except KeyError:
             old_value[key] = value
-            return NoValue
+            old_value = NoValue
         except TypeError:
-            if key == INF:
-                old_value.append(value)
-                return NoValue
-            raise
-        # do we have a model?
-        if (
-                hasattr(old_value, 'is_iTValueModel')
-                and hasattr(value, 'is_iTValueModel')
-                or not hasattr(old_value, 'is_iTValueModel')
-        ):
-            # new model given!
-            self._value[key] = value
+            if key != INF:
+                raise
+            self._value.append(value)
+            old_value = NoValue
         else:
-            old_value = old_value.set(value)
+            # do we have a model?
+            if (
+                    hasattr(old_value, 'is_iTValueModel')
+                    and hasattr(value, 'is_iTValueModel')
+                    or not hasattr(old_value, 'is_iTValueModel')
+            ):
+                # new model given!
+                self._value[key] = value
+            else:
+                old_value = old_value.set(value)
+        if self._deep_index_cnt:
+            self._reindex_value(self)
         return old_value
 
     def get_value(self):
@@ -1060,7 +1269,11 @@ class iTree(_iTreePrivate):
         # Implementation state: ready, tested, doc ok
         if self._flags & self._READ_ONLY_VALUE:
             raise PermissionError('%s value is read only'%self.__class__.__name__)
+        if self._flags & self._READ_ONLY_TREE and self._is_shared(self):
+            raise PermissionError('%s value is read only (shared with copy-on-write copies)' % self.__class__.__name__)
         old_value, self._value = self._value, NoValue
+        if self._deep_index_cnt:
+            self._reindex_value(self)
         return old_value
 
     def del_key_value(self, key):
@@ -1087,7 +1300,12 @@ class iTree(_iTreePrivate):
         # Implementation state: ready, tested, doc ok
         if self._flags & self._READ_ONLY_VALUE:
             raise PermissionError('%s value is read only'%self.__class__.__name__)
-        return self._value.pop(key)
+        if self._flags & self._READ_ONLY_TREE and self._is_shared(self):
+            raise PermissionError('%s value is read only (shared with copy-on-write copies)' % self.__class__.__name__)
+        old_value = self._value.pop(key)
+        if self._deep_index_cnt:
+            self._reindex_value(self)
+        return old_value
 
     @property
     def coupled_object(self):
@@ -1154,6 +1372,8 @@ class iTree(_iTreePrivate):
         :return: Delivers the appended item itself
                  (it might be useful for the user to get the updated information of the object).
         """
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         if self._flags & self._IS_TREE_PROTECTED:
             if self.is_link_root:
                 if hasattr(item, '_itree_prt_idx') and item.flags & (
@@ -1169,6 +1389,8 @@ class iTree(_iTreePrivate):
             # implicit definition of iTree:
             item = self.__class__(value=item)
             tag = NoTag
+        if self._deep_index_cnt:
+            self._add_to_deep_indexes(self, (item,))
         # return self._append_item(self,item)
         # Just for performance we keep the code for append here and do not use the helper
         abs_idx = len(self)  # after tests here the len() is quicker (not understood why)
@@ -1187,16 +1409,12 @@ class iTree(_iTreePrivate):
                 item._itree_prt_idx = [self, abs_idx, fm_idx]
         else:
             # here we must init all family and item related attributes
-            getitem = self.get
             # items
-            self._items = sl = self._ONE_ITEM_LIST.copy()
+            sl = self._ONE_ITEM_LIST.copy()
             sl[0] = item
-            self.getitem_by_idx = getitem.getitem_by_idx = sl.__getitem__
-            self.__len__, self.__iter__, self._setitem_list = sl.__len__, sl.__iter__, sl.__setitem__
+            self._set_items(self, sl)
             # family
-            self._families = families = {tag: sl.copy()}
-            getitem._getitem_fam=self._getitem_fam=families.__getitem__
-            self._get_fam, self._setitem_fam = families.get, families.__setitem__
+            self._set_families(self, {tag: sl.copy()})
             item._itree_prt_idx = [self, 0, 0]
         return item
 
@@ -1246,6 +1464,8 @@ class iTree(_iTreePrivate):
                  (it might be useful for the user to get the updated information of the object).
         """
         # Implementation state: ready, tested, doc ok
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         flags = self._flags
         if flags & self._IS_TREE_PROTECTED:
             if self.is_link_root:
@@ -1266,6 +1486,8 @@ class iTree(_iTreePrivate):
         except AttributeError:
             # implicit definition of iTree:
             item = self.__class__(value=item)
+        if self._deep_index_cnt:
+            self._add_to_deep_indexes(self, (item,))
         if self:
             return self._append_item_left(self, item)
         else:
@@ -1306,6 +1528,8 @@ class iTree(_iTreePrivate):
         # Implementation state: ready, tested, doc ok
         if target is None:
             return self.append(item)
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         flags = self._flags
         if flags & self._IS_TREE_PROTECTED:
             if self.is_link_root:
@@ -1340,6 +1564,8 @@ class iTree(_iTreePrivate):
                 abs_idx = target.idx
             else:
                 abs_idx = self.__getitem__(target).idx
+            if self._deep_index_cnt:
+                self._add_to_deep_indexes(self, (item,))
             if abs_idx == 0:
                 return self._append_item_left(self, item)
             # insert in list
@@ -1359,6 +1585,8 @@ class iTree(_iTreePrivate):
             return item
         else:
             # first item insert is append
+            if self._deep_index_cnt:
+                self._add_to_deep_indexes(self, (item,))
             return self._append_item(self, item)
 
     # multiple appends
@@ -1387,6 +1615,8 @@ class iTree(_iTreePrivate):
                      * iterable of value-objects (list, tuple, ...)- implicit `iTree`-objects created
 
         """
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         if self._flags & self._IS_TREE_PROTECTED:
             if self.is_link_root:
                 # extend is allowed on link_root items
@@ -1403,7 +1633,15 @@ class iTree(_iTreePrivate):
                             'It is not allowed to append linked items in an already linked item')
             else:
                 self._raise_read_only_exception(self)
-        return self._items.extend(_iTreePrivate._iter_extend(self, items))
+        size = len(self)
+        if size:
+            self._items.extend(_iTreePrivate._iter_extend(self, items))
+        else:
+            sl = list(_iTreePrivate._iter_extend(self, items))
+            if sl:
+                self._set_items(self, itree_list(sl))
+        if self._deep_index_cnt:
+            self._add_to_deep_indexes(self, islice(self._items, size, None))
 
     def extendleft(self, items):
         """
@@ -1432,6 +1670,8 @@ class iTree(_iTreePrivate):
                      * iterator or generator of value-objects (using next) - implicit `iTree`-objects created
                      * iterable of value-objects (list, tuple, ...)- implicit `iTree`-objects created
         """
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         if self._flags & self._IS_TREE_PROTECTED:
             if self.is_link_root:
                 # extend is allowed on link_root items
@@ -1459,10 +1699,13 @@ class iTree(_iTreePrivate):
             # delete parent so that no copy is required for later re-extend
             i._itree_prt_idx = None
         # clean the internal structure
-        self._families = {}
-        self._items.clear()
-        # extend new and old itmes
-        return self._items.extend(_iTreePrivate._iter_extend(self, chain(items, old_items)))
+        self._set_items_empty(self)
+        # extend new and old items
+        sl = list(_iTreePrivate._iter_extend(self, chain(items, old_items)))
+        if sl:
+            self._set_items(self, itree_list(sl))
+        if self._deep_index_cnt:
+            self._add_to_deep_indexes(self, sl[:len(sl) - len(old_items)])
 
     # item manipulations
 
@@ -1513,6 +1756,11 @@ class iTree(_iTreePrivate):
 
         :return: value added items (only for internal usage)
         """
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
+        if self._deep_index_cnt:
+            # replacements are not tracked item by item
+            self._outdate_deep_indexes(self)
         flags = self._flags
         if flags & self._IS_TREE_PROTECTED:
             if self.is_link_root:
@@ -1575,7 +1823,7 @@ class iTree(_iTreePrivate):
                     sl.__delitem__(i.idx)
                 sl.__setitem__(old_item_idx, value)
                 self._families[tag] = [value]
-                value._itree_prt_idx = (self, old_item_idx, 0)
+                value._itree_prt_idx = [self, old_item_idx, 0]
                 return value
         # normal setitem replaces old item
         # handle old item
@@ -1631,10 +1879,16 @@ class iTree(_iTreePrivate):
                        * None - if `None` is given we will move the item to the last position in the ´iTree´-object
 
         :return: self (with updated indexes)
+
+        .. note:: The item is moved directly in the children list and in the family list (no delete and insert).
+                  Only the siblings in between the old and the new position are shifted. To reorder
+                  multiple items in one operation use `iTree.move_many()` on the parent.
         """
         if self._itree_prt_idx is None:
             raise LookupError('This item is not a children of a %s'%self.__class__.__name__)
         parent = self._itree_prt_idx[0]
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         flags = parent._flags
         if flags & self._IS_TREE_PROTECTED:
             if parent.is_link_root:
@@ -1642,20 +1896,95 @@ class iTree(_iTreePrivate):
                     self._raise_read_only_exception(self)
             else:
                 self._raise_read_only_exception(self)
+        # the target index is related to the children without the moved item (like delete and insert)
+        last_idx = len(parent) - 1
         if target is None:
-            move_item = parent.__delitem__(self.idx)
-            return parent.append(move_item)
-        # check if target exists:
-        if type(target) is not int:
+            target_idx = last_idx
+        elif hasattr(target, '_itree_prt_idx'):
+            if target._itree_prt_idx is None or target._itree_prt_idx[0] is not parent:
+                raise LookupError('Given target item is not a sibling of this item')
+            target_idx = target.idx
+        elif type(target) is not int:
+            # check if target exists:
             try:
                 target_idx = parent.__getitem__(target).idx
             except AttributeError as e:
                 raise LookupError('Given target is not unique') from e
+        elif target < 0:
+            target_idx = max(0, last_idx + target)
         else:
-            target_idx = target
-        src_idx = self.idx
-        move_item = parent.__delitem__(src_idx)
-        return parent.insert(target_idx, move_item)
+            target_idx = min(target, last_idx)
+        return self._move_item(parent, self, self.idx, target_idx)
+
+    def move_many(self, moves):
+        """
+        Move multiple children to new positions in one operation. The children list and the families are
+        reordered only once (one pass over the children).
+
+        The given target indexes are the absolute indexes the children will have after the operation. The children
+        which are not moved keep their relative order and fill the remaining positions.
+
+        :except: In case a target is not found, the new positions are not unique or out of range or the `iTree`
+                 is protected (read-only tree). If an exception is raised the tree is not changed.
+
+        :type moves: Union[Iterable,dict]
+        :param moves: iterable of (target, new_index) pairs or a dict {target: new_index}; possible targets are:
+
+                      * *index* - absolute target index integer
+                      * *key* - key tuple (family_tag, family_index)
+                      * *item* - `iTree`-child of this object (not usable as dict key because `iTree`-objects
+                        with same content have the same hash)
+
+        :rtype: list
+        :return: list of the moved items
+        """
+        is_link_root = False
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
+        if self._flags & self._IS_TREE_PROTECTED:
+            if not self.is_link_root:
+                self._raise_read_only_exception(self)
+            elif self.is_link_loaded:
+                is_link_root = True
+        if hasattr(moves, 'items'):
+            moves = moves.items()
+        items = self._items
+        size = len(items)
+        new_order = [None] * size
+        moved = set()
+        moved_items = []
+        for target, new_idx in moves:
+            if hasattr(target, '_itree_prt_idx'):
+                item = target
+                if item._itree_prt_idx is None or item._itree_prt_idx[0] is not self:
+                    raise ValueError('Given item object is not a child of this %s-object' % self.__class__.__name__)
+            else:
+                item = self.__getitem__(target)
+                if not hasattr(item, '_itree_prt_idx'):
+                    raise LookupError('Given target is not unique')
+            if is_link_root and (item._flags & (self._LINKED | self._PLACEHOLDER) or
+                                 item._tag in self._link._tags):
+                self._raise_read_only_exception(item)
+            if type(new_idx) is not int:
+                raise TypeError('The new position must be given as an absolute index (integer)')
+            if new_idx < 0:
+                new_idx = size + new_idx
+            if not 0 <= new_idx < size:
+                raise IndexError('The new position %s is out of range' % new_idx)
+            if id(item) in moved or new_order[new_idx] is not None:
+                raise ValueError('The moved items and the new positions must be unique')
+            new_order[new_idx] = item
+            moved.add(id(item))
+            moved_items.append(item)
+        if not moved_items:
+            return moved_items
+        # the other items fill the free positions
+        others = (item for item in items if id(item) not in moved)
+        for idx, item in enumerate(new_order):
+            if item is None:
+                new_order[idx] = next(others)
+        self._reorder_items(self, new_order)
+        return moved_items
 
     def rename(self, new_tag):
         """
@@ -1676,6 +2005,8 @@ class iTree(_iTreePrivate):
 
         if parent_list is not None:
             parent = parent_list[0]
+            if self._path_cache_cnt:
+                self._invalidate_path_caches(self)
             flags = parent._flags
             if flags & self._IS_TREE_PROTECTED:
                 if parent.is_link_root:
@@ -1689,7 +2020,7 @@ class iTree(_iTreePrivate):
                     self._raise_read_only_exception(self)
         else:
             self._tag = new_tag
-            return
+            return self
         families = parent._families
         tag = self._tag
         # remove old tag in the map-dict
@@ -1697,7 +2028,12 @@ class iTree(_iTreePrivate):
         if len(family) == 1:
             families.__delitem__(tag)
         else:
-            family.remove(self)
+            # we take the cached family index, if outdated we search via bisect over the absolute indexes
+            # (the family members are ordered by absolute index)
+            fm_idx = parent_list[2]
+            if fm_idx >= len(family) or family[fm_idx] is not self:
+                fm_idx = self._get_family_insertion_idx(family, self.idx)
+            family.__delitem__(fm_idx)
         # insert new tag
         self._tag = new_tag
         if new_tag in families:
@@ -1709,8 +2045,66 @@ class iTree(_iTreePrivate):
             # create new family
             families.__setitem__(new_tag, [self])
             self._itree_prt_idx[2] = 0
+        if self._deep_index_cnt:
+            self._reindex_tags(parent, (self,))
         return self
 
+    def rename_many(self, new_tags):
+        """
+        Rename multiple children in one operation. The families are rebuild only once (one pass over the children)
+        which is much quicker compared with `rename()` calls on a large number of children.
+
+        :except: In case the new tag cannot be used (read-only tree or tag of a linked family).
+                 If an exception is raised the tree is not changed.
+
+        :type new_tags: Union[dict,Callable]
+        :param new_tags: defines the new tags:
+
+                         * *mapping* - dict {old_tag: new_tag}, all children of the family old_tag are renamed
+                         * *callable* - method called with each child delivering the new tag of the child
+
+        :rtype: list
+        :return: list of renamed items (children with changed tags)
+        """
+        is_link_root = False
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
+        if self._flags & self._IS_TREE_PROTECTED:
+            if not self.is_link_root:
+                self._raise_read_only_exception(self)
+            elif self.is_link_loaded:
+                is_link_root = True
+        if not self:
+            # no children (and no families)
+            return []
+        if callable(new_tags):
+            renames = [(item, new_tags(item)) for item in self._items]
+        else:
+            get_fam = self._get_fam
+            renames = []
+            for tag, new_tag in new_tags.items():
+                family = get_fam(tag)
+                if family is not None:
+                    renames.extend((item, new_tag) for item in family)
+        renames = [(item, new_tag) for item, new_tag in renames if new_tag != item._tag]
+        if not renames:
+            return []
+        if is_link_root:
+            tags = self._link._tags
+            for item, new_tag in renames:
+                if new_tag in tags or item._flags & (self._LINKED | self._PLACEHOLDER):
+                    self._raise_read_only_exception(item)
+        else:
+            for _, new_tag in renames:
+                hash(new_tag)  # unhashable tags raise a TypeError before the tree is changed
+        for item, new_tag in renames:
+            item._tag = new_tag
+        self._rebuild_families(self)
+        renamed = [item for item, _ in renames]
+        if self._deep_index_cnt:
+            self._reindex_tags(self, renamed)
+        return renamed
+
     def reverse(self):
         """
         Reverse the order of all children in the `iTree`.
@@ -1719,11 +2113,13 @@ class iTree(_iTreePrivate):
         `reversed()` instead.
 
         """
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         flags = self._flags
         if flags & self._IS_TREE_PROTECTED:
             if not self.is_link_root or self._link.is_loaded:
                 self._raise_read_only_exception(self)
-        else:
+        elif self:
             self._items.reverse()
             for family in self._families.values():
                 family.reverse()
@@ -1739,23 +2135,75 @@ class iTree(_iTreePrivate):
 
         In case zero is given the operation is neutral and nothing will be changed.
 
+        Like in `deque.rotate()` n is taken modulo the number of children (rotating by len(tree) positions
+        is neutral).
+
         .. note:: There is no in-depth counterpart of this method available.
 
         :type n: integer
         :param n: number of positions the items should be rotated
         """
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         flags = self._flags
         if flags & self._IS_TREE_PROTECTED:
             if not self.is_link_root or self._link.is_loaded:
                 self._raise_read_only_exception(self)
-        elif n > 0:
-            move_items = [self.pop() for _ in range(n)]
-            move_items.reverse()
-            self.extendleft(move_items)
-        elif n < 0:
-            move_items = [self.pop(0) for _ in range(-n)]
-            # move_items.reverse()
-            self.extend(move_items)
+            return
+        items = self._items
+        l = len(items)
+        if l < 2:
+            return
+        n = n % l  # negative rotations are mapped on the positive direction
+        if n == 0:
+            return
+        families = self._families
+        moved = {}
+        # Only the moved items get the exact index caches, the cached indexes of the shifted siblings are
+        # repaired on their next access (see `idx` and `tag_idx` properties).
+        # The children are not detached, we rotate the children list by slicing and we move the smaller part only
+        if n <= l // 2:
+            # rotate right: the last n items are moved to the front
+            move_items = items[-n:]
+            del items[-n:]
+            items[0:0] = move_items
+            for item in move_items:
+                tag = item._tag
+                moved[tag] = moved.get(tag, 0) + 1
+            # the moved family members are the last ones in their family
+            for tag, m in moved.items():
+                family = families[tag]
+                if m < len(family):
+                    move_members = family[-m:]
+                    del family[-m:]
+                    family[0:0] = move_members
+                    self._update_fam_idx_cache(move_members)
+            self._update_idx_cache(move_items)
+        else:
+            # rotate left: the first l-n items are moved to the end
+            n = l - n
+            move_items = items[:n]
+            del items[:n]
+            items.extend(move_items)
+            for item in move_items:
+                tag = item._tag
+                moved[tag] = moved.get(tag, 0) + 1
+            # the moved family members are the first ones in their family
+            for tag, m in moved.items():
+                family = families[tag]
+                fl = len(family)
+                if m < fl:
+                    move_members = family[:m]
+                    del family[:m]
+                    family.extend(move_members)
+                    i = fl - m
+                    for item in move_members:
+                        item._itree_prt_idx[2] = i
+                        i += 1
+            i = l - n
+            for item in move_items:
+                item._itree_prt_idx[1] = i
+                i += 1
 
     def sort(self, key=None, reverse=False):
         """
@@ -1780,8 +2228,12 @@ class iTree(_iTreePrivate):
 
 
 
-        Internally in this operation a copied sorted list is created, and afterwards the whole structure is cleared
-        and rebuild based on the sorted list.
+        The children are reordered in place (the children are not detached or copied). The families are regrouped
+        and the cached indexes are rewritten in one pass over the sorted children.
+
+        In case a key function is given and all keys are numbers of the same type (int or float) the sort order is
+        calculated via `numpy.argsort()` (if numpy is available). The result is the same as in the normal (stable)
+        sorting.
 
         The default-operation is to the sort based on the list of keys
         (tag-family, family_index) pair of the items. The base of the sorting can be modified by changing
@@ -1797,17 +2249,22 @@ class iTree(_iTreePrivate):
                         as if each comparison were reversed.
 
         """
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         flags = self._flags
         if flags & self._IS_TREE_PROTECTED:
             if not self.is_link_root or self._link.is_loaded:
                 self._raise_read_only_exception(self)
         else:
-            sort_list = list(self._items.__iter__())
-            sort_list.sort(key=key, reverse=reverse)
-            self._items.clear()
-            self._families = {}
-            self.extend(sort_list)
-
+            items = self._items
+            if len(items) < 2:
+                return
+            if key is None:
+                sort_list = sorted(items, reverse=reverse)
+            else:
+                keys = [key(item) for item in items]  # the key function is called only once per child
+                sort_list = [items[i] for i in self._get_sort_order(keys, reverse)]
+            self._reorder_items(self, sort_list)
 
     def __delitem__(self, target):
         """
@@ -1830,6 +2287,8 @@ class iTree(_iTreePrivate):
         :return: deleted item
         """
         is_link_root = False
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         if self._flags & self._IS_TREE_PROTECTED:
             if not self.is_link_root:
                 self._raise_read_only_exception(self)
@@ -1843,6 +2302,8 @@ class iTree(_iTreePrivate):
                     if item._flags & (self._LINKED | self._PLACEHOLDER):
                         self._raise_read_only_exception(self)
                 del_item = self._items.pop(target)
+                if self._deep_index_cnt:
+                    self._remove_from_deep_indexes(self, (del_item,))
                 tag = del_item._tag
                 family = self._getitem_fam(tag)
                 size_fam = len(family)
@@ -1853,6 +2314,8 @@ class iTree(_iTreePrivate):
                     family[f_idx] = link_item
                     link_item._itree_prt_idx = [self, target, f_idx]
                     del_item._itree_prt_idx = None
+                    if self._deep_index_cnt:
+                        self._add_to_deep_indexes(self, (link_item,))
                     return del_item
                 elif size_fam - 1:
                     # find family index
@@ -1873,47 +2336,14 @@ class iTree(_iTreePrivate):
                 del_item._itree_prt_idx = None
                 return del_item
             elif t is slice:  # special quick access:
-                items=self._items
-                del_items = items[target]
-                if is_link_root:
-                    for item in del_items:
-                        if item._flags & (self._LINKED | self._PLACEHOLDER):
-                            self._raise_read_only_exception(self)
-                del items[target]
-                for idx,del_item in zip(range(target.start,target.stop),del_items):
-                    tag = del_item._tag
-                    family = self._getitem_fam(tag)
-                    size_fam = len(family)
-                    if hasattr(del_item, '_link') and del_item._link._link_item is not None:
-                        f_idx = del_item.tag_idx[1]
-                        link_item = del_item._link._link_item
-                        self._items.insert(idx, link_item)
-                        family[f_idx] = link_item
-                        link_item._itree_prt_idx = [self, idx, f_idx]
-                        del_item._itree_prt_idx = None
-                        return del_item
-                    elif size_fam - 1:
-                        # find family index
-                        i = del_item._itree_prt_idx[2]
-                        if i < size_fam and del_item is family[i]:
-                            family.__delitem__(i)
-                        else:
-                            start = 0
-                            for _ in family:  # for is quicker as while
-                                i = family.index(del_item, start)
-                                if family[i] is del_item:
-                                    f_idx = i
-                                    break
-                                start = i + 1
-                            family.__delitem__(f_idx)
-                    del_item._itree_prt_idx = None
-                    return del_items
+                return self._delete_items(self, self._items[target], is_link_root)
             else:
                 items = self.__getitem__(target)
                 if hasattr(items, '_itree_prt_idx'):
                     return self.__delitem__(items.idx)
                 else:
-                    return [self.__delitem__(item.idx) for item in items]
+                    # multiple items are deleted in one pass
+                    return self._delete_items(self, items, is_link_root)
         raise KeyError('Given target %s not found in item %s' % (repr(target), str(self)))
 
     def clear(self, keep_value=False, local_only=False):
@@ -1935,6 +2365,8 @@ class iTree(_iTreePrivate):
                         * False - clear whole object (The object is reset to the no links loaded
                           state and locals are deleted)
         """
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
         flags = self._flags
         if flags & self._IS_TREE_PROTECTED and not self.is_link_root:
             self._raise_read_only_exception(self)
@@ -1945,16 +2377,22 @@ class iTree(_iTreePrivate):
                         continue
                     self.__delitem__(item.idx)
             else:
+                if self._deep_index_cnt:
+                    self._remove_from_deep_indexes(self, self._items)
                 self._link._loaded = False
                 self._unset_flags(self, self._LOAD_LINKS)
-                self._items.clear()
-                self._families = {}
+                self._set_items_empty(self)
+                self._set_families(self, {})
         else:
+            if self._deep_index_cnt:
+                self._remove_from_deep_indexes(self, self._items)
             self._unset_flags(self, self._LOAD_LINKS)
-            self._items.clear()
-            self._families = {}
+            self._set_items_empty(self)
+            self._set_families(self, {})
         if not keep_value:
             self._value = NoValue
+            if self._deep_index_cnt:
+                self._reindex_value(self)
 
     def pop(self, target=-1):
         """
@@ -1998,29 +2436,63 @@ class iTree(_iTreePrivate):
                 return self.__delitem__(item.idx)
             else:
                 raise ValueError('Given item object is not a child of this %s-object'%self.__class__.__name__)
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
+        if self._flags & self._IS_TREE_PROTECTED and not self.is_link_root:
+            self._raise_read_only_exception(self)
         try:
-            is_link_root = self.is_link_root and self.is_link_loaded
-            item_list = list(
-                item)  # we consume the iterator here because we need it multiple times we used list to reverse later on
-            for i in item_list:  # check if the items in the iterator are valid for the operation
-                try:
-                    if i._itree_prt_idx[0] is not self:
-                        raise AttributeError()
-                    if is_link_root and (i.is_linked or i.is_placeholder):
-                        self._raise_read_only_exception(self)
-                    continue
-                except AttributeError as e:
-                    raise ValueError(
-                        'The object %r is not a child of this %s-object'
-                        % (repr(i),self.__class__.__name__)
-                    ) from e
-            for i in reversed(item_list):  # we see advantage for most cases if we remove in reversed order
-                self.__delitem__(i.idx)
-            return item_list
-        except (PermissionError, ValueError):
-            raise
-        except:
-            raise TypeError('As item parameter we expect a tree child or an iterable of children')
+            item_list = list(item)  # we consume the iterator here because we need it multiple times
+        except TypeError as e:
+            raise TypeError('As item parameter we expect a tree child or an iterable of children') from e
+        # the items are checked and removed in one pass
+        self._delete_items(self, item_list, self.is_link_root and self.is_link_loaded)
+        return item_list
+
+    def delete_many(self, targets):
+        """
+        Delete multiple children in one operation. Compared with single deletes (e.g. `del` in a loop) the children
+        list and the families are rebuild only once, which is much quicker in case a large number of children
+        is deleted.
+
+        :except: In case a target is not found or the `iTree` is protected (read-only tree).
+                 If an exception is raised the tree is not changed.
+
+        :type targets: Union[Iterable,Callable]
+        :param targets: targets of the children to be deleted:
+
+                        * *itree_filter* - method (callable) for filtering the children to be deleted
+                        * *target-list* - iterable of targets, possible targets are:
+
+                            * *index* - absolute target index integer
+                            * *key* - key tuple (family_tag, family_index)
+                            * *item* - `iTree`-child of this object
+                            * all other targets supported by `__getitem__()` (e.g. tag or index-slice)
+
+        :rtype: list
+        :return: list of deleted items (parent will be set to None)
+        """
+        is_link_root = False
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
+        if self._flags & self._IS_TREE_PROTECTED:
+            if not self.is_link_root:
+                self._raise_read_only_exception(self)
+            elif self.is_link_loaded:
+                is_link_root = True
+        if callable(targets):
+            return self._delete_items(self, filter(targets, self._items), is_link_root)
+        del_items = []
+        getitem = self.__getitem__
+        for target in targets:
+            if hasattr(target, '_itree_prt_idx'):
+                del_items.append(target)
+            else:
+                item_s = getitem(target)
+                if hasattr(item_s, '_itree_prt_idx'):
+                    del_items.append(item_s)
+                else:
+                    del_items.extend(item_s)
+        return self._delete_items(self, del_items, is_link_root)
 
     # *** getters: *****************************************************************************************************
 
@@ -2292,7 +2764,7 @@ class iTree(_iTreePrivate):
         """
         return self._iter_copy(self, self.__class__._get_args_skip_subtree)
 
-    def copy(self, *args, **kwargs):
+    def copy(self, *args, copy_on_write=False, **kwargs):
         """
         create a copy of this item
 
@@ -2300,8 +2772,36 @@ class iTree(_iTreePrivate):
         of all value items. In `copy()` we just copy the value object not the items inside, the pointers
         to the original objects are kept (for immutable objects there is no difference).
 
+        In copy-on-write mode the copy is created in O(1), the children of the copy are created level by level
+        in the moment they are accessed the first time (e.g. a change in a deep item creates only the
+        items on the path to this item). The mode requires a source which is protected by `set_tree_read_only()`
+        (the structure of the source cannot change anymore). After the copy the protection of the source
+        cannot be removed anymore. The copy itself is writeable.
+
+        .. note:: The values are taken over in the moment the related children are created. Therefore the values
+                  in the source subtree cannot be changed anymore after the copy (a PermissionError is raised).
+
+        :type copy_on_write: bool
+        :param copy_on_write: create the children of the copy lazy (source must be tree read-only)
+
+        :except: In case copy_on_write is used on a source that is not tree read-only or on linked items
+                 a ValueError is raised
+
         :return: copied iTree object
         """
+        if copy_on_write:
+            flags = self._flags
+            if not flags & self._READ_ONLY_TREE:
+                raise ValueError('A copy-on-write copy requires a source with active tree protection '
+                                 '(use set_tree_read_only())')
+            if flags & (self._LINK_ROOT | self._LINKED | self._PLACEHOLDER):
+                raise ValueError('A copy-on-write copy of linked items is not supported')
+            new_itree = self.__class__(*self._get_copy_args(self))
+            new_itree._flags = new_itree._flags & ~self._READ_ONLY_TREE
+            if self:
+                self._flags = flags | self._SHARED
+                self._set_copy_on_write(new_itree, self)
+            return new_itree
         return self._iter_copy(self, self.__class__._get_copy_args)
 
     def __deepcopy__(self, *args, **kwargs):
@@ -2872,8 +3372,9 @@ class iTree(_iTreePrivate):
                 out.append('link=iTLink(%s,%s)' % (repr(link.file_path), repr(link.target_path)))
             is_links_loaded = link.is_loaded
             out.append(', ')
-        if self._flags or is_links_loaded:
-            flags = self._flags
+        # internal flags (e.g. the shared flag of copy-on-write sources) are not part of the representation
+        flags = self._flags & self._FLAG_MASK
+        if flags or is_links_loaded:
             if is_links_loaded:
                 flags = flags | iTFLAG.LOAD_LINKS
             out.append('flags=%s' % (bin(flags)))
@@ -2925,8 +3426,9 @@ class iTree(_iTreePrivate):
                 out.append('link=iTLink(%s,%s)' % (repr(link.file_path), repr(link.target_path)))
             is_links_loaded = link.is_loaded
             out.append(', ')
-        if self._flags or is_links_loaded:
-            flags = self._flags
+        # internal flags (e.g. the shared flag of copy-on-write sources) are not part of the representation
+        flags = self._flags & self._FLAG_MASK
+        if flags or is_links_loaded:
             if is_links_loaded:
                 flags = flags | iTFLAG.LOAD_LINKS
             out.append('flags=%s' % (bin(flags)))
@@ -2937,7 +3439,7 @@ class iTree(_iTreePrivate):
         out.append(')')
         return ''.join(out)
 
-    def renders(self, filter_method=None, enumerate=None, renderer=iTreeRender):
+    def renders(self, filter_method=None, enumerate=None, renderer=iTreeRender, max_lines=None):
         """
         render the iTree into a string
 
@@ -2959,17 +3461,20 @@ class iTree(_iTreePrivate):
         :type renderer: class
         :param renderer: Give another renderer class for different formatting
 
+        :type max_lines: Union[int,None]
+        :param max_lines: maximal number of rendered items (a truncation line is added in case the limit is
+                          reached); None (default) - no limit
+
         :rtype: str
         :return: Tree representation as string
         """
-        render_obj = getattr(self, '__renderer', None)
-        if render_obj is None or type(render_obj) != renderer:
-            self.__renderer = render_obj = renderer()
-        return render_obj.renders(self, filter_method, enumerate)
+        return renderer().renders(self, filter_method, enumerate, max_lines)
 
-    def render(self, filter_method=None, enumerate=False, renderer=iTreeRender):
+    def render(self, filter_method=None, enumerate=False, renderer=iTreeRender, stream=None, max_lines=None):
         """
-        Print the rendered string of the `iTree`-object to the console (stdout).
+        Print the rendered string of the `iTree`-object to the console (stdout) or write it into the given stream.
+
+        The output is written line by line (the output of large trees is not collected in memory).
 
         :type filter_method: Union[Callable,None]
         :param filter_method: filter method that checks for matching items
@@ -2980,15 +3485,24 @@ class iTree(_iTreePrivate):
 
         :param enumerate:  add an enumeration before the rendered items
 
-        :param renderer: Render to be used (The given render is stored and will be used until another renderer is given).
+        :param renderer: Render to be used.
+
+        :type stream: Union[TextIO,None]
+        :param stream: file-like object (text mode) the output is written in; None (default) - console (stdout)
+
+        :type max_lines: Union[int,None]
+        :param max_lines: maximal number of rendered items (a truncation line is added in case the limit is
+                          reached); None (default) - no limit
 
         :return:
 
         """
-        print(
-            self.renders(filter_method, enumerate, renderer=iTreeRender).encode(
-                errors='replace').decode(
-                'utf8')[:-1])
+        if stream is None:
+            write = sys.stdout.write
+            for line in renderer().iter_lines(self, filter_method, enumerate, max_lines):
+                write(line.encode(errors='replace').decode('utf8'))
+        else:
+            renderer().render(self, stream, filter_method, enumerate, max_lines)
 
     # for pickle
     def __reduce__(self):
@@ -3055,14 +3569,12 @@ class iTree(_iTreePrivate):
 
         :return: iTree object loaded from file
         """
-        serializer_obj = getattr(self, '__itree_serializer', None)
-        if serializer_obj is None or type(serializer_obj) != itree_serializer:
-            self.__itree_serializer = serializer_obj = itree_serializer(self.__class__)
+        serializer_obj = itree_serializer(self.__class__)
 
         return serializer_obj.loads(data_str, check_hash=check_hash, load_links=load_links)
 
     def load(self, file_path, check_hash=True, load_links=True,
-             itree_serializer=iTStdJSONSerializer2):
+             itree_serializer=iTStdJSONSerializer2, lazy=False, target_path=None):
         """
         create an iTree object by loading from a file
 
@@ -3078,13 +3590,22 @@ class iTree(_iTreePrivate):
 
         :param itree_serializer: optional user defined serializer for iTree objects
 
+        :param lazy: True - the file is memory mapped and the items are created in the moment they are accessed
+                     (supported by `iTStdBinarySerializer` for not packed files)
+
+        :type target_path: Union[list,tuple,None]
+        :param target_path: list or tuple of targets (e.g. `item.tag_idx_path`), only the targeted subtree is
+                            decoded and delivered (supported by `iTStdBinarySerializer` for not packed files)
+
         :return: iTree object loaded from file
         """
-        serializer_obj = getattr(self, '__itree_serializer', None)
-        if serializer_obj is None or type(serializer_obj) != itree_serializer:
-            self.__itree_serializer = serializer_obj = itree_serializer(self.__class__)
-
-        return serializer_obj.load(file_path, check_hash=check_hash, load_links=load_links)
+        serializer_obj = itree_serializer(self.__class__)
+        kwargs = {}
+        if lazy:
+            kwargs['lazy'] = True
+        if target_path is not None:
+            kwargs['target_path'] = target_path
+        return serializer_obj.load(file_path, check_hash=check_hash, load_links=load_links, **kwargs)
 
     def dumps(self, calc_hash=False, filter_method=None,
               itree_serializer=iTStdJSONSerializer2):
@@ -3098,9 +3619,7 @@ class iTree(_iTreePrivate):
 
         :return: serialized string (JSON in case of default serializer)
         """
-        serializer_obj = getattr(self, '__itree_serializer', None)
-        if serializer_obj is None or type(serializer_obj) != itree_serializer:
-            self.__itree_serializer = serializer_obj = itree_serializer(self.__class__)
+        serializer_obj = itree_serializer(self.__class__)
         return serializer_obj.dumps(self, calc_hash=calc_hash, filter_method=filter_method)
 
     def dump(self, target_path, pack=True, calc_hash=True, overwrite=False,
@@ -3109,18 +3628,20 @@ class iTree(_iTreePrivate):
         """
         serializes the iTree object to JSON (default serializer) and store it in a file
 
-        :param target_path: target path of the file where the iTree should be stored in
+        The serialized data is written item by item (the default serializer does not collect the whole
+        serialized data in memory).
+
+        :param target_path: target path of the file where the iTree should be stored in (or a binary file handle)
         :param pack: True - data will be packed via gzip before storage
         :param calc_hash: True - create the hash information of iTree and store it in the header
         :param overwrite: True - overwrite an existing file
 
         :param itree_serializer: optional user defined serializer for iTree obbjects
+                                 (e.g. `iTStdBinarySerializer` for the binary format with raw bytes and numpy data)
 
         :return: True if file is stored successful
         """
-        serializer_obj = getattr(self, '__itree_serializer', None)
-        if serializer_obj is None or type(serializer_obj) != itree_serializer:
-            self.__itree_serializer = serializer_obj = itree_serializer(self.__class__)
+        serializer_obj = itree_serializer(self.__class__)
         return serializer_obj.dump(self,
                                    target_path,
                                    pack=pack,
@@ -3230,6 +3751,10 @@ class iTree(_iTreePrivate):
         if _depth > 200:
             raise RecursionError('Circular link definition couldnot integrate linked item '
                                  '%s' % (repr(self.tag_idx_path)))
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
+        if self._deep_index_cnt:
+            self._outdate_deep_indexes(self)
 
         if self.is_link_root:
             load_ok = True
@@ -3268,7 +3793,6 @@ class iTree(_iTreePrivate):
                         else:
                             raise
                     # keep the locals and coupled objects then clean all
-                    sl = self._items
                     # now we take over the tree
                     local_items = OrderedDict()
                     for i in self._iter_locals_add_placeholders(self):
@@ -3278,8 +3802,8 @@ class iTree(_iTreePrivate):
                             local_items[i.tag_idx] = i
                     old_coupled_objects = {i.tag_idx: i.coupled_object for i in self if
                                            i.is_linked and i.coupled_object}
-                    sl.clear()
-                    self._families = families = {}
+                    self._set_items_empty(self)
+                    self._set_families(self, {})
                     linked_flag = self._LINKED
                     tags = set()
                     keys = []
@@ -3363,6 +3887,10 @@ class iTree(_iTreePrivate):
         parent = self._itree_prt_idx[0]
         if not parent.is_link_root:
             raise SyntaxError('local items can just be added to the root objects of links')
+        if self._path_cache_cnt:
+            self._invalidate_path_caches(self)
+        if self._deep_index_cnt:
+            self._outdate_deep_indexes(parent)
         local_item = self._convert_to_local_item(self, copy_subtree)
         abs_idx = self.idx
         tag, f_idx = self.tag_idx
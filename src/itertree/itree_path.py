@@ -0,0 +1,246 @@
+"""
+This code is taken from the itertree package:
+  _ _____ _____ _____ _____ _____ _____ _____
+ | |_   _|   __| __  |_   _| __  |   __|   __|
+ |-| | | |   __|    -| | | |    -|   __|   __|
+ |_| |_| |_____|__|__| |_| |__|__|_____|_____|
+
+https://pypi.org/project/itertree/
+GIT Home:
+https://github.com/BR1py/itertree
+The documentation can be found here:
+https://itertree.readthedocs.io/en/latest/index.html
+
+The code is published under MIT license
+For more information see: https://en.wikipedia.org/wiki/MIT_License
+
+CONTENT DESCRIPTION:
+
+This part of code contains the compiled target paths used for repeated accesses of the same targets in iTrees
+
+In `iTree.get()` the type of each target is analyzed in each call and ambiguous targets are resolved by trying
+the different interpretations one after the other. A compiled path does this analysis once and
+delivers for each level a resolver method that is directly used in the accesses.
+"""
+
+from .itree_helpers import Tag, TagIdx
+
+# tag used in the unique paths for absolute indexes
+_ABS_IDX = object()
+
+
+class iTCompiledPath(object):
+    """
+    Reusable accessor for a target path (see `iTree.compile_path()`)
+
+    The targets are interpreted like in `iTree.get()`. Because the interpretation is done without
+    knowing the tree ambiguous targets are always taken by the type:
+
+        * *int* - absolute index
+        * *(family_tag, family_index)* - key (tuples with other second items target the family of the tuple tag)
+        * *(family_tag, family_index_slice)*, *(family_tag, family_index_list)*, *(family_tag, ...)* - family parts
+        * *slice* - slice of absolute indexes
+        * *set* - family-tags of multiple families
+        * *list* - multiple targets (each item is compiled like a target)
+        * *iter* or *...* (Ellipsis) - all children
+        * *callable* - filter method
+        * *Tag(tag)* - family tag (use it for tags that would be interpreted as index or key)
+        * all other objects - family tag
+
+    Not existing parts of the targets are skipped (no exception is raised in case of not matching items).
+    """
+
+    __slots__ = ('_targets', '_levels', '_unique_path')
+
+    def __init__(self, *targets):
+        self._targets = targets
+        self._levels = levels = tuple(self._compile_target(target) for target in targets)
+        if all(unique for unique, _ in levels):
+            # only indexes and keys -> the path is resolved in one loop without resolver calls
+            self._unique_path = tuple(self._compile_unique_target(target) for target in targets)
+        else:
+            self._unique_path = None
+
+    @staticmethod
+    def _compile_unique_target(target):
+        """
+        create the (family_tag, family_index) pair for an unique target (absolute indexes get the tag `_ABS_IDX`)
+
+        :param target: index or key
+
+        :rtype: tuple
+        :return: (family_tag, family_index) pair
+        """
+        if type(target) is int:
+            return _ABS_IDX, target
+        return target[0], target[1]
+
+    @staticmethod
+    def _compile_target(target):
+        """
+        analyze the target and create the related resolver method
+
+        :param target: target of one level
+
+        :rtype: tuple
+        :return: (unique, resolver) ; unique resolvers deliver an item or None; the others deliver a list
+        """
+        t = type(target)
+        if t is int:
+            def resolve_idx(item):
+                size = item.__len__()
+                return item.getitem_by_idx(target) if -size <= target < size else None
+
+            return True, resolve_idx
+        if t is TagIdx or (t is tuple and len(target) == 2):
+            tag, fam_idx = target
+            hash(tag)  # unhashable tags cannot be resolved
+            t = type(fam_idx)
+            if t is int:
+                def resolve_key(item):
+                    if item:
+                        family = item._get_fam(tag)
+                        if family is not None and -len(family) <= fam_idx < len(family):
+                            return family[fam_idx]
+                    return None
+
+                return True, resolve_key
+            elif t is slice:
+                def resolve_family_slice(item):
+                    family = item._get_fam(tag) if item else None
+                    return list(family[fam_idx]) if family else []
+
+                return False, resolve_family_slice
+            elif t is list:
+                def resolve_family_list(item):
+                    family = item._get_fam(tag) if item else None
+                    if not family:
+                        return []
+                    size = len(family)
+                    return [family[i] for i in fam_idx if -size <= i < size]
+
+                return False, resolve_family_list
+            elif fam_idx is not Ellipsis:
+                # the tuple itself is the family tag
+                tag = target
+        elif t is slice:
+            return False, lambda item: list(item.getitem_by_idx(target))
+        elif t is set:
+            tags = tuple(target)
+
+            def resolve_tags(item):
+                if not item:
+                    return []
+                get_fam = item._get_fam
+                return [i for tag in tags for i in (get_fam(tag) or ())]
+
+            return False, resolve_tags
+        elif t is list:
+            levels = tuple(iTCompiledPath._compile_target(sub_target) for sub_target in target)
+
+            def resolve_multiple(item):
+                result = []
+                for unique, resolver in levels:
+                    if unique:
+                        r = resolver(item)
+                        if r is not None:
+                            result.append(r)
+                    else:
+                        result.extend(resolver(item))
+                return result
+
+            return False, resolve_multiple
+        elif target is Ellipsis or target is iter:
+            return False, list
+        elif t is Tag:
+            tag = target.tag
+        elif callable(target):
+            return False, lambda item: list(filter(target, item))
+        else:
+            tag = target
+        hash(tag)  # unhashable tags cannot be resolved
+
+        def resolve_family(item):
+            family = item._get_fam(tag) if item else None
+            return list(family) if family else []
+
+        return False, resolve_family
+
+    def _iter_items(self, itree):
+        items = [itree]
+        for unique, resolver in self._levels:
+            if unique:
+                items = [r for r in map(resolver, items) if r is not None]
+            else:
+                items = [r for item in items for r in resolver(item)]
+            if not items:
+                break
+        return items
+
+    def get(self, itree, default=Exception):
+        """
+        get the targeted items from the given `iTree`-object (like `itree.get(*targets)`)
+
+        :except: In case no item is found a KeyError is raised (if no default is given)
+
+        :type itree: iTree
+        :param itree: `iTree`-object the targets are related to
+
+        :param default: object delivered in case no item is found (instead of raising an exception)
+
+        :rtype: Union[iTree,list]
+        :return: single item in case all targets are unique (index or key); list of items in the other cases
+        """
+        unique_path = self._unique_path
+        if unique_path is not None:
+            item = itree
+            try:
+                for tag, idx in unique_path:
+                    if tag is _ABS_IDX:
+                        item = item.getitem_by_idx(idx)
+                    else:
+                        # leafs have no families -> AttributeError
+                        item = item._get_fam(tag)[idx]
+                return item
+            except (IndexError, AttributeError, TypeError):
+                # not found (the exception is not used to try other interpretations of the target)
+                pass
+        else:
+            items = self._iter_items(itree)
+            if items:
+                return items
+        if default is Exception:
+            raise KeyError('No item found for target path %s' % repr(self._targets))
+        return default
+
+    def iter(self, itree):
+        """
+        iterate over the targeted items in the given `iTree`-object
+
+        :type itree: iTree
+        :param itree: `iTree`-object the targets are related to
+
+        :rtype: Iterator
+        :return: iterator over the found items (empty in case no item is found)
+        """
+        if self._unique_path is not None:
+            item = self.get(itree, None)
+            return iter(() if item is None else (item,))
+        return iter(self._iter_items(itree))
+
+    def exists(self, itree):
+        """
+        check if the given `iTree`-object contains at least one targeted item
+
+        :type itree: iTree
+        :param itree: `iTree`-object the targets are related to
+
+        :rtype: bool
+        :return: True - targeted item found; False - no item found
+        """
+        if self._unique_path is not None:
+            return self.get(itree, None) is not None
+        return bool(self._iter_items(itree))
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(repr(t) for t in self._targets))
@@ -0,0 +1,142 @@
+"""
+This code is taken from the itertree package:
+  _ _____ _____ _____ _____ _____ _____ _____
+ | |_   _|   __| __  |_   _| __  |   __|   __|
+ |-| | | |   __|    -| | | |    -|   __|   __|
+ |_| |_| |_____|__|__| |_| |__|__|_____|_____|
+
+https://pypi.org/project/itertree/
+GIT Home:
+https://github.com/BR1py/itertree
+The documentation can be found here:
+https://itertree.readthedocs.io/en/latest/index.html
+
+The code is published under MIT license
+For more information see: https://en.wikipedia.org/wiki/MIT_License
+
+CONTENT DESCRIPTION:
+
+This part of code contains the persistent update methods for the iTree object
+
+A tree protected by `set_tree_read_only()` is used as a frozen version. The update methods do not change the
+version (structure and values are protected), they deliver a new frozen version instead. The new version is a
+copy-on-write copy which shares all untouched subtrees with the old version (only the items on the path to the
+changed item are created).
+"""
+
+from .itree_helpers import NoValue
+
+
+class _iTreePersistent():
+    __slots__ = ('_itree',)
+
+    def __init__(self, itree):
+        self._itree = itree
+
+    def evolve(self, change_method, *target_path):
+        """
+        Call via **iTree().persistent.evolve()**
+
+        Create a new version of the frozen (tree read-only) `iTree`-object and apply the given change on it. The
+        original version is not touched.
+
+        The effort is related to the number of siblings on the path to the targeted item not to the size of the
+        tree. Untouched subtrees are shared with the original version (their children are created only
+        in case they are accessed).
+
+        .. note:: The versions share the items of untouched subtrees and the values are taken over in the moment
+                  the items in the new version are created. Therefore the values of all versions (including the
+                  original frozen tree) are protected too (a PermissionError is raised), the values can only be
+                  changed via the persistent methods.
+
+        :except: If the `iTree`-object is not tree read-only a ValueError is raised
+
+        :type change_method: Callable
+        :param change_method: method that changes the targeted item of the new version (the item is given
+                              as the only parameter)
+
+        :param target_path: target path (like in `get()`) to a single item (nothing given targets the root)
+
+        :rtype: iTree
+        :return: new frozen version
+        """
+        new_version = self._itree.copy(copy_on_write=True)
+        if target_path:
+            change_method(new_version.get.single(*target_path))
+        else:
+            change_method(new_version)
+        new_version.set_tree_read_only()
+        # the version is frozen completely (structure and values), newer versions may share its items
+        new_version._set_flags(new_version, new_version._SHARED)
+        return new_version
+
+    def append(self, item=NoValue, *target_path):
+        """
+        Call via **iTree().persistent.append()**
+
+        Create a new version of the frozen `iTree`-object with the given item appended
+        (see `iTree.append()` and `evolve()`)
+
+        :type item: Union[iTree,object]
+        :param item: item that should be appended
+
+        :param target_path: target path to the parent the item is appended to (nothing given targets the root)
+
+        :rtype: iTree
+        :return: new frozen version
+        """
+        return self.evolve(lambda target: target.append(item), *target_path)
+
+    def insert(self, target, item=NoValue, *target_path):
+        """
+        Call via **iTree().persistent.insert()**
+
+        Create a new version of the frozen `iTree`-object with the given item inserted
+        (see `iTree.insert()` and `evolve()`)
+
+        :type target: Union[int,tuple,iTree]
+        :param target: insert position in the children of the targeted parent
+
+        :type item: Union[iTree,object]
+        :param item: item that should be inserted
+
+        :param target_path: target path to the parent the item is inserted in (nothing given targets the root)
+
+        :rtype: iTree
+        :return: new frozen version
+        """
+        return self.evolve(lambda parent: parent.insert(target, item), *target_path)
+
+    def set_value(self, value, *target_path):
+        """
+        Call via **iTree().persistent.set_value()**
+
+        Create a new version of the frozen `iTree`-object with a new value in the targeted item
+        (see `iTree.set_value()` and `evolve()`)
+
+        :param value: new value
+
+        :param target_path: target path to the item (nothing given targets the root)
+
+        :rtype: iTree
+        :return: new frozen version
+        """
+        return self.evolve(lambda target: target.set_value(value), *target_path)
+
+    def delete(self, *target_path):
+        """
+        Call via **iTree().persistent.delete()**
+
+        Create a new version of the frozen `iTree`-object with the targeted item removed
+        (see `evolve()`)
+
+        :except: If no target path is given a ValueError is raised (the root cannot be deleted)
+
+        :param target_path: target path to the item that should be deleted
+
+        :rtype: iTree
+        :return: new frozen version
+        """
+        if not target_path:
+            raise ValueError('The root of a version cannot be deleted, give a target path')
+        return self.evolve(lambda target: target.parent.__delitem__(target.idx), *target_path)
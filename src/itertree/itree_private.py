@@ -1,858 +1,1954 @@
-"""
-This code is taken from the itertree package:
-  _ _____ _____ _____ _____ _____ _____ _____
- | |_   _|   __| __  |_   _| __  |   __|   __|
- |-| | | |   __|    -| | | |    -|   __|   __|
- |_| |_| |_____|__|__| |_| |__|__|_____|_____|
-
-https://pypi.org/project/itertree/
-GIT Home:
-https://github.com/BR1py/itertree
-The documentation can be found here:
-https://itertree.readthedocs.io/en/latest/index.html
-
-The code is published under MIT license
-For more information see: https://en.wikipedia.org/wiki/MIT_License
-
-CONTENT DESCRIPTION:
-
-This part of code contains the private helper functions in iTree object
-
-Those methods are all defined as static methods which means in case self is required as
-first parameter it must be placed explicit in
-
-"""
-
-import copy
-import sys
-from collections import deque
-from contextlib import suppress
-from itertools import chain, dropwhile, islice,tee
-from operator import length_hint
-from itertree.itree_helpers import np,iTLink, itree_list, NoValue, BLIST_SWITCH
-
-NONE_TUPLE=(None,)
-
-# items
-
-class _iTreeParent():
-    __slots__ = ('parent', 'abs_idx_cache', 'fam_idx_cache', 'flags', 'link','families','super_list')
-
-# For the following important class we distinguish in between the different Python versions to take advantages
-# from new features available (like yield from and `:=`
-
-class _iTreePrivate():
-
-    __slots__=()
-    """
-    super class of iTree which contains all private static methods
-
-    This class was created because the number of public methods is already large and
-    so we can split the functionality a bit over two files/modules
-
-    This class contains especially all variants of required iterators.
-
-    """
-
-    # --- other static helpers ---------------------------------------------------------------------
-
-    @staticmethod
-    def _value_equal(self_value, other_value):
-        """
-        helper function for comparison of value data
-        :param self_value: own value-data-object against the other_value object should be checked
-                           (given explicit for recursive usage)
-        :param other_value: other data object we like to compare with
-        :return:
-                * True - match
-                * False - no match
-
-        """
-        t = type(self_value)
-        if t != type(other_value):
-            return False
-        try:
-            equal = (self_value == other_value)
-        except Exception:
-            equal = None
-        if equal is True or equal is False:
-            return equal
-        try:
-            return all(equal)
-        except Exception:
-            with suppress(Exception):
-                if np is not None and t is np.ndarray:
-                    # numpy objects
-                    if self_value.shape != other_value.shape or self_value.dtype != other_value.dtype:
-                        return False
-                    return all(np.equal(np.frombuffer(self_value, dtype=np.uint8),
-                                        np.frombuffer(other_value, dtype=np.uint8)))
-        # we must look deeper
-        value_equal = _iTreePrivate._value_equal
-        if hasattr(self_value, 'items'):
-            try:
-                next(dropwhile(lambda i: value_equal(i[0][0],i[1][0]) and value_equal(i[0][1],i[1][1])
-                          ,zip(self_value.items(), other_value.items())))
-                return False
-            except StopIteration:
-                return True
-            except Exception:
-                pass
-        # if we reach this point we expect an iterables or just a mutable object
-        try:
-            next(dropwhile(value_equal, zip(self_value, other_value)))
-            return False
-        except StopIteration:
-            return True
-        except Exception:
-            return False
-
-
-    @staticmethod
-    def _raise_read_only_exception(itree_item):
-        raise PermissionError('The item (%s) is read_only (linked or read_only flag)!' % repr(itree_item))
-
-    @staticmethod
-    def _raise_exception(exception):
-        raise exception
-
-    # --- flags related helpers ----------------------------------------------------------------
-    # private helpers for setting flags
-
-    @staticmethod
-    def _set_flags(itree_item, flags, _init=False):
-        """
-        Set the given flags on the `iTree`-object
-
-        :type flags: int
-        :param flags: flags (flag-mask) changing item behavior
-                      Multiple flags can be combined via `|`
-        """
-        if not _init and itree_item._flags & itree_item._LINKED:
-            _iTreePrivate._raise_read_only_exception(itree_item)
-        itree_item._flags = itree_item._flags | flags
-
-    @staticmethod
-    def _set_flags_deep(itree_item, flags, filter_method=None, iter_unfiltered=False, _init=False):
-        """
-        Change the flags of the item and the nested items in the subtree; sub-subtree, ...
-
-        :type flags: int
-        :param flags: flags (flag-mask) changing item behavior
-                      Multiple flags can be combined via `|`
-
-        :type filter_method: Union[Callable,None]
-        :param filter_method: filter method that checks for matching items
-                            and delivers `True`/`False`.
-                            The filter_method targets always the `iTree`-child-object and checks a characteristic
-                            of this object for matches (see :ref:`filter_method <filter_method>`)
-
-                            If `None` is given filtering is inactive.
-
-        :type iter_unfiltered: bool
-        :param iter_unfiltered:
-                               * False (default)
-                                    the iteration will be stopped in case a item is not matching. The
-                                    whole branch will be out in this case.
-                               * True
-                                    The iteration will be continued if that a parent is not matching., It will
-                                    iterate over the whole subtree and deliver all matching items.
-
-        """
-        if itree_item._flags & itree_item._LINKED and not _init:
-            _iTreePrivate._raise_read_only_exception(itree_item)
-        set_flags=_iTreePrivate._set_flags
-        if filter_method:
-            if filter_method(itree_item):
-                set_flags(itree_item, flags, _init=_init)
-                for i in itree_item.deep.iter(filter_method):
-                    set_flags(i, flags, _init=_init)
-            elif iter_unfiltered:
-                for i in filter(filter_method, itree_item.deep):
-                    set_flags(i,flags,_init=_init)
-        else:
-            set_flags(itree_item,flags, _init=_init)
-            for i in itree_item.deep:
-                set_flags(i,flags, _init=_init)
-
-    @staticmethod
-    def _unset_flags(itree_item, flags):
-        if itree_item._flags & itree_item._LINKED:
-            _iTreePrivate._raise_read_only_exception(itree_item)
-        s_flags = itree_item._flags
-        itree_item._flags = result=s_flags & (~s_flags & flags)
-        return result
-
-    @staticmethod
-    def _unset_flags_deep(itree_item, flags, filter_method=None, iter_unfiltered=False):
-        if itree_item._flags & itree_item._LINKED:
-            _iTreePrivate._raise_read_only_exception(itree_item)
-        unset_flags=_iTreePrivate._unset_flags
-        if filter_method:
-            if filter_method(itree_item):
-                unset_flags(itree_item,flags)
-                for i in itree_item.deep.iter(filter_method):
-                    unset_flags(i,flags)
-            elif iter_unfiltered:
-                for i in filter(filter_method, itree_item.deep):
-                    unset_flags(i, flags)
-        else:
-            unset_flags(itree_item,flags)
-            for i in itree_item.deep:
-                unset_flags(i,flags)
-
-    # --- item integration -------------------------------------------------------------------------
-
-
-    @staticmethod
-    def _iter_extend(itree_item, items, flags_deep=0,init=False):
-        """
-        Generator which iterates over items given and extends them into the `iTree`-object
-
-        The generator extends the items to the families and yields the items to be extended to
-        the super() blist-object of `iTree`.
-
-        This is the main extend function and the additional parameters are used for instance `iTree`-objects too.
-
-        .. note::
-               In case the items have already a parent an implicit copy will be made. We do this because
-               we might get an `iTree`-object as `extend_items`-parameter and then the children will have automatically
-               a parent.
-
-        :type param: Iterable
-        :param items: iterable object that contains `iTree`-objects as items it can be:
-
-                        * iterator or generator of `iTree`-objects (using next)
-                        * `iTree`-object (children will be copied in this case
-                        * iterable of `iTree`-objects (list, tuple, ...)
-                        * argument list for `iTree`-instance ( ´__init__()´ )(created by ´get_init_args()´
-                          or ´get_init_args_deep()´)
-                        * iterator or generator of value-objects (using next) - implicit `iTree`objects created
-                        * iterable of value-objects (list, tuple, ...)- implicit `iTree`objects created
-
-        :type _decoder: Option[Callable]
-        :param _decoder: _decoder internal parameter used for load/loads operations decodes tags and values
-
-        :type flags_deep: int
-        :param flags_deep: set the given flags deep in the tree
-
-        :rtype: Iterator/Generator
-        :return: An iterator of all items to be added in super_class (blist)
-        """
-        # Implementation state: ready, tested, doc ok
-        itree_class = itree_item.__class__
-        if init:
-            idx=0
-        else:
-            idx = len(itree_item)
-            if hasattr(items,'_itree_prt_idx') and items.root is itree_item.root:
-                # here we must create an independent object if not we might implicit extend the source in parallel
-                items=items.copy()
-        if idx:
-            # make multi called functions local:
-            fs_getitem = itree_item._get_fam
-            fs_setitem = itree_item._setitem_fam
-        else: # empty!
-            # In the moment the first child is added we set all pointers to the quick access functions
-            getitem=itree_item.get
-            #families
-            itree_item._families = families = {}
-            getitem._getitem_fam=itree_item._getitem_fam=families.__getitem__
-            itree_item._setitem_fam = fs_setitem = families.__setitem__
-            fs_getitem=itree_item._get_fam  = families.get
-        if flags_deep:
-            set_flags_deep=_iTreePrivate._set_flags_deep
-            for item in items:
-                if hasattr(item, '_itree_prt_idx'):
-                    if item._itree_prt_idx:
-                        item = item.__copy__()
-                else:
-                    item = itree_class(*item) if type(item) is list else itree_class(value=item)
-                tag = item._tag
-                family = fs_getitem(tag)
-                if family is None:
-                    fs_setitem(tag, [item])
-                    item._itree_prt_idx = [itree_item, idx, 0]
-                else:
-                    fm_idx = family.__len__()
-                    family.append(item)
-                    if fm_idx == BLIST_SWITCH:
-                        itree_item._setitem_fam(tag, itree_list(family))
-                    item._itree_prt_idx = [itree_item, idx, fm_idx]
-                set_flags_deep(item,flags_deep, _init=True)
-                yield item  # yields the item to extend it to super() list
-                idx = idx + 1
-        else:
-            for item in items:
-                if hasattr(item, '_itree_prt_idx'):
-                    if item._itree_prt_idx:
-                        item = item.__copy__()
-                else:
-                    item = itree_class(*item) if type(item) is list else itree_class(value=item)
-                # append to tag family
-                tag = item._tag
-                family = fs_getitem(tag)
-                if family is None:
-                    fs_setitem(tag, [item])
-                    item._itree_prt_idx = [itree_item, idx, 0]
-                else:
-                    fm_idx = family.__len__()
-                    family.append(item)
-                    if fm_idx == BLIST_SWITCH:
-                        itree_item._setitem_fam(tag, itree_list(family))
-                    item._itree_prt_idx = [itree_item, idx, fm_idx]
-                yield item  # yields the item to extend it to super() list
-                idx = idx + 1
-
-    @staticmethod
-    def _append_item(itree_item, item):
-        """
-        Internal append for building `iTrees` in internal load operations (we do not check any properties here)
-        (is quicker than normal append (makes less plausibility checks))
-
-        :type itree_item: iTree
-        :param itree_item: iTree where the item should be appended
-
-        :type item: iTree
-        :param item: `iTree`-object to be appended
-
-        :rtype: iTree
-        :return: Delivers the appended iTree-item
-                 (it might be useful for the user to get the updated information of the object).
-        """
-        # Implementation state: ready, tested, doc ok
-        # append item to super list:
-        tag = item._tag
-        if itree_item:
-            abs_idx = len(itree_item)
-            itree_item._items.append(item)
-            # append item to family
-            family = itree_item._get_fam(tag)
-            if family is None:
-                itree_item._setitem_fam(tag, [item])
-                item._itree_prt_idx = [itree_item, abs_idx, 0]
-            else:
-                fm_idx = family.__len__()
-                family.append(item)
-                if fm_idx == BLIST_SWITCH:
-                    itree_item._setitem_fam(tag, itree_list(family))
-                item._itree_prt_idx = [itree_item, abs_idx, fm_idx]
-        else:
-            # In the moment the item gets the first child we set all pointers for the quick access functions
-            getitem=itree_item.get
-            # items
-            itree_item._items = sl = itree_item._ONE_ITEM_LIST.copy()
-            sl[0] = item
-            itree_item.getitem_by_idx = getitem.getitem_by_idx = sl.__getitem__
-            itree_item.__len__, itree_item.__iter__, itree_item._setitem_list = \
-                sl.__len__, sl.__iter__, sl.__setitem__
-            # family
-            itree_item._families = families = {tag: sl.copy()}
-            itree_item._setitem_fam, itree_item._get_fam = families.__setitem__, families.get
-            getitem._getitem_fam = itree_item._getitem_fam = families.__getitem__
-            item._itree_prt_idx = [itree_item, 0, 0]
-        return item
-
-    @staticmethod
-    def _append_item_left(itree_item, item):
-        """
-        Internal append for building `iTrees` in internal load operations (we do not check any properties here)
-        (is quicker than normal append (makes less plausibility checks))
-
-        :type itree_item: iTree
-        :param itree_item: iTree where the item should be appended
-
-        :type item: iTree
-        :param item: `iTree`-object to be appended
-
-        :rtype: iTree
-        :return: Delivers the appended item ititree_item
-                 (it might be useful for the user to get the updated information of the object).
-        """
-        # Implementation state: ready, tested, doc ok
-        # append item to super list:
-        sl = itree_item._items
-        sl.insert(0,item)
-        # append item to family
-        tag = item._tag
-        family = itree_item._get_fam(tag)
-        if family is None:
-            itree_item._setitem_fam(tag, [item])
-        else:
-            family.insert(0, item)
-        item._itree_prt_idx = [itree_item, 0, 0]
-        return item
-
-    @staticmethod
-    def _append(itree_item, item=NoValue):
-        """
-        Internal append for building iTrees
-        (ignores read only and is quicker than normal append (makes less plausibility checks)
-
-        :except: In case `iTree`-object has already a parent a `RecursionError` will be raised
-                 Other exceptions might come up in case the `iTree` is protected (tree read-only mode).
-
-
-        :type item: Union[iTree,object]
-        :param item: `iTree`-object to be appended
-
-        :rtype: iTree
-        :return: Delivers the appended item itself
-                 (it might be useful for the user to get the updated information of the object).
-        """
-        # Implementation state: ready, tested, doc ok
-        if (
-                itree_item._flags & itree_item._IS_TREE_PROTECTED
-                and itree_item.is_link_root
-                and hasattr(itree_item, '_itree_prt_idx')
-                and itree_item._flags & (itree_item._LINKED | itree_item._LINK_ROOT | itree_item._PLACEHOLDER)
-        ):
-            raise TypeError('Linked items cannot be appended to linked item as local item')
-        _iTreePrivate._append_item(itree_item, item)
-
-    @staticmethod
-    def _get_family_insertion_idx(family, item_idx, _last_index=0):
-        """
-        Internal function to find the family index for insert as quick as possible,
-        it uses interval search based on absolute indexes
-
-        :param family: family list
-        :param item_idx: absolute index of item to be searched for
-        :param last_index: last index which was checked
-        :return: family index
-        """
-        s = len(family)
-        if s == 1:
-            return (1 + _last_index) if family[0].idx < item_idx else _last_index
-        i = round(s / 2)
-        idx = family[i].idx
-        # recursive call:
-        return (
-            _iTreePrivate._get_family_insertion_idx(family[i:], item_idx, _last_index + i)
-            if idx < item_idx else
-            _iTreePrivate._get_family_insertion_idx(family[:i], item_idx, _last_index)
-        )
-
-    @staticmethod
-    def _get_copy_args(itree_item):
-        value = itree_item._value
-        flags = itree_item._flags
-        if itree_item.is_link_root:
-            if flags:
-                return (
-                    (
-                        itree_item._tag,
-                        value,
-                        None,
-                        iTLink(itree_item._link.file_path, itree_item._link.target_path),
-                        flags
-                    )
-                    if callable(value.__hash__)
-                    else (
-                        itree_item._tag,
-                        copy.copy(value),
-                        None,
-                        iTLink(itree_item._link.file_path, itree_item._link.target_path),
-                        flags
-                    )
-                )
-            else:
-                return (
-                    (
-                        itree_item._tag,
-                        value,
-                        None,
-                        iTLink(itree_item._link.file_path, itree_item._link.target_path)
-                    )
-                    if callable(value.__hash__)
-                    else (
-                        itree_item._tag,
-                        copy.copy(value),
-                        None,
-                        iTLink(itree_item._link.file_path, itree_item._link.target_path)
-                    )
-                )
-        elif flags:
-            return (
-                   (itree_item._tag, value, None, None, flags)
-                   if callable(value.__hash__)
-                   else (itree_item._tag, copy.copy(value), None, None, flags)
-            )
-        elif callable(value.__hash__):
-            return (itree_item._tag, value)
-        else:
-            return (itree_item._tag, copy.copy(value))
-
-    @staticmethod
-    def _get_args_skip_subtree(itree_item):
-        flags = itree_item._flags
-        if itree_item.is_link_root:
-            if flags:
-                return itree_item._tag, itree_item._value,None,iTLink(itree_item._link.file_path, itree_item._link.target_path),flags
-            else:
-                return itree_item._tag,itree_item._value,None,iTLink(itree_item._link.file_path, itree_item._link.target_path)
-        elif flags:
-                return itree_item._tag, itree_item._value, None, None, flags
-        else:
-            return itree_item._tag, itree_item._value
-
-    @staticmethod
-    def _get_deepcopy_args(itree_item):
-        flags = itree_item._flags
-        if itree_item.is_link_root:
-            if flags:
-                return (
-                        itree_item._tag,
-                        copy.deepcopy(itree_item._value),
-                        None,
-                        iTLink(itree_item._link.file_path, itree_item._link.target_path),
-                        flags
-                       )
-
-            else:
-                return (
-                        itree_item._tag,
-                        copy.deepcopy(itree_item._value),
-                        None,
-                        iTLink(itree_item._link.file_path, itree_item._link.target_path)
-                        )
-        elif flags:
-                return (itree_item._tag, copy.deepcopy(itree_item._value), None, None, flags)
-        return itree_item._tag, copy.deepcopy(itree_item._value)
-
-    # --- iterative iterators --------------------------------------------------------------------------------
-
-    @staticmethod
-    def _get_deep_sub_iterator( items, target):
-        for item in items:
-            with suppress(KeyError, IndexError):
-                result = item.__getitem__(target)
-                if hasattr(result, '_itree_prt_idx'):
-                    yield result
-                else:
-                    for i in result:
-                        yield i
-
-
-    # copy related iterators
-
-    @staticmethod
-    def _iter_copy(itree_item,get_copy_args):
-        """
-        create a copy of this item
-
-        The helper method runs the copy in a iterative (non-recursive way)
-
-        :param itree_item: item to be copied
-
-        :param get_copy_args: argument creation method should be one of:
-                              * _get_copy_args -> normal copy
-                              * _get_deepcopy_args -> deepcopy
-                              * _get_args_skip_subtree  -> copy and keep value references
-
-        :return: copied iTree object
-        """
-        # Iterative copy required
-        itree_class=itree_item.__class__
-        append_item=_iTreePrivate._append_item
-        new_itree = itree_class(*get_copy_args(itree_item))
-        if itree_item:
-            none_tuple = NONE_TUPLE
-            items = [new_itree]
-            iterators = [itree_item.__iter__()]  # in Python 3.9 lists are quicker than deque
-            while iterators:
-                for item in iterators[-1]:
-                    if item:
-                        iterators.extend((none_tuple,item.__iter__()))
-                        items.append(append_item(items[-1], itree_class(*get_copy_args(item))))
-                        break
-                    elif item is None:
-                        del items[-1]
-                    else:
-                        append_item(items[-1], itree_class(*get_copy_args(item)))
-                else: # for loop is finished and not broken
-                    del iterators[-1]
-        return new_itree
-
-    # link related iterators
-
-    @staticmethod
-    def _convert_to_linked_item_chained(root_item):
-        """
-        helper function that creates a linked clone of a normal item
-        helper method is need in the load_links method
-
-        :param root_item: item to be "cloned"
-
-        :return: converted item
-        """
-        get_copy_args=_iTreePrivate._get_args_skip_subtree
-        append_item=_iTreePrivate._append_item
-        itree_class = root_item.__class__
-        linked_flag = root_item._LINKED
-        if root_item.is_linked:
-            return root_item
-        new_item = itree_class(root_item._tag,
-                               copy.copy(root_item._value),
-                               flags=root_item._flags | linked_flag)
-        if root_item:
-            iterator = root_item.__iter__()
-            none_tuple=NONE_TUPLE
-            items = [new_item]
-            with suppress(StopIteration):
-                while 1:
-                    item=next(iterator)
-                    if item:
-                        iterator = chain(item.__iter__(), none_tuple, iterator)
-                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
-                        new._flags=new._flags|linked_flag
-                        items.append(new)
-                    elif item is None:
-                        del items[-1]
-                    else:
-                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
-                        new._flags=new._flags|linked_flag
-        return new_item
-
-    @staticmethod
-    def _convert_to_linked_item(root_item):
-        """
-        helper function that creates a linked clone of a normal item
-        helper method is need in the load_links method
-
-        :param root_item: item to be "cloned"
-
-        :return: converted item
-        """
-        get_copy_args = _iTreePrivate._get_args_skip_subtree
-        append_item = _iTreePrivate._append_item
-        itree_class = root_item.__class__
-        linked_flag = root_item._LINKED
-        if root_item.is_linked:
-            return root_item
-        new_item = itree_class(root_item._tag,
-                               copy.copy(root_item._value),
-                               flags=root_item._flags | linked_flag)
-
-        if root_item:
-            iterators=[root_item.__iter__()] # in Python 3.9 lists are quicker than deque
-            none_tuple=NONE_TUPLE
-            items = [new_item]
-            while iterators:
-                for item in iterators[-1]:
-                    if item:
-                        iterators.extend((none_tuple, item.__iter__()))
-                        new = append_item(items[-1], itree_class(*get_copy_args(item)))
-                        new._flags = new._flags | linked_flag
-                        items.append(new)
-                        break
-                    elif item is None:
-                        del iterators[-1]
-                        break
-                    else:
-                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
-                        new._flags=new._flags|linked_flag
-                else: # for loop is finished and not broken
-                    del iterators[-1]
-        return new_item
-
-    @staticmethod
-    def _convert_to_local_item_chained(root_item,copy_subtree=True):
-        """
-        helper function that creates a linked clone of a normal item
-        helper method is need in the load_links method
-
-        :param root_item: item to be "cloned"
-
-        :return: converted item
-        """
-        get_copy_args=_iTreePrivate._get_args_skip_subtree
-        append_item=_iTreePrivate._append_item
-        if not root_item.is_linked:
-            # is already local
-            return root_item
-        itree_class = root_item.__class__
-        linked_flag = root_item._LINKED
-        cp = copy.copy
-
-        new_item = itree_class(root_item._tag,
-                               cp(root_item._value),
-                               flags=(root_item._flags & (~linked_flag)))
-        new_item._link = iTLink(link_item=root_item)
-        if root_item and copy_subtree:
-            iterator = root_item.__iter__()
-            none_tuple=NONE_TUPLE
-            items = [new_item]
-            with suppress(StopIteration):
-                while 1:
-                    item=next(iterator)
-                    if item:
-                        iterator = chain(item.__iter__(), none_tuple, iterator)
-                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
-                        new._flags=new._flags & (~linked_flag)
-                        items.append(new)
-                    elif item is None:
-                        del items[-1]
-                    else:
-                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
-                        new._flags=new._flags & (~linked_flag)
-        return new_item
-
-    @staticmethod
-    def _convert_to_local_item(root_item,copy_subtree=True):
-        """
-        helper function that creates a linked clone of a normal item
-        helper method is need in the load_links method
-
-        :param root_item: item to be "cloned"
-
-        :return: converted item
-        """
-        get_copy_args=_iTreePrivate._get_args_skip_subtree
-        append_item=_iTreePrivate._append_item
-        if not root_item.is_linked:
-            # is already local
-            return root_item
-        itree_class = root_item.__class__
-        linked_flag = root_item._LINKED
-        cp = copy.copy
-
-        new_item = itree_class(root_item._tag,
-                               cp(root_item._value),
-                               flags=(root_item._flags & (~linked_flag)))
-        new_item._link = iTLink(link_item=root_item)
-        if root_item and copy_subtree:
-            iterators=[root_item.__iter__()] # in Python 3.9 lists are quicker than deque
-            none_tuple=NONE_TUPLE
-            items = [new_item]
-            while iterators:
-                for item in iterators[-1]:
-                    if item:
-                        iterators.extend((none_tuple, item.__iter__()))
-                        new = append_item(items[-1], itree_class(*get_copy_args(item)))
-                        new._flags = new._flags | linked_flag
-                        items.append(new)
-                        break
-                    elif item is None:
-                        del iterators[-1]
-                        break
-                    else:
-                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
-                        new._flags=new._flags|linked_flag
-                else: # for loop is finished and not broken
-                    del iterators[-1]
-        return new_item
-
-    @staticmethod
-    def _iter_locals_add_placeholders(itree_item):
-        if itree_item:
-            itree_class=itree_item.__class__
-            placeholder_flag=itree_item._PLACEHOLDER
-            add_placeholder=False
-            tag_dict={i.tag:-1 for i in itree_item}
-            for item in itree_item:
-                tag=item.tag
-                item._itree_prt_idx[2]=k=tag_dict[tag]=tag_dict[tag]+1
-                if item.is_linked and add_placeholder:
-                    yield itree_class(item._tag,k, flags=placeholder_flag)  # placeholder item (we store the index in the value)
-                    add_placeholder = False
-                else:
-                    yield item
-                    add_placeholder = True
-
-    @staticmethod
-    def _iter_deep_locals_add_placeholders_filtered(itree_item,filter_method):
-        """
-        Most important iterator which iterates over all elements top->down. It returns the index_path of the items.
-        Internally the index path in the cache are recalculated during the iteration.
-
-        The design of the iterator allows an iteration speed which is somehow 4x slower as
-        normal list iterations which is very quick for a python solution!
-        The solution is iterative not recursive to avoid RecursionErrors for deep trees.
-
-        :type itree_item: iTree
-        :param itree_item: root item
-
-        :rtype: Iterator
-        :return: deep iterator over all index-paths (`.idx_path` attribute)
-        """
-        iter_locals_add_placeholders=_iTreePrivate._iter_locals_add_placeholders
-        if itree_item:
-            iterators = [filter(filter_method,itree_item.__iter__())]  # in Python 3.9 lists are quicker than deque
-            none_tuple = NONE_TUPLE
-            tag_index_dict = [{tag: -1 for tag in itree_item._families.keys()}]
-            depth=1
-            while iterators:
-                for item in iterators[-1]:
-                    if item:
-                        tag = item._tag
-                        tag_dict = tag_index_dict[-1]
-                        tag_dict[tag] = fidx = tag_dict[tag] + 1
-                        yield depth,fidx, item
-                        if item.is_link_root:
-                            iterators.extend((none_tuple, filter(filter_method,iter_locals_add_placeholders(item))))
-                        else:
-                            iterators.extend((none_tuple, filter(filter_method,item.__iter__())))
-                        depth = depth + 1
-                        tag_index_dict.append({tag: -1 for tag in item._families.keys()})
-                        break
-                    elif item is None:
-                        depth=depth-1
-                        del tag_index_dict[-1]
-                        del iterators[-1]
-                        break
-                    else:
-                        tag = item._tag
-                        tag_dict = tag_index_dict[-1]
-                        tag_dict[tag] = fidx = tag_dict[tag] + 1
-                        yield depth,fidx, item
-                else:  # for loop is finished and not broken
-                    del iterators[-1]
-
-    @staticmethod
-    def _iter_deep_locals_add_placeholders(itree_item):
-        """
-        Most important iterator which iterates over all elements top->down.
-
-        The design of the iterator allows an iteration speed which is somehow 5x slower as
-        normal list iterations which is very quick for a python solution!
-        The solution is iterative not recursive to avoid RecursionErrors for deep trees.
-
-        :type itree_item: iTree
-        :param itree_item: root item
-
-        :rtype: Iterator
-        :return: deep iterator over all items
-        """
-        iter_locals_add_placeholders=_iTreePrivate._iter_locals_add_placeholders
-        if itree_item:
-            iterators = [itree_item.__iter__()]  # in Python 3.9 lists are quicker than deque
-            none_tuple = NONE_TUPLE
-            tag_index_dict = [{tag: -1 for tag in itree_item._families.keys()}]
-            depth=1
-            while iterators:
-                for item in iterators[-1]:
-                    if item:
-                        tag = item._tag
-                        tag_dict = tag_index_dict[-1]
-                        tag_dict[tag] = fidx = tag_dict[tag] + 1
-                        yield depth,fidx, item
-                        if item.is_link_root:
-                            iterators.extend((none_tuple, iter_locals_add_placeholders(item)))
-                        else:
-                            iterators.extend((none_tuple, item.__iter__()))
-                        depth = depth + 1
-                        tag_index_dict.append({tag: -1 for tag in item._families.keys()})
-                        break
-                    elif item is None:
-                        depth=depth-1
-                        del tag_index_dict[-1]
-                        del iterators[-1]
-                        break
-                    else:
-                        tag = item._tag
-                        tag_dict = tag_index_dict[-1]
-                        tag_dict[tag] = fidx = tag_dict[tag] + 1
-                        yield depth,fidx, item
-                else:  # for loop is finished and not broken
-                    del iterators[-1]
+"""
+This code is taken from the itertree package:
+  _ _____ _____ _____ _____ _____ _____ _____
+ | |_   _|   __| __  |_   _| __  |   __|   __|
+ |-| | | |   __|    -| | | |    -|   __|   __|
+ |_| |_| |_____|__|__| |_| |__|__|_____|_____|
+
+https://pypi.org/project/itertree/
+GIT Home:
+https://github.com/BR1py/itertree
+The documentation can be found here:
+https://itertree.readthedocs.io/en/latest/index.html
+
+The code is published under MIT license
+For more information see: https://en.wikipedia.org/wiki/MIT_License
+
+CONTENT DESCRIPTION:
+
+This part of code contains the private helper functions in iTree object
+
+Those methods are all defined as static methods which means in case self is required as
+first parameter it must be placed explicit in
+
+"""
+
+import copy
+import sys
+from collections import deque
+from contextlib import suppress
+from itertools import chain, dropwhile, islice,tee
+from operator import length_hint
+from itertree.itree_helpers import np,iTLink, itree_list, NoValue, BLIST_SWITCH
+
+NONE_TUPLE=(None,)
+
+# items
+
+class _iTreeParent():
+    __slots__ = ('parent', 'abs_idx_cache', 'fam_idx_cache', 'flags', 'link','families','super_list')
+
+class _iTreeCopyOnWrite():
+    """
+    Placeholder for the children list or the families dict of a copy-on-write copy (see `iTree.copy()`) or of a
+    lazy loaded item (see `iTree.load(lazy=True)`) in which the children are not yet created.
+
+    In the moment the children list or the families are accessed the children are created (one level,
+    the children with a subtree are again placeholders) and the access is forwarded to the created object.
+
+    The source is the `iTree`-object the children are copied from or an object that creates the children itself
+    via `create_children(itree_item)` (e.g. a record of a lazy loaded file).
+    """
+    __slots__ = ('_itree', '_source', '_target')
+
+    def __init__(self, itree_item, source, target):
+        self._itree = itree_item
+        self._source = source
+        self._target = target  # '_items' or '_families'
+
+    def _materialize(self):
+        itree_item = self._itree
+        if type(itree_item._items) is _iTreeCopyOnWrite:
+            source = self._source
+            if isinstance(source, _iTreePrivate):
+                _iTreePrivate._create_copy_on_write_children(itree_item, source)
+            else:
+                source.create_children(itree_item)
+        return getattr(itree_item, self._target)
+
+    def __getattr__(self, name):
+        return getattr(self._materialize(), name)
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __reversed__(self):
+        return reversed(self._materialize())
+
+    def __contains__(self, key):
+        return key in self._materialize()
+
+    def __getitem__(self, key):
+        return self._materialize()[key]
+
+    def __setitem__(self, key, value):
+        self._materialize()[key] = value
+
+    def __delitem__(self, key):
+        del self._materialize()[key]
+
+    def get(self, *args):
+        return self._materialize().get(*args)
+
+    def __repr__(self):
+        return repr(self._materialize())
+
+# For the following important class we distinguish in between the different Python versions to take advantages
+# from new features available (like yield from and `:=`
+
+class _iTreePrivate():
+
+    __slots__=()
+    """
+    super class of iTree which contains all private static methods
+
+    This class was created because the number of public methods is already large and
+    so we can split the functionality a bit over two files/modules
+
+    This class contains especially all variants of required iterators.
+
+    """
+
+    # shared children container and quick access methods of all empty `iTree`-objects (leafs)
+    # -> the tuple is immutable, unwanted changes raise an exception
+    # -> the getitem of an empty list delivers lists for slices (as for filled `iTree`-objects)
+    _EMPTY_ITEMS = ()
+    _EMPTY_LEN, _EMPTY_ITER, _EMPTY_GETITEM = _EMPTY_ITEMS.__len__, _EMPTY_ITEMS.__iter__, [].__getitem__
+
+    # number of active path caches (see `get.enable_path_cache()`), the structural changing methods
+    # must invalidate the caches only in case the number is > 0
+    _path_cache_cnt = 0
+
+    # number of active deep indexes (see `deep.enable_value_index()`, `deep.enable_tag_index()` and
+    # `deep.enable_sorted_index()`), the changing methods must update the indexes only in case the number is > 0
+    _deep_index_cnt = 0
+
+    # position cache switch (see `iTree.enable_position_cache()`) and the epoch of the cached positions
+    # -> the epoch is incremented by each structural change, entries cached in older epochs are outdated
+    _position_cache_active = False
+    _position_epoch = 0
+
+    # --- children container helpers ---------------------------------------------------------------
+
+    @staticmethod
+    def _set_items(itree_item, sl):
+        """
+        set the children list of the `iTree`-object and the related quick access methods
+        (the getter helper object is updated too in case it is already instanced)
+
+        :type itree_item: iTree
+        :param itree_item: iTree where the children list should be set
+
+        :type sl: Union[list,blist]
+        :param sl: new children list
+        """
+        itree_item._items = sl
+        itree_item.getitem_by_idx = getitem_by_idx = sl.__getitem__
+        itree_item.__len__, itree_item.__iter__ = sl.__len__, sl.__iter__
+        try:
+            itree_item._hc_get.getitem_by_idx = getitem_by_idx
+        except AttributeError:
+            pass
+
+    @staticmethod
+    def _set_items_empty(itree_item):
+        """
+        set the shared empty children container (leaf state) in the `iTree`-object
+
+        :type itree_item: iTree
+        :param itree_item: iTree which should be set to the empty state
+        """
+        itree_item._items = itree_item._EMPTY_ITEMS
+        itree_item.getitem_by_idx = getitem_by_idx = itree_item._EMPTY_GETITEM
+        itree_item.__len__, itree_item.__iter__ = itree_item._EMPTY_LEN, itree_item._EMPTY_ITER
+        try:
+            itree_item._hc_get.getitem_by_idx = getitem_by_idx
+        except AttributeError:
+            pass
+
+    @staticmethod
+    def _set_families(itree_item, families):
+        """
+        set the families dict of the `iTree`-object and the related quick access methods
+        (the getter helper object is updated too in case it is already instanced)
+
+        :type itree_item: iTree
+        :param itree_item: iTree where the families dict should be set
+
+        :type families: dict
+        :param families: new families dict
+        """
+        itree_item._families = families
+        itree_item._getitem_fam = getitem_fam = families.__getitem__
+        itree_item._get_fam = get_fam = families.get
+        itree_item._setitem_fam = families.__setitem__
+        try:
+            getitem = itree_item._hc_get
+            getitem._getitem_fam, getitem._get_fam = getitem_fam, get_fam
+        except AttributeError:
+            pass
+
+    # --- index cache helpers ----------------------------------------------------------------------
+
+    @staticmethod
+    def _update_idx_cache(items, start=0):
+        """
+        update the cached absolute indexes of the given children in one pass
+
+        :type items: Union[list,blist]
+        :param items: children list of the parent `iTree`-object
+
+        :type start: int
+        :param start: first index to be updated (the cache of the items before is expected to be valid)
+        """
+        i = start
+        for item in islice(items, start, None):
+            item._itree_prt_idx[1] = i
+            i = i + 1
+
+    @staticmethod
+    def _update_fam_idx_cache(family, start=0):
+        """
+        update the cached family indexes of the given family members in one pass
+
+        :type family: Union[list,blist]
+        :param family: family list of the parent `iTree`-object
+
+        :type start: int
+        :param start: first family index to be updated (the cache of the items before is expected to be valid)
+        """
+        i = start
+        for item in islice(family, start, None):
+            item._itree_prt_idx[2] = i
+            i = i + 1
+
+    # --- item reordering --------------------------------------------------------------------------
+
+    @staticmethod
+    def _reorder_items(itree_item, new_order):
+        """
+        set a new order of the children in place; the families are regrouped (stable) and the cached indexes are
+        rewritten in one pass
+
+        .. note:: The given list must contain exactly the children of the `iTree`-object (no checks are made here)
+
+        :type itree_item: iTree
+        :param itree_item: iTree-object that contains the children
+
+        :type new_order: list
+        :param new_order: list of all children in the new order
+        """
+        members = {}
+        get_members = members.get
+        idx = 0
+        for item in new_order:
+            tag = item._tag
+            family = get_members(tag)
+            if family is None:
+                members[tag] = family = []
+            prt_idx = item._itree_prt_idx
+            prt_idx[1] = idx
+            prt_idx[2] = len(family)
+            family.append(item)
+            idx = idx + 1
+        # we keep the list objects (list or blist) and replace the content only
+        itree_item._items[:] = new_order
+        families = itree_item._families
+        for tag, family in members.items():
+            families[tag][:] = family
+
+    @staticmethod
+    def _rebuild_families(itree_item):
+        """
+        rebuild the families dict of the `iTree`-object in one pass over the children (e.g. after multiple tags
+        are changed); the cached indexes are rewritten
+
+        :type itree_item: iTree
+        :param itree_item: iTree-object that contains the children
+        """
+        families = {}
+        get_family = families.get
+        idx = 0
+        for item in itree_item._items:
+            tag = item._tag
+            family = get_family(tag)
+            if family is None:
+                families[tag] = family = []
+            prt_idx = item._itree_prt_idx
+            prt_idx[1] = idx
+            prt_idx[2] = len(family)
+            family.append(item)
+            idx = idx + 1
+        if BLIST_SWITCH != -1:
+            for tag, family in families.items():
+                if len(family) > BLIST_SWITCH:
+                    families[tag] = itree_list(family)
+        _iTreePrivate._set_families(itree_item, families)
+
+    @staticmethod
+    def _move_item(itree_item, item, src_idx, new_idx):
+        """
+        move a child to a new position in the children list and in the family list in one operation
+
+        Only the items in between the old and the new position are shifted (and their cached indexes are
+        updated), the other children are not touched.
+
+        :type itree_item: iTree
+        :param itree_item: parent `iTree`-object
+
+        :type item: iTree
+        :param item: child to be moved
+
+        :type src_idx: int
+        :param src_idx: current absolute index of the item
+
+        :type new_idx: int
+        :param new_idx: new absolute index of the item (index after the move)
+
+        :rtype: iTree
+        :return: moved item
+        """
+        if src_idx == new_idx:
+            return item
+        items = itree_item._items
+        prt_idx = item._itree_prt_idx
+        tag = item._tag
+        old_fm_idx = fm_idx = item.tag_idx[1]
+        family = itree_item._families[tag]
+        if src_idx < new_idx:
+            # shift the items in between to the left
+            items[src_idx:new_idx] = items[src_idx + 1:new_idx + 1]
+            i = src_idx
+            for sibling in items[src_idx:new_idx]:
+                sibling_prt_idx = sibling._itree_prt_idx
+                sibling_prt_idx[1] = i
+                if sibling._tag == tag:
+                    sibling_prt_idx[2] = fm_idx
+                    fm_idx = fm_idx + 1
+                i = i + 1
+            if fm_idx != old_fm_idx:
+                family[old_fm_idx:fm_idx] = family[old_fm_idx + 1:fm_idx + 1]
+        else:
+            # shift the items in between to the right
+            items[new_idx + 1:src_idx + 1] = items[new_idx:src_idx]
+            shifted = items[new_idx + 1:src_idx + 1]
+            fm_idx = fm_idx - sum(1 for sibling in shifted if sibling._tag == tag)
+            f = fm_idx + 1
+            i = new_idx + 1
+            for sibling in shifted:
+                sibling_prt_idx = sibling._itree_prt_idx
+                sibling_prt_idx[1] = i
+                if sibling._tag == tag:
+                    sibling_prt_idx[2] = f
+                    f = f + 1
+                i = i + 1
+            if fm_idx != old_fm_idx:
+                family[fm_idx + 1:old_fm_idx + 1] = family[fm_idx:old_fm_idx]
+        items[new_idx] = item
+        family[fm_idx] = item
+        prt_idx[1] = new_idx
+        prt_idx[2] = fm_idx
+        return item
+
+    @staticmethod
+    def _get_sort_order(keys, reverse=False):
+        """
+        calculate the (stable) sort order of the given keys
+
+        In case numpy is available and all keys are numbers of the same type (int or float) the order is calculated
+        via `numpy.argsort()` otherwise the build-in sorting is used.
+
+        :type keys: list
+        :param keys: list of the sort keys
+
+        :type reverse: bool
+        :param reverse: sort in reversed order (same as in `list.sort()`)
+
+        :rtype: Iterable
+        :return: iterable of indexes defining the sort order
+        """
+        l = len(keys)
+        if np is not None and l > 100 and set(map(type, keys)) in ({int}, {float}):
+            keys = np.array(keys)
+            if keys.dtype.kind in 'iuf' and not (keys.dtype.kind == 'f' and np.isnan(keys).any()):
+                if reverse:
+                    # stable reversed order (like in list.sort()):
+                    # reverse the keys, sort, reverse the result and map the indexes back
+                    return (l - 1 - np.argsort(keys[::-1], kind='stable')[::-1]).tolist()
+                return np.argsort(keys, kind='stable').tolist()
+        return sorted(range(l), key=keys.__getitem__, reverse=reverse)
+
+    # --- other static helpers ---------------------------------------------------------------------
+
+    @staticmethod
+    def _column_to_list(column):
+        """
+        convert a column (array) into a list of Python objects
+
+        :type column: Iterable
+        :param column: list, numpy array, pyarrow array or any other iterable
+
+        :rtype: list
+        :return: list of the column elements
+        """
+        if type(column) is list:
+            return column
+        if hasattr(column, 'to_pylist'):
+            # pyarrow
+            return column.to_pylist()
+        if hasattr(column, 'tolist'):
+            # numpy (the elements are converted into Python objects)
+            return column.tolist()
+        return list(column)
+
+    @staticmethod
+    def _value_equal(self_value, other_value):
+        """
+        helper function for comparison of value data
+        :param self_value: own value-data-object against the other_value object should be checked
+                           (given explicit for recursive usage)
+        :param other_value: other data object we like to compare with
+        :return:
+                * True - match
+                * False - no match
+
+        """
+        t = type(self_value)
+        if t != type(other_value):
+            return False
+        try:
+            equal = (self_value == other_value)
+        except Exception:
+            equal = None
+        if equal is True or equal is False:
+            return equal
+        if np is not None and type(equal) is np.bool_:
+            # numpy scalars
+            return bool(equal)
+        try:
+            return all(equal)
+        except Exception:
+            with suppress(Exception):
+                if np is not None and t is np.ndarray:
+                    # numpy objects
+                    if self_value.shape != other_value.shape or self_value.dtype != other_value.dtype:
+                        return False
+                    return all(np.equal(np.frombuffer(self_value, dtype=np.uint8),
+                                        np.frombuffer(other_value, dtype=np.uint8)))
+        # we must look deeper
+        value_equal = _iTreePrivate._value_equal
+        if hasattr(self_value, 'items'):
+            try:
+                next(dropwhile(lambda i: value_equal(i[0][0],i[1][0]) and value_equal(i[0][1],i[1][1])
+                          ,zip(self_value.items(), other_value.items())))
+                return False
+            except StopIteration:
+                return True
+            except Exception:
+                pass
+        # if we reach this point we expect an iterables or just a mutable object
+        try:
+            next(dropwhile(value_equal, zip(self_value, other_value)))
+            return False
+        except StopIteration:
+            return True
+        except Exception:
+            return False
+
+
+    @staticmethod
+    def _raise_read_only_exception(itree_item):
+        raise PermissionError('The item (%s) is read_only (linked or read_only flag)!' % repr(itree_item))
+
+    @staticmethod
+    def _raise_exception(exception):
+        raise exception
+
+    # --- flags related helpers ----------------------------------------------------------------
+    # private helpers for setting flags
+
+    @staticmethod
+    def _set_flags(itree_item, flags, _init=False):
+        """
+        Set the given flags on the `iTree`-object
+
+        :type flags: int
+        :param flags: flags (flag-mask) changing item behavior
+                      Multiple flags can be combined via `|`
+        """
+        if not _init and itree_item._flags & itree_item._LINKED:
+            _iTreePrivate._raise_read_only_exception(itree_item)
+        itree_item._flags = itree_item._flags | flags
+
+    @staticmethod
+    def _set_flags_deep(itree_item, flags, filter_method=None, iter_unfiltered=False, _init=False):
+        """
+        Change the flags of the item and the nested items in the subtree; sub-subtree, ...
+
+        :type flags: int
+        :param flags: flags (flag-mask) changing item behavior
+                      Multiple flags can be combined via `|`
+
+        :type filter_method: Union[Callable,None]
+        :param filter_method: filter method that checks for matching items
+                            and delivers `True`/`False`.
+                            The filter_method targets always the `iTree`-child-object and checks a characteristic
+                            of this object for matches (see :ref:`filter_method <filter_method>`)
+
+                            If `None` is given filtering is inactive.
+
+        :type iter_unfiltered: bool
+        :param iter_unfiltered:
+                               * False (default)
+                                    the iteration will be stopped in case a item is not matching. The
+                                    whole branch will be out in this case.
+                               * True
+                                    The iteration will be continued if that a parent is not matching., It will
+                                    iterate over the whole subtree and deliver all matching items.
+
+        """
+        if itree_item._flags & itree_item._LINKED and not _init:
+            _iTreePrivate._raise_read_only_exception(itree_item)
+        set_flags=_iTreePrivate._set_flags
+        if filter_method:
+            if filter_method(itree_item):
+                set_flags(itree_item, flags, _init=_init)
+                for i in itree_item.deep.iter(filter_method):
+                    set_flags(i, flags, _init=_init)
+            elif iter_unfiltered:
+                for i in filter(filter_method, itree_item.deep):
+                    set_flags(i,flags,_init=_init)
+        else:
+            set_flags(itree_item,flags, _init=_init)
+            for i in itree_item.deep:
+                set_flags(i,flags, _init=_init)
+
+    @staticmethod
+    def _unset_flags(itree_item, flags):
+        if itree_item._flags & itree_item._LINKED:
+            _iTreePrivate._raise_read_only_exception(itree_item)
+        s_flags = itree_item._flags
+        itree_item._flags = result = s_flags & ~flags
+        return result
+
+    @staticmethod
+    def _unset_flags_deep(itree_item, flags, filter_method=None, iter_unfiltered=False):
+        if itree_item._flags & itree_item._LINKED:
+            _iTreePrivate._raise_read_only_exception(itree_item)
+        unset_flags=_iTreePrivate._unset_flags
+        if filter_method:
+            if filter_method(itree_item):
+                unset_flags(itree_item,flags)
+                for i in itree_item.deep.iter(filter_method):
+                    unset_flags(i,flags)
+            elif iter_unfiltered:
+                for i in filter(filter_method, itree_item.deep):
+                    unset_flags(i, flags)
+        else:
+            unset_flags(itree_item,flags)
+            for i in itree_item.deep:
+                unset_flags(i,flags)
+
+    # --- item deletion ----------------------------------------------------------------------------
+
+    @staticmethod
+    def _delete_items(itree_item, del_items, check_linked=False):
+        """
+        Internal bulk delete of multiple children in one pass. The children list and the families are rebuild
+        only once (instead of deleting the items one by one).
+
+        Deleted local items that cover a linked item (see `is_link_cover`) are replaced by the linked item again
+        (same as in single item delete).
+
+        :except: In case one of the given items is not a child of the `iTree`-object a ValueError is raised.
+                 If `check_linked` is set and a linked item or a placeholder should be deleted
+                 a PermissionError is raised. In both cases the tree is not changed.
+
+        :type itree_item: iTree
+        :param itree_item: parent `iTree` where the children should be deleted
+
+        :type del_items: Iterable
+        :param del_items: iterable of children to be deleted
+
+        :type check_linked: bool
+        :param check_linked: True - linked items and placeholders are protected (used for loaded link-roots)
+
+        :rtype: list
+        :return: list of deleted items (parent is set to `None`)
+        """
+        del_dict = {}
+        protected_flags = itree_item._LINKED | itree_item._PLACEHOLDER
+        for item in del_items:
+            try:
+                parent_list = item._itree_prt_idx
+            except AttributeError:
+                parent_list = None
+            if parent_list is None or parent_list[0] is not itree_item:
+                raise ValueError(
+                    'The object %s is not a child of this %s-object' % (repr(item), itree_item.__class__.__name__))
+            if check_linked and item._flags & protected_flags:
+                itree_item._raise_read_only_exception(itree_item)
+            del_dict[id(item)] = item
+        if not del_dict:
+            return []
+        # items that must be replaced by the covered linked item
+        replace_dict = {}
+        for item_id, item in del_dict.items():
+            if hasattr(item, '_link') and item._link._link_item is not None:
+                replace_dict[item_id] = item._link._link_item
+        # rebuild the families
+        families = {}
+        for tag, family in itree_item._families.items():
+            new_family = []
+            for item in family:
+                item_id = id(item)
+                if item_id in del_dict:
+                    item = replace_dict.get(item_id)
+                    if item is None:
+                        continue
+                    item._itree_prt_idx = [itree_item, 0, 0]
+                item._itree_prt_idx[2] = len(new_family)
+                new_family.append(item)
+            if new_family:
+                if BLIST_SWITCH != -1 and len(new_family) > BLIST_SWITCH:
+                    new_family = itree_list(new_family)
+                families[tag] = new_family
+        # rebuild the children list
+        sl = []
+        for item in itree_item._items:
+            item_id = id(item)
+            if item_id in del_dict:
+                item = replace_dict.get(item_id)
+                if item is None:
+                    continue
+            item._itree_prt_idx[1] = len(sl)
+            sl.append(item)
+        for item in del_dict.values():
+            item._itree_prt_idx = None
+        if itree_item._deep_index_cnt:
+            _iTreePrivate._remove_from_deep_indexes(itree_item, del_dict.values())
+            if replace_dict:
+                _iTreePrivate._add_to_deep_indexes(itree_item, replace_dict.values())
+        if sl:
+            _iTreePrivate._set_items(itree_item, itree_list(sl))
+        else:
+            _iTreePrivate._set_items_empty(itree_item)
+        _iTreePrivate._set_families(itree_item, families)
+        return list(del_dict.values())
+
+    # --- path cache -------------------------------------------------------------------------------
+
+    @staticmethod
+    def _invalidate_path_caches(itree_item):
+        """
+        the structure of the subtree of the given `iTree`-object will be changed -> the path caches
+        in the object and in all parents are cleared
+
+        :type itree_item: iTree
+        :param itree_item: changed `iTree`-object
+        """
+        # all cached positions (level and paths) are outdated
+        _iTreePrivate._position_epoch += 1
+        while itree_item is not None:
+            try:
+                path_cache = itree_item._hc_get._path_cache
+            except AttributeError:
+                pass
+            else:
+                if path_cache:
+                    path_cache.clear()
+            parent_idx = itree_item._itree_prt_idx
+            itree_item = parent_idx[0] if parent_idx is not None else None
+
+    # --- position caches (level and paths) ----------------------------------------------------------
+
+    # The cached positions are stored in the parent list of the items (behind parent, index and family-index):
+    # [parent, abs_idx, fam_idx, epoch, level, idx_path, tag_idx_path]
+    # A re-parented item gets a new parent list and the items in the subtree are outdated by the epoch.
+
+    @staticmethod
+    def _get_position_cache(itree_item):
+        """
+        deliver the parent list of the given `iTree`-object with valid position cache entries
+        (outdated entries of the item and of the parents are renewed)
+
+        :type itree_item: iTree
+        :param itree_item: `iTree`-object with parent
+
+        :rtype: list
+        :return: parent list [parent, abs_idx, fam_idx, epoch, level, idx_path, tag_idx_path] (paths might be None)
+        """
+        epoch = _iTreePrivate._position_epoch
+        parent_list = itree_item._itree_prt_idx
+        if len(parent_list) > 3 and parent_list[3] == epoch:
+            return parent_list
+        # collect the parent lists up to the first valid entry (or up to the root)
+        outdated = []
+        level = 0
+        while parent_list is not None:
+            if len(parent_list) > 3 and parent_list[3] == epoch:
+                level = parent_list[4]
+                break
+            outdated.append(parent_list)
+            parent_list = parent_list[0]._itree_prt_idx
+        for parent_list in reversed(outdated):
+            level = level + 1
+            if len(parent_list) == 3:
+                parent_list.extend((epoch, level, None, None))
+            else:
+                parent_list[3:] = (epoch, level, None, None)
+        return itree_item._itree_prt_idx
+
+    @staticmethod
+    def _get_cached_path(itree_item, pos, get_part):
+        """
+        deliver the cached path of the given `iTree`-object (the path is created from the cached path of the parent)
+
+        :type itree_item: iTree
+        :param itree_item: `iTree`-object with parent
+
+        :type pos: int
+        :param pos: position of the path in the parent list (5 - idx_path; 6 - tag_idx_path)
+
+        :type get_part: Callable
+        :param get_part: method delivering the path part of an item (idx or tag_idx)
+
+        :rtype: tuple
+        :return: path tuple (the same tuple object is delivered until the next structural change)
+        """
+        parent_list = _iTreePrivate._get_position_cache(itree_item)
+        path = parent_list[pos]
+        if path is not None:
+            return path
+        # the parents have valid entries now -> search for the first cached path
+        items = [itree_item]
+        item = parent_list[0]
+        while True:
+            parent_list = item._itree_prt_idx
+            if parent_list is None:
+                path = ()
+                break
+            path = parent_list[pos]
+            if path is not None:
+                break
+            items.append(item)
+            item = parent_list[0]
+        for item in reversed(items):
+            path = path + (get_part(item),)
+            item._itree_prt_idx[pos] = path
+        return path
+
+    # --- deep indexes (value and tag) -------------------------------------------------------------
+
+    @staticmethod
+    def _get_deep_index_holders(itree_item):
+        """
+        collect the deep indexes of the given `iTree`-object and of all parents (outdated indexes are skipped,
+        they are rebuild in the next query)
+
+        :type itree_item: iTree
+        :param itree_item: `iTree`-object the search starts with
+
+        :rtype: list
+        :return: list of (`deep`-object, value_index, tag_index, sorted_indexes, aggregates) tuples
+                 (not active indexes are None, sorted_indexes is a list of the current sorted indexes)
+        """
+        holders = []
+        while itree_item is not None:
+            # getattr() with default is quicker than catching the AttributeError (most items have no index)
+            tree = getattr(itree_item, '_hc_tree', None)
+            if tree is not None:
+                value_index = getattr(tree, '_value_index', None)
+                tag_index = getattr(tree, '_tag_index', None)
+                sorted_indexes = getattr(tree, '_sorted_indexes', None)
+                if sorted_indexes:
+                    sorted_indexes = [i for i in sorted_indexes.values() if i is not None]
+                aggregates = getattr(tree, '_aggregates', None)
+                if value_index is not None or tag_index is not None or sorted_indexes or aggregates is not None:
+                    holders.append((tree, value_index, tag_index, sorted_indexes, aggregates))
+            parent_idx = itree_item._itree_prt_idx
+            itree_item = parent_idx[0] if parent_idx is not None else None
+        return holders
+
+    @staticmethod
+    def _iter_subtrees(items):
+        """
+        iterate over the given items and all their in-depth children (order is not defined)
+
+        :type items: Iterable
+        :param items: iterable of `iTree`-objects
+
+        :rtype: Iterator
+        :return: iterator over `iTree`-objects
+        """
+        stack = list(items)
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            item = pop()
+            yield item
+            if item:
+                extend(item._items)
+
+    @staticmethod
+    def _get_index_value(item):
+        # key of the value index (in case of models the value inside the model); the type is part of the key
+        # (like in `_value_equal()` equal values of different types (e.g. 1, True, 1.0) do not match)
+        value = item._value
+        if hasattr(value, 'is_iTValueModel'):
+            value = value.value
+        return type(value), value
+
+    @staticmethod
+    def _get_index_tag(item):
+        # key of the tag index
+        return item._tag
+
+    @staticmethod
+    def _build_deep_index(items, get_key):
+        """
+        create a deep index for the given items (and all their in-depth children)
+
+        The index consists of two dicts:
+
+            * key -> {id(item): item} - the items related to the key (used for the queries)
+            * id(item) -> key - the key the item is stored with (used for the removal)
+
+        Items with unhashable keys are not indexed.
+
+        :type items: Iterable
+        :param items: iterable of `iTree`-objects
+
+        :type get_key: Callable
+        :param get_key: method delivering the key of an item (`_get_index_value()` or `_get_index_tag()`)
+
+        :rtype: tuple
+        :return: (key_dict, item_dict)
+        """
+        deep_index = ({}, {})
+        _iTreePrivate._deep_index_add(deep_index, _iTreePrivate._iter_subtrees(items), get_key)
+        return deep_index
+
+    @staticmethod
+    def _deep_index_add(deep_index, items, get_key):
+        key_dict, item_dict = deep_index
+        for item in items:
+            key = get_key(item)
+            try:
+                bucket = key_dict.get(key)
+            except TypeError:
+                # unhashable keys are not indexed
+                continue
+            item_id = id(item)
+            if bucket is None:
+                key_dict[key] = {item_id: item}
+            else:
+                bucket[item_id] = item
+            item_dict[item_id] = key
+
+    @staticmethod
+    def _deep_index_remove(deep_index, items):
+        key_dict, item_dict = deep_index
+        for item in items:
+            item_id = id(item)
+            try:
+                key = item_dict.pop(item_id)
+            except KeyError:
+                # not indexed
+                continue
+            bucket = key_dict.get(key)
+            if bucket is not None:
+                bucket.pop(item_id, None)
+                if not bucket:
+                    del key_dict[key]
+
+    @staticmethod
+    def _add_to_deep_indexes(itree_item, items):
+        """
+        the given items are added as children to the `iTree`-object -> the items and their in-depth children
+        are added in the deep indexes of the object and of all parents
+
+        :type itree_item: iTree
+        :param itree_item: parent `iTree`-object
+
+        :type items: Iterable
+        :param items: iterable of new children
+        """
+        holders = _iTreePrivate._get_deep_index_holders(itree_item)
+        if holders:
+            items = list(items)
+            for tree, _, _, _, aggregates in holders:
+                if aggregates is not None:
+                    _iTreePrivate._aggregates_add(aggregates, tree._itree, itree_item, items)
+            items = list(_iTreePrivate._iter_subtrees(items))
+            index_add = _iTreePrivate._deep_index_add
+            for _, value_index, tag_index, sorted_indexes, _ in holders:
+                if value_index is not None:
+                    index_add(value_index, items, _iTreePrivate._get_index_value)
+                if tag_index is not None:
+                    index_add(tag_index, items, _iTreePrivate._get_index_tag)
+                if sorted_indexes:
+                    for sorted_index in sorted_indexes:
+                        sorted_index.add(items)
+
+    @staticmethod
+    def _remove_from_deep_indexes(itree_item, items):
+        """
+        the given children are removed from the `iTree`-object -> the items and their in-depth children
+        are removed from the deep indexes of the object and of all parents
+
+        :type itree_item: iTree
+        :param itree_item: parent `iTree`-object
+
+        :type items: Iterable
+        :param items: iterable of removed children
+        """
+        holders = _iTreePrivate._get_deep_index_holders(itree_item)
+        if holders:
+            items = list(items)
+            for tree, _, _, _, aggregates in holders:
+                if aggregates is not None:
+                    _iTreePrivate._aggregates_remove(aggregates, tree._itree, itree_item, items)
+            items = list(_iTreePrivate._iter_subtrees(items))
+            index_remove = _iTreePrivate._deep_index_remove
+            for _, value_index, tag_index, sorted_indexes, _ in holders:
+                if value_index is not None:
+                    index_remove(value_index, items)
+                if tag_index is not None:
+                    index_remove(tag_index, items)
+                if sorted_indexes:
+                    for sorted_index in sorted_indexes:
+                        sorted_index.remove(items)
+
+    @staticmethod
+    def _reindex_value(itree_item):
+        """
+        the value of the `iTree`-object was changed -> update the value indexes and the sorted indexes of
+        all parents (the own value is not part of the own index)
+
+        :type itree_item: iTree
+        :param itree_item: `iTree`-object with the changed value
+        """
+        parent_idx = itree_item._itree_prt_idx
+        if parent_idx is not None:
+            items = (itree_item,)
+            for _, value_index, _, sorted_indexes, _ in _iTreePrivate._get_deep_index_holders(parent_idx[0]):
+                if value_index is not None:
+                    _iTreePrivate._deep_index_remove(value_index, items)
+                    _iTreePrivate._deep_index_add(value_index, items, _iTreePrivate._get_index_value)
+                if sorted_indexes:
+                    for sorted_index in sorted_indexes:
+                        sorted_index.remove(items)
+                        sorted_index.add(items)
+
+    @staticmethod
+    def _reindex_tags(itree_item, items):
+        """
+        the given children of the `iTree`-object are renamed -> update the tag indexes of the object and
+        of all parents
+
+        :type itree_item: iTree
+        :param itree_item: parent `iTree`-object
+
+        :type items: Iterable
+        :param items: iterable of renamed children
+        """
+        items = list(items)
+        for _, _, tag_index, _, _ in _iTreePrivate._get_deep_index_holders(itree_item):
+            if tag_index is not None:
+                _iTreePrivate._deep_index_remove(tag_index, items)
+                _iTreePrivate._deep_index_add(tag_index, items, _iTreePrivate._get_index_tag)
+
+    @staticmethod
+    def _outdate_deep_indexes(itree_item):
+        """
+        the subtree of the `iTree`-object is changed in a way that is not tracked item by item
+        (e.g. replacements or link loading) -> the deep indexes of the object and of all parents are marked as
+        outdated and they will be rebuild in the next query
+
+        :type itree_item: iTree
+        :param itree_item: changed `iTree`-object
+        """
+        for tree, value_index, tag_index, sorted_indexes, aggregates in \
+                _iTreePrivate._get_deep_index_holders(itree_item):
+            if value_index is not None:
+                tree._value_index = None
+            if tag_index is not None:
+                tree._tag_index = None
+            if aggregates is not None:
+                tree._aggregates = None
+            if sorted_indexes:
+                sorted_indexes = tree._sorted_indexes
+                for key in sorted_indexes:
+                    sorted_indexes[key] = None
+
+    # --- subtree aggregates ---------------------------------------------------------------------------
+
+    @staticmethod
+    def _build_aggregates(items, aggregates=None):
+        """
+        calculate the subtree aggregates of the given items and of all their in-depth children
+        (see `deep.enable_aggregates()`)
+
+        :type items: Iterable
+        :param items: iterable of `iTree`-objects
+
+        :type aggregates: dict
+        :param aggregates: dict the aggregates are added to (None - new dict is created)
+
+        :rtype: dict
+        :return: dict id(item) -> [subtree size, subtree height]
+        """
+        if aggregates is None:
+            aggregates = {}
+        # post order iteration (children are calculated before the parent)
+        stack = [(item, False) for item in items]
+        pop, append = stack.pop, stack.append
+        while stack:
+            item, children_done = pop()
+            if not item:
+                aggregates[id(item)] = [0, 0]
+            elif children_done:
+                size = height = 0
+                for child in item._items:
+                    child_size, child_height = aggregates[id(child)]
+                    size += child_size
+                    if child_height >= height:
+                        height = child_height + 1
+                aggregates[id(item)] = [size + len(item), height]
+            else:
+                append((item, True))
+                stack.extend((child, False) for child in item._items)
+        return aggregates
+
+    @staticmethod
+    def _aggregates_add(aggregates, holder_item, itree_item, items):
+        """
+        the given items are added as children to the `iTree`-object -> add the aggregates of the items and update
+        the aggregates of the object and of its parents (up to the holder of the aggregates)
+
+        :type aggregates: dict
+        :param aggregates: aggregates dict of the holder
+
+        :type holder_item: iTree
+        :param holder_item: `iTree`-object that holds the aggregates
+
+        :type itree_item: iTree
+        :param itree_item: parent `iTree`-object
+
+        :type items: list
+        :param items: list of new children
+        """
+        if not items:
+            return
+        _iTreePrivate._build_aggregates(items, aggregates)
+        size = height = 0
+        for item in items:
+            item_size, item_height = aggregates[id(item)]
+            size += item_size + 1
+            if item_height >= height:
+                height = item_height + 1
+        while 1:
+            aggregate = aggregates[id(itree_item)]
+            aggregate[0] += size
+            if height > aggregate[1]:
+                aggregate[1] = height
+            if itree_item is holder_item:
+                break
+            height = aggregate[1] + 1
+            itree_item = itree_item._itree_prt_idx[0]
+
+    @staticmethod
+    def _aggregates_remove(aggregates, holder_item, itree_item, items):
+        """
+        the given children are removed from the `iTree`-object -> delete the aggregates of the items and update
+        the aggregates of the object and of its parents (up to the holder of the aggregates)
+
+        :type aggregates: dict
+        :param aggregates: aggregates dict of the holder
+
+        :type holder_item: iTree
+        :param holder_item: `iTree`-object that holds the aggregates
+
+        :type itree_item: iTree
+        :param itree_item: parent `iTree`-object
+
+        :type items: list
+        :param items: list of removed children (they might still be in the children list of the parent)
+        """
+        removed_ids = set()
+        size = 0
+        for item in items:
+            aggregate = aggregates.get(id(item))
+            if aggregate is not None:
+                size += aggregate[0] + 1
+                removed_ids.add(id(item))
+        if not removed_ids:
+            return
+        for item in _iTreePrivate._iter_subtrees(items):
+            aggregates.pop(id(item), None)
+        update_height = True
+        while 1:
+            aggregate = aggregates[id(itree_item)]
+            aggregate[0] -= size
+            if update_height:
+                # the height must be recalculated from the remaining children
+                height = 0
+                for child in itree_item._items:
+                    child_id = id(child)
+                    if child_id not in removed_ids and aggregates[child_id][1] >= height:
+                        height = aggregates[child_id][1] + 1
+                update_height = height != aggregate[1]
+                aggregate[1] = height
+                removed_ids = ()
+            if itree_item is holder_item:
+                break
+            itree_item = itree_item._itree_prt_idx[0]
+
+    @staticmethod
+    def _get_aggregate(itree_item):
+        """
+        deliver the subtree aggregate of the `iTree`-object from the aggregates of the object or of a parent
+        (outdated aggregates are rebuild)
+
+        :type itree_item: iTree
+        :param itree_item: `iTree`-object
+
+        :rtype: Optional[list]
+        :return: [subtree size, subtree height] or None if no aggregates are active
+        """
+        item = itree_item
+        while item is not None:
+            tree = getattr(item, '_hc_tree', None)
+            if tree is not None:
+                try:
+                    aggregates = tree._aggregates
+                except AttributeError:
+                    pass
+                else:
+                    if aggregates is None:
+                        tree._aggregates = aggregates = _iTreePrivate._build_aggregates((item,))
+                    return aggregates[id(itree_item)]
+            parent_idx = item._itree_prt_idx
+            item = parent_idx[0] if parent_idx is not None else None
+        return None
+
+    # --- copy-on-write copies ---------------------------------------------------------------------
+
+    @staticmethod
+    def _set_copy_on_write(itree_item, source):
+        """
+        put the `iTree`-object in the copy-on-write state, the children will be created from the given source
+        in the moment they are accessed the first time
+
+        :type itree_item: iTree
+        :param itree_item: copy (without children)
+
+        :type source: iTree
+        :param source: read-only `iTree`-object the children are taken from
+        """
+        source_items = source._items
+        if type(source_items) is _iTreeCopyOnWrite:
+            # children are not created in the source too -> we take them from the original source
+            source = source_items._source
+        _iTreePrivate._set_lazy_children(itree_item, source)
+
+    @staticmethod
+    def _is_shared(itree_item):
+        """
+        check if the `iTree`-object is part of the source of copy-on-write copies (the item or one of its parents
+        is shared); the copies take over the values in the moment their children are created
+
+        :type itree_item: iTree
+        :param itree_item: `iTree`-object to be checked
+
+        :rtype: bool
+        :return: True - item is shared (value cannot be changed)
+        """
+        shared_flag = itree_item._SHARED
+        while itree_item is not None:
+            if itree_item._flags & shared_flag:
+                return True
+            parent_idx = itree_item._itree_prt_idx
+            itree_item = parent_idx[0] if parent_idx is not None else None
+        return False
+
+    @staticmethod
+    def _set_lazy_children(itree_item, source):
+        """
+        put the placeholders for the not yet created children in the `iTree`-object
+
+        :type itree_item: iTree
+        :param itree_item: `iTree`-object (without children)
+
+        :param source: `iTree`-object the children are copied from or object which creates the children via
+                       `create_children(itree_item)`; the number of children is taken from `len(source)`
+        """
+        items = _iTreeCopyOnWrite(itree_item, source, '_items')
+        families = _iTreeCopyOnWrite(itree_item, source, '_families')
+        itree_item._items = items
+        itree_item.getitem_by_idx, itree_item.__iter__ = items.__getitem__, items.__iter__
+        # the length is taken from the source (no need to create the children)
+        itree_item.__len__ = source.__len__
+        itree_item._families = families
+        itree_item._getitem_fam, itree_item._get_fam = families.__getitem__, families.get
+        itree_item._setitem_fam = families.__setitem__
+        try:
+            getitem = itree_item._hc_get
+            getitem.getitem_by_idx = items.__getitem__
+            getitem._getitem_fam, getitem._get_fam = families.__getitem__, families.get
+        except AttributeError:
+            pass
+
+    @staticmethod
+    def _create_copy_on_write_children(itree_item, source):
+        """
+        create the children of a copy-on-write copy (one level only); children containing a subtree are
+        put in the copy-on-write state again
+
+        If the copy is tree read-only (e.g. a persistent version) the children are protected too otherwise
+        the tree protection of the source is not taken over.
+
+        :type itree_item: iTree
+        :param itree_item: copy in copy-on-write state
+
+        :type source: iTree
+        :param source: read-only `iTree`-object the children are taken from
+        """
+        itree_class = itree_item.__class__
+        get_copy_args = itree_class._get_copy_args
+        set_copy_on_write = _iTreePrivate._set_copy_on_write
+        if itree_item._flags & itree_item._READ_ONLY_TREE:
+            unprotect_mask = ~0
+        else:
+            unprotect_mask = ~itree_item._READ_ONLY_TREE
+        link_mask = itree_item._LINK_ROOT | itree_item._LINKED | itree_item._PLACEHOLDER
+        sl = []
+        for item in source:
+            if item._flags & link_mask:
+                # linked structures are copied completely
+                new_item = _iTreePrivate._iter_copy(item, get_copy_args)
+            else:
+                new_item = itree_class(*get_copy_args(item))
+                new_item._flags = new_item._flags & unprotect_mask
+                if item:
+                    set_copy_on_write(new_item, item)
+            sl.append(new_item)
+        _iTreePrivate._set_created_children(itree_item, sl)
+
+    @staticmethod
+    def _set_created_children(itree_item, sl):
+        """
+        set the created children of an `iTree`-object in the placeholder state (see `_set_lazy_children()`)
+
+        The families and the parent pointers are created in one pass, the placeholders are replaced.
+
+        :type itree_item: iTree
+        :param itree_item: `iTree`-object in placeholder state
+
+        :type sl: list
+        :param sl: list of the new children (without parent)
+        """
+        families = {}
+        get_family = families.get
+        idx = 0
+        for new_item in sl:
+            tag = new_item._tag
+            family = get_family(tag)
+            if family is None:
+                families[tag] = family = []
+            new_item._itree_prt_idx = [itree_item, idx, family.__len__()]
+            family.append(new_item)
+            idx = idx + 1
+        if BLIST_SWITCH != -1:
+            for tag, family in families.items():
+                if len(family) > BLIST_SWITCH:
+                    families[tag] = itree_list(family)
+        if sl:
+            _iTreePrivate._set_items(itree_item, itree_list(sl))
+        else:
+            _iTreePrivate._set_items_empty(itree_item)
+        _iTreePrivate._set_families(itree_item, families)
+
+    @staticmethod
+    def _iter_created(itree_item):
+        """
+        iterate over all already created items in the subtree (parents before children); the not yet created
+        children of copy-on-write items are skipped
+
+        :type itree_item: iTree
+        :param itree_item: root of the subtree (not part of the iteration)
+
+        :rtype: Iterator
+        :return: iterator over the `iTree`-objects
+        """
+        items = [itree_item]
+        while items:
+            item = items.pop()
+            if item and type(item._items) is not _iTreeCopyOnWrite:
+                for sub_item in item._items:
+                    yield sub_item
+                    items.append(sub_item)
+
+    # --- item integration -------------------------------------------------------------------------
+
+
+    @staticmethod
+    def _iter_extend(itree_item, items, flags_deep=0,init=False):
+        """
+        Generator which iterates over items given and extends them into the `iTree`-object
+
+        The generator extends the items to the families and yields the items to be extended to
+        the super() blist-object of `iTree`.
+
+        This is the main extend function and the additional parameters are used for instance `iTree`-objects too.
+
+        .. note::
+               In case the items have already a parent an implicit copy will be made. We do this because
+               we might get an `iTree`-object as `extend_items`-parameter and then the children will have automatically
+               a parent.
+
+        :type param: Iterable
+        :param items: iterable object that contains `iTree`-objects as items it can be:
+
+                        * iterator or generator of `iTree`-objects (using next)
+                        * `iTree`-object (children will be copied in this case
+                        * iterable of `iTree`-objects (list, tuple, ...)
+                        * argument list for `iTree`-instance ( ´__init__()´ )(created by ´get_init_args()´
+                          or ´get_init_args_deep()´)
+                        * iterator or generator of value-objects (using next) - implicit `iTree`objects created
+                        * iterable of value-objects (list, tuple, ...)- implicit `iTree`objects created
+
+        :type _decoder: Option[Callable]
+        :param _decoder: _decoder internal parameter used for load/loads operations decodes tags and values
+
+        :type flags_deep: int
+        :param flags_deep: set the given flags deep in the tree
+
+        :rtype: Iterator/Generator
+        :return: An iterator of all items to be added in super_class (blist)
+        """
+        # Implementation state: ready, tested, doc ok
+        itree_class = itree_item.__class__
+        if init:
+            idx=0
+        else:
+            idx = len(itree_item)
+            if hasattr(items,'_itree_prt_idx') and items.root is itree_item.root:
+                # here we must create an independent object if not we might implicit extend the source in parallel
+                items=items.copy()
+        if idx:
+            # make multi called functions local:
+            fs_getitem = itree_item._get_fam
+            fs_setitem = itree_item._setitem_fam
+        else: # empty!
+            # In the moment the first child is added we set all pointers to the quick access functions
+            families = {}
+            _iTreePrivate._set_families(itree_item, families)
+            fs_getitem, fs_setitem = families.get, families.__setitem__
+        if flags_deep:
+            set_flags_deep=_iTreePrivate._set_flags_deep
+            for item in items:
+                if hasattr(item, '_itree_prt_idx'):
+                    if item._itree_prt_idx:
+                        item = item.__copy__()
+                else:
+                    item = itree_class(*item) if type(item) is list else itree_class(value=item)
+                tag = item._tag
+                family = fs_getitem(tag)
+                if family is None:
+                    fs_setitem(tag, [item])
+                    item._itree_prt_idx = [itree_item, idx, 0]
+                else:
+                    fm_idx = family.__len__()
+                    family.append(item)
+                    if fm_idx == BLIST_SWITCH:
+                        itree_item._setitem_fam(tag, itree_list(family))
+                    item._itree_prt_idx = [itree_item, idx, fm_idx]
+                set_flags_deep(item,flags_deep, _init=True)
+                yield item  # yields the item to extend it to super() list
+                idx = idx + 1
+        else:
+            for item in items:
+                if hasattr(item, '_itree_prt_idx'):
+                    if item._itree_prt_idx:
+                        item = item.__copy__()
+                else:
+                    item = itree_class(*item) if type(item) is list else itree_class(value=item)
+                # append to tag family
+                tag = item._tag
+                family = fs_getitem(tag)
+                if family is None:
+                    fs_setitem(tag, [item])
+                    item._itree_prt_idx = [itree_item, idx, 0]
+                else:
+                    fm_idx = family.__len__()
+                    family.append(item)
+                    if fm_idx == BLIST_SWITCH:
+                        itree_item._setitem_fam(tag, itree_list(family))
+                    item._itree_prt_idx = [itree_item, idx, fm_idx]
+                yield item  # yields the item to extend it to super() list
+                idx = idx + 1
+
+    @staticmethod
+    def _append_item(itree_item, item):
+        """
+        Internal append for building `iTrees` in internal load operations (we do not check any properties here)
+        (is quicker than normal append (makes less plausibility checks))
+
+        :type itree_item: iTree
+        :param itree_item: iTree where the item should be appended
+
+        :type item: iTree
+        :param item: `iTree`-object to be appended
+
+        :rtype: iTree
+        :return: Delivers the appended iTree-item
+                 (it might be useful for the user to get the updated information of the object).
+        """
+        # Implementation state: ready, tested, doc ok
+        # append item to super list:
+        tag = item._tag
+        if itree_item:
+            abs_idx = len(itree_item)
+            itree_item._items.append(item)
+            # append item to family
+            family = itree_item._get_fam(tag)
+            if family is None:
+                itree_item._setitem_fam(tag, [item])
+                item._itree_prt_idx = [itree_item, abs_idx, 0]
+            else:
+                fm_idx = family.__len__()
+                family.append(item)
+                if fm_idx == BLIST_SWITCH:
+                    itree_item._setitem_fam(tag, itree_list(family))
+                item._itree_prt_idx = [itree_item, abs_idx, fm_idx]
+        else:
+            # In the moment the item gets the first child we set all pointers for the quick access functions
+            # items
+            sl = itree_item._ONE_ITEM_LIST.copy()
+            sl[0] = item
+            _iTreePrivate._set_items(itree_item, sl)
+            # family
+            _iTreePrivate._set_families(itree_item, {tag: sl.copy()})
+            item._itree_prt_idx = [itree_item, 0, 0]
+        return item
+
+    @staticmethod
+    def _append_item_left(itree_item, item):
+        """
+        Internal append for building `iTrees` in internal load operations (we do not check any properties here)
+        (is quicker than normal append (makes less plausibility checks))
+
+        :type itree_item: iTree
+        :param itree_item: iTree where the item should be appended
+
+        :type item: iTree
+        :param item: `iTree`-object to be appended
+
+        :rtype: iTree
+        :return: Delivers the appended item ititree_item
+                 (it might be useful for the user to get the updated information of the object).
+        """
+        # Implementation state: ready, tested, doc ok
+        # append item to super list:
+        sl = itree_item._items
+        sl.insert(0,item)
+        # append item to family
+        tag = item._tag
+        family = itree_item._get_fam(tag)
+        if family is None:
+            itree_item._setitem_fam(tag, [item])
+        else:
+            family.insert(0, item)
+        item._itree_prt_idx = [itree_item, 0, 0]
+        return item
+
+    @staticmethod
+    def _append(itree_item, item=NoValue):
+        """
+        Internal append for building iTrees
+        (ignores read only and is quicker than normal append (makes less plausibility checks)
+
+        :except: In case `iTree`-object has already a parent a `RecursionError` will be raised
+                 Other exceptions might come up in case the `iTree` is protected (tree read-only mode).
+
+
+        :type item: Union[iTree,object]
+        :param item: `iTree`-object to be appended
+
+        :rtype: iTree
+        :return: Delivers the appended item itself
+                 (it might be useful for the user to get the updated information of the object).
+        """
+        # Implementation state: ready, tested, doc ok
+        if (
+                itree_item._flags & itree_item._IS_TREE_PROTECTED
+                and itree_item.is_link_root
+                and hasattr(itree_item, '_itree_prt_idx')
+                and itree_item._flags & (itree_item._LINKED | itree_item._LINK_ROOT | itree_item._PLACEHOLDER)
+        ):
+            raise TypeError('Linked items cannot be appended to linked item as local item')
+        _iTreePrivate._append_item(itree_item, item)
+
+    @staticmethod
+    def _get_family_insertion_idx(family, item_idx):
+        """
+        Internal function to find the family index for insert as quick as possible,
+        it uses a bisect over the family positions based on absolute indexes (no copies of the family are created)
+
+        The absolute indexes of the family members are taken from the cache if it matches, a member
+        shifted by one position (e.g. after an insert in the children list) is fixed directly. Only in other cases
+        the `idx` property is used.
+
+        :param family: family list
+        :param item_idx: absolute index of item to be searched for
+        :return: family index
+        """
+        lo, hi = 0, len(family)
+        if not hi:
+            return 0
+        siblings = family[0]._itree_prt_idx[0]._items
+        size = len(siblings)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            member = family[mid]
+            prt_idx = member._itree_prt_idx
+            idx = prt_idx[1]
+            if idx >= size or siblings[idx] is not member:
+                idx = idx + 1
+                if idx < size and siblings[idx] is member:
+                    prt_idx[1] = idx
+                else:
+                    idx = member.idx
+            if idx < item_idx:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    @staticmethod
+    def _get_copy_args(itree_item):
+        value = itree_item._value
+        flags = itree_item._flags
+        if itree_item.is_link_root:
+            if flags:
+                return (
+                    (
+                        itree_item._tag,
+                        value,
+                        None,
+                        iTLink(itree_item._link.file_path, itree_item._link.target_path),
+                        flags
+                    )
+                    if callable(value.__hash__)
+                    else (
+                        itree_item._tag,
+                        copy.copy(value),
+                        None,
+                        iTLink(itree_item._link.file_path, itree_item._link.target_path),
+                        flags
+                    )
+                )
+            else:
+                return (
+                    (
+                        itree_item._tag,
+                        value,
+                        None,
+                        iTLink(itree_item._link.file_path, itree_item._link.target_path)
+                    )
+                    if callable(value.__hash__)
+                    else (
+                        itree_item._tag,
+                        copy.copy(value),
+                        None,
+                        iTLink(itree_item._link.file_path, itree_item._link.target_path)
+                    )
+                )
+        elif flags:
+            return (
+                   (itree_item._tag, value, None, None, flags)
+                   if callable(value.__hash__)
+                   else (itree_item._tag, copy.copy(value), None, None, flags)
+            )
+        elif callable(value.__hash__):
+            return (itree_item._tag, value)
+        else:
+            return (itree_item._tag, copy.copy(value))
+
+    @staticmethod
+    def _get_args_skip_subtree(itree_item):
+        flags = itree_item._flags
+        if itree_item.is_link_root:
+            if flags:
+                return itree_item._tag, itree_item._value,None,iTLink(itree_item._link.file_path, itree_item._link.target_path),flags
+            else:
+                return itree_item._tag,itree_item._value,None,iTLink(itree_item._link.file_path, itree_item._link.target_path)
+        elif flags:
+                return itree_item._tag, itree_item._value, None, None, flags
+        else:
+            return itree_item._tag, itree_item._value
+
+    @staticmethod
+    def _get_deepcopy_args(itree_item):
+        flags = itree_item._flags
+        if itree_item.is_link_root:
+            if flags:
+                return (
+                        itree_item._tag,
+                        copy.deepcopy(itree_item._value),
+                        None,
+                        iTLink(itree_item._link.file_path, itree_item._link.target_path),
+                        flags
+                       )
+
+            else:
+                return (
+                        itree_item._tag,
+                        copy.deepcopy(itree_item._value),
+                        None,
+                        iTLink(itree_item._link.file_path, itree_item._link.target_path)
+                        )
+        elif flags:
+                return (itree_item._tag, copy.deepcopy(itree_item._value), None, None, flags)
+        return itree_item._tag, copy.deepcopy(itree_item._value)
+
+    # --- iterative iterators --------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_deep_sub_iterator( items, target):
+        for item in items:
+            with suppress(KeyError, IndexError):
+                result = item.__getitem__(target)
+                if hasattr(result, '_itree_prt_idx'):
+                    yield result
+                else:
+                    for i in result:
+                        yield i
+
+
+    # copy related iterators
+
+    @staticmethod
+    def _iter_copy(itree_item,get_copy_args):
+        """
+        create a copy of this item
+
+        The helper method runs the copy in a iterative (non-recursive way)
+
+        :param itree_item: item to be copied
+
+        :param get_copy_args: argument creation method should be one of:
+                              * _get_copy_args -> normal copy
+                              * _get_deepcopy_args -> deepcopy
+                              * _get_args_skip_subtree  -> copy and keep value references
+
+        :return: copied iTree object
+        """
+        # Iterative copy required
+        itree_class=itree_item.__class__
+        append_item=_iTreePrivate._append_item
+        new_itree = itree_class(*get_copy_args(itree_item))
+        if itree_item:
+            none_tuple = NONE_TUPLE
+            items = [new_itree]
+            iterators = [itree_item.__iter__()]  # in Python 3.9 lists are quicker than deque
+            while iterators:
+                for item in iterators[-1]:
+                    if item:
+                        iterators.extend((none_tuple,item.__iter__()))
+                        items.append(append_item(items[-1], itree_class(*get_copy_args(item))))
+                        break
+                    elif item is None:
+                        del items[-1]
+                    else:
+                        append_item(items[-1], itree_class(*get_copy_args(item)))
+                else: # for loop is finished and not broken
+                    del iterators[-1]
+        return new_itree
+
+    # link related iterators
+
+    @staticmethod
+    def _convert_to_linked_item_chained(root_item):
+        """
+        helper function that creates a linked clone of a normal item
+        helper method is need in the load_links method
+
+        :param root_item: item to be "cloned"
+
+        :return: converted item
+        """
+        get_copy_args=_iTreePrivate._get_args_skip_subtree
+        append_item=_iTreePrivate._append_item
+        itree_class = root_item.__class__
+        linked_flag = root_item._LINKED
+        if root_item.is_linked:
+            return root_item
+        new_item = itree_class(root_item._tag,
+                               copy.copy(root_item._value),
+                               flags=root_item._flags | linked_flag)
+        if root_item:
+            iterator = root_item.__iter__()
+            none_tuple=NONE_TUPLE
+            items = [new_item]
+            with suppress(StopIteration):
+                while 1:
+                    item=next(iterator)
+                    if item:
+                        iterator = chain(item.__iter__(), none_tuple, iterator)
+                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
+                        new._flags=new._flags|linked_flag
+                        items.append(new)
+                    elif item is None:
+                        del items[-1]
+                    else:
+                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
+                        new._flags=new._flags|linked_flag
+        return new_item
+
+    @staticmethod
+    def _convert_to_linked_item(root_item):
+        """
+        helper function that creates a linked clone of a normal item
+        helper method is need in the load_links method
+
+        :param root_item: item to be "cloned"
+
+        :return: converted item
+        """
+        get_copy_args = _iTreePrivate._get_args_skip_subtree
+        append_item = _iTreePrivate._append_item
+        itree_class = root_item.__class__
+        linked_flag = root_item._LINKED
+        if root_item.is_linked:
+            return root_item
+        new_item = itree_class(root_item._tag,
+                               copy.copy(root_item._value),
+                               flags=root_item._flags | linked_flag)
+
+        if root_item:
+            iterators=[root_item.__iter__()] # in Python 3.9 lists are quicker than deque
+            none_tuple=NONE_TUPLE
+            items = [new_item]
+            while iterators:
+                for item in iterators[-1]:
+                    if item:
+                        iterators.extend((none_tuple, item.__iter__()))
+                        new = append_item(items[-1], itree_class(*get_copy_args(item)))
+                        new._flags = new._flags | linked_flag
+                        items.append(new)
+                        break
+                    elif item is None:
+                        del iterators[-1]
+                        break
+                    else:
+                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
+                        new._flags=new._flags|linked_flag
+                else: # for loop is finished and not broken
+                    del iterators[-1]
+        return new_item
+
+    @staticmethod
+    def _convert_to_local_item_chained(root_item,copy_subtree=True):
+        """
+        helper function that creates a linked clone of a normal item
+        helper method is need in the load_links method
+
+        :param root_item: item to be "cloned"
+
+        :return: converted item
+        """
+        get_copy_args=_iTreePrivate._get_args_skip_subtree
+        append_item=_iTreePrivate._append_item
+        if not root_item.is_linked:
+            # is already local
+            return root_item
+        itree_class = root_item.__class__
+        linked_flag = root_item._LINKED
+        cp = copy.copy
+
+        new_item = itree_class(root_item._tag,
+                               cp(root_item._value),
+                               flags=(root_item._flags & (~linked_flag)))
+        new_item._link = iTLink(link_item=root_item)
+        if root_item and copy_subtree:
+            iterator = root_item.__iter__()
+            none_tuple=NONE_TUPLE
+            items = [new_item]
+            with suppress(StopIteration):
+                while 1:
+                    item=next(iterator)
+                    if item:
+                        iterator = chain(item.__iter__(), none_tuple, iterator)
+                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
+                        new._flags=new._flags & (~linked_flag)
+                        items.append(new)
+                    elif item is None:
+                        del items[-1]
+                    else:
+                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
+                        new._flags=new._flags & (~linked_flag)
+        return new_item
+
+    @staticmethod
+    def _convert_to_local_item(root_item,copy_subtree=True):
+        """
+        helper function that creates a linked clone of a normal item
+        helper method is need in the load_links method
+
+        :param root_item: item to be "cloned"
+
+        :return: converted item
+        """
+        get_copy_args=_iTreePrivate._get_args_skip_subtree
+        append_item=_iTreePrivate._append_item
+        if not root_item.is_linked:
+            # is already local
+            return root_item
+        itree_class = root_item.__class__
+        linked_flag = root_item._LINKED
+        cp = copy.copy
+
+        new_item = itree_class(root_item._tag,
+                               cp(root_item._value),
+                               flags=(root_item._flags & (~linked_flag)))
+        new_item._link = iTLink(link_item=root_item)
+        if root_item and copy_subtree:
+            iterators=[root_item.__iter__()] # in Python 3.9 lists are quicker than deque
+            none_tuple=NONE_TUPLE
+            items = [new_item]
+            while iterators:
+                for item in iterators[-1]:
+                    if item:
+                        iterators.extend((none_tuple, item.__iter__()))
+                        new = append_item(items[-1], itree_class(*get_copy_args(item)))
+                        new._flags = new._flags | linked_flag
+                        items.append(new)
+                        break
+                    elif item is None:
+                        del iterators[-1]
+                        break
+                    else:
+                        new=append_item(items[-1], itree_class(*get_copy_args(item)))
+                        new._flags=new._flags|linked_flag
+                else: # for loop is finished and not broken
+                    del iterators[-1]
+        return new_item
+
+    @staticmethod
+    def _iter_locals_add_placeholders(itree_item):
+        if itree_item:
+            itree_class=itree_item.__class__
+            placeholder_flag=itree_item._PLACEHOLDER
+            add_placeholder=False
+            tag_dict={i.tag:-1 for i in itree_item}
+            for item in itree_item:
+                tag=item.tag
+                item._itree_prt_idx[2]=k=tag_dict[tag]=tag_dict[tag]+1
+                if item.is_linked and add_placeholder:
+                    yield itree_class(item._tag,k, flags=placeholder_flag)  # placeholder item (we store the index in the value)
+                    add_placeholder = False
+                else:
+                    yield item
+                    add_placeholder = True
+
+    @staticmethod
+    def _iter_deep_locals_add_placeholders_filtered(itree_item,filter_method):
+        """
+        Most important iterator which iterates over all elements top->down. It returns the index_path of the items.
+        Internally the index path in the cache are recalculated during the iteration.
+
+        The design of the iterator allows an iteration speed which is somehow 4x slower as
+        normal list iterations which is very quick for a python solution!
+        The solution is iterative not recursive to avoid RecursionErrors for deep trees.
+
+        :type itree_item: iTree
+        :param itree_item: root item
+
+        :rtype: Iterator
+        :return: deep iterator over all index-paths (`.idx_path` attribute)
+        """
+        iter_locals_add_placeholders=_iTreePrivate._iter_locals_add_placeholders
+        if itree_item:
+            iterators = [filter(filter_method,itree_item.__iter__())]  # in Python 3.9 lists are quicker than deque
+            none_tuple = NONE_TUPLE
+            tag_index_dict = [{tag: -1 for tag in itree_item._families.keys()}]
+            depth=1
+            while iterators:
+                for item in iterators[-1]:
+                    if item:
+                        tag = item._tag
+                        tag_dict = tag_index_dict[-1]
+                        tag_dict[tag] = fidx = tag_dict[tag] + 1
+                        yield depth,fidx, item
+                        if item.is_link_root:
+                            iterators.extend((none_tuple, filter(filter_method,iter_locals_add_placeholders(item))))
+                        else:
+                            iterators.extend((none_tuple, filter(filter_method,item.__iter__())))
+                        depth = depth + 1
+                        tag_index_dict.append({tag: -1 for tag in item._families.keys()})
+                        break
+                    elif item is None:
+                        depth=depth-1
+                        del tag_index_dict[-1]
+                        del iterators[-1]
+                        break
+                    else:
+                        tag = item._tag
+                        tag_dict = tag_index_dict[-1]
+                        tag_dict[tag] = fidx = tag_dict[tag] + 1
+                        yield depth,fidx, item
+                else:  # for loop is finished and not broken
+                    del iterators[-1]
+
+    @staticmethod
+    def _iter_deep_locals_add_placeholders(itree_item):
+        """
+        Most important iterator which iterates over all elements top->down.
+
+        The design of the iterator allows an iteration speed which is somehow 5x slower as
+        normal list iterations which is very quick for a python solution!
+        The solution is iterative not recursive to avoid RecursionErrors for deep trees.
+
+        :type itree_item: iTree
+        :param itree_item: root item
+
+        :rtype: Iterator
+        :return: deep iterator over all items
+        """
+        iter_locals_add_placeholders=_iTreePrivate._iter_locals_add_placeholders
+        if itree_item:
+            iterators = [itree_item.__iter__()]  # in Python 3.9 lists are quicker than deque
+            none_tuple = NONE_TUPLE
+            tag_index_dict = [{tag: -1 for tag in itree_item._families.keys()}]
+            depth=1
+            while iterators:
+                for item in iterators[-1]:
+                    if item:
+                        tag = item._tag
+                        tag_dict = tag_index_dict[-1]
+                        tag_dict[tag] = fidx = tag_dict[tag] + 1
+                        yield depth,fidx, item
+                        if item.is_link_root:
+                            iterators.extend((none_tuple, iter_locals_add_placeholders(item)))
+                        else:
+                            iterators.extend((none_tuple, item.__iter__()))
+                        depth = depth + 1
+                        tag_index_dict.append({tag: -1 for tag in item._families.keys()})
+                        break
+                    elif item is None:
+                        depth=depth-1
+                        del tag_index_dict[-1]
+                        del iterators[-1]
+                        break
+                    else:
+                        tag = item._tag
+                        tag_dict = tag_index_dict[-1]
+                        tag_dict[tag] = fidx = tag_dict[tag] + 1
+                        yield depth,fidx, item
+                else:  # for loop is finished and not broken
+                    del iterators[-1]
@@ -0,0 +1,1069 @@
+"""
+This code is taken from the itertree package:
+  _ _____ _____ _____ _____ _____ _____ _____
+ | |_   _|   __| __  |_   _| __  |   __|   __|
+ |-| | | |   __|    -| | | |    -|   __|   __|
+ |_| |_| |_____|__|__| |_| |__|__|_____|_____|
+
+https://pypi.org/project/itertree/
+GIT Home:
+https://github.com/BR1py/itertree
+The documentation can be found here:
+https://itertree.readthedocs.io/en/latest/index.html
+
+The code is published under MIT license
+For more information see: https://en.wikipedia.org/wiki/MIT_License
+
+CONTENT DESCRIPTION:
+
+This part of code contains the binary iTree serializer
+
+Use it via the `itree_serializer` parameter: `tree.dump(file_path, itree_serializer=iTStdBinarySerializer)` and
+`iTree().load(file_path, itree_serializer=iTStdBinarySerializer)`.
+
+File format (all numbers little endian):
+
+    * magic bytes `ITREEBIN`
+    * header: length (uint32) + JSON dict (type and version)
+    * item records: length (uint64) + depth (uint32) + number of arguments (uint8) + encoded arguments
+    * end mark: length 0 (uint64)
+    * trailer: hash flag (uint8) + sha256 digest of the records (32 bytes, only if flag is set)
+    * index (not packed data only): record offsets (uint64 per record, relative to the first record),
+      record numbers behind the subtrees (uint64 per record) and number of children (uint32 per record)
+    * index footer: number of records (uint64) + magic bytes `ITREEIDX`
+
+The arguments are encoded as type code (uint8) + type specific data. bytes and numpy arrays are stored as raw
+buffers (written via the buffer protocol without conversion, loaded via `np.frombuffer()`). Objects not supported
+by the binary encoding are stored in the JSON representation of `iTStdJSONSerializer2`.
+
+Not packed files can be loaded lazy: `iTree().load(file_path, itree_serializer=iTStdBinarySerializer, lazy=True)`.
+The file is memory mapped and the items are created level by level in the moment the children are accessed
+(the index allows to skip the not accessed subtrees without reading them).
+"""
+
+from __future__ import absolute_import
+
+import gzip
+import hashlib
+import io
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict, deque
+from itertools import chain, islice
+
+from .itree_json_serialize import iTStdJSONSerializer2, JSON, DT_SERIALIZE_MAJOR_VERSION
+from ..itree_helpers import Tag
+
+try:
+    import numpy as np
+
+    # only needed in case of numpy arrays in data
+    np_loaded = True
+except ImportError:
+    np = None
+    np_loaded = False
+
+BIN_SERIALIZE_VERSION = "2.0.2"
+
+_MAGIC = b'ITREEBIN'
+_INDEX_MAGIC = b'ITREEIDX'
+
+_UINT8 = struct.Struct('<B')
+_UINT32 = struct.Struct('<I')
+_UINT64 = struct.Struct('<Q')
+_INT64 = struct.Struct('<q')
+_FLOAT64 = struct.Struct('<d')
+_RECORD_HEAD = struct.Struct('<IB')  # depth, number of arguments
+_INDEX_FOOTER = struct.Struct('<Q8s')  # number of records, magic
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+class iTStdBinarySerializer(iTStdJSONSerializer2):
+    """
+    Binary serializer for iTrees (length prefixed item records with raw buffers for bytes and numpy arrays)
+
+    The interface is the same as in `iTStdJSONSerializer2` (dumps(), dump(), loads(), load()), the data
+    is always stored with header.
+    """
+
+    # type codes of the encoded objects
+    NONE_CODE = 0
+    TRUE_CODE = 1
+    FALSE_CODE = 2
+    INT_CODE = 3
+    BIG_INT_CODE = 4
+    FLOAT_CODE = 5
+    STR_CODE = 6
+    BYTES_CODE = 7
+    LIST_CODE = 8
+    TUPLE_CODE = 9
+    SET_CODE = 10
+    DEQUE_CODE = 11
+    DICT_CODE = 12
+    ODICT_CODE = 13
+    NP_CODE = 14
+    CONST_CODE = 15
+    JSON_CODE = 16
+
+    ITER_CODES = {list: LIST_CODE, tuple: TUPLE_CODE, set: SET_CODE, deque: DEQUE_CODE}
+    ITER_CLASSES = {LIST_CODE: list, TUPLE_CODE: tuple, SET_CODE: set, DEQUE_CODE: deque}
+
+    # raw buffers of this size and larger are written directly (not copied into the record buffer)
+    RAW_SIZE = 1 << 12
+    # the binary data contains long zero sequences which are compressed very slow with the highest level
+    COMPRESS_LEVEL = 6
+
+    def __init__(self, itree_class):
+        super(iTStdBinarySerializer, self).__init__(itree_class)
+        self._encoders = {
+            type(None): self._encode_none,
+            bool: self._encode_bool,
+            int: self._encode_int,
+            float: self._encode_float,
+            str: self._encode_str,
+            bytes: self._encode_bytes,
+            list: self._encode_iter,
+            tuple: self._encode_iter,
+            set: self._encode_iter,
+            deque: self._encode_iter,
+            dict: self._encode_dict,
+            OrderedDict: self._encode_dict,
+        }
+        if np_loaded:
+            self._encoders[np.ndarray] = self._encode_numpy
+
+    # --- encoding ---------------------------------------------------------------------------------
+
+    def encode(self, o, out):
+        """
+        encode the object and add the data to the given output list
+
+        :param o: object to be encoded
+        :param out: output list; the last entry is the current bytearray, raw buffers are added as
+                    separate entries (followed by a new bytearray)
+        """
+        encoder = self._encoders.get(type(o))
+        if encoder is None:
+            self._encode_other(o, out)
+        else:
+            encoder(o, out)
+
+    def _encode_none(self, o, out):
+        out[-1].append(self.NONE_CODE)
+
+    def _encode_bool(self, o, out):
+        out[-1].append(self.TRUE_CODE if o else self.FALSE_CODE)
+
+    def _encode_int(self, o, out):
+        buf = out[-1]
+        if _INT64_MIN <= o <= _INT64_MAX:
+            buf.append(self.INT_CODE)
+            buf += _INT64.pack(o)
+        else:
+            data = str(o).encode('ascii')
+            buf.append(self.BIG_INT_CODE)
+            buf += _UINT32.pack(len(data))
+            buf += data
+
+    def _encode_float(self, o, out):
+        buf = out[-1]
+        buf.append(self.FLOAT_CODE)
+        buf += _FLOAT64.pack(o)
+
+    def _encode_str(self, o, out):
+        data = o.encode('utf8', errors='surrogatepass')
+        buf = out[-1]
+        buf.append(self.STR_CODE)
+        buf += _UINT32.pack(len(data))
+        buf += data
+
+    def _add_raw(self, data, out):
+        """
+        add a raw buffer (bytes-like object with item size 1) to the output
+        """
+        if len(data) >= self.RAW_SIZE:
+            # large buffers are not copied
+            out.append(data)
+            out.append(bytearray())
+        else:
+            out[-1] += data
+
+    def _encode_bytes(self, o, out):
+        buf = out[-1]
+        buf.append(self.BYTES_CODE)
+        buf += _UINT64.pack(len(o))
+        self._add_raw(o, out)
+
+    def _encode_iter(self, o, out):
+        buf = out[-1]
+        buf.append(self.ITER_CODES[type(o)])
+        buf += _UINT32.pack(len(o))
+        encode = self.encode
+        for i in o:
+            encode(i, out)
+
+    def _encode_dict(self, o, out):
+        buf = out[-1]
+        buf.append(self.DICT_CODE if type(o) is dict else self.ODICT_CODE)
+        buf += _UINT32.pack(len(o))
+        encode = self.encode
+        for k, v in o.items():
+            encode(k, out)
+            encode(v, out)
+
+    def _encode_numpy(self, o, out):
+        dtype = o.dtype
+        if dtype.hasobject or dtype.fields is not None:
+            # no raw data available
+            self._encode_other(o, out)
+            return
+        dtype_str = dtype.str.encode('ascii')
+        # flat byte view on the array data (copy only in case the array is not contiguous)
+        data = memoryview(np.ascontiguousarray(o).reshape(-1).view(np.uint8))
+        buf = out[-1]
+        buf.append(self.NP_CODE)
+        buf.append(len(dtype_str))
+        buf += dtype_str
+        buf.append(o.ndim)
+        for i in o.shape:
+            buf += _UINT64.pack(i)
+        buf += _UINT64.pack(len(data))
+        self._add_raw(data, out)
+
+    def _encode_other(self, o, out):
+        if type(o) is type and o in self.TRANSLATE_OBJ2KEY:
+            buf = out[-1]
+            buf.append(self.CONST_CODE)
+            buf.append(self.TRANSLATE_OBJ2KEY[o])
+            return
+        # not supported in the binary encoding -> JSON representation
+        json_obj = self.convert_to_json_item(o)
+        try:
+            data = JSON.dumps(json_obj)
+        except TypeError as e:
+            raise TypeError('%s -> %s' % (str(e), repr(o)))
+        if type(data) is str:
+            data = data.encode('utf8', errors='backslashreplace')
+        buf = out[-1]
+        buf.append(self.JSON_CODE)
+        buf += _UINT32.pack(len(data))
+        buf += data
+
+    # --- decoding ---------------------------------------------------------------------------------
+
+    def decode(self, data, pos):
+        """
+        decode the object at the given position
+
+        :param data: record data (bytearray or memoryview; numpy arrays are created as views on this buffer)
+        :param pos: start position of the object
+        :return: tuple (object, position after the object)
+        """
+        code = data[pos]
+        pos += 1
+        if code == self.INT_CODE:
+            return _INT64.unpack_from(data, pos)[0], pos + 8
+        if code == self.STR_CODE:
+            size = _UINT32.unpack_from(data, pos)[0]
+            pos += 4
+            return str(data[pos:pos + size], 'utf8', 'surrogatepass'), pos + size
+        if code == self.NONE_CODE:
+            return None, pos
+        if code == self.FLOAT_CODE:
+            return _FLOAT64.unpack_from(data, pos)[0], pos + 8
+        if code == self.TRUE_CODE:
+            return True, pos
+        if code == self.FALSE_CODE:
+            return False, pos
+        if code == self.BYTES_CODE:
+            size = _UINT64.unpack_from(data, pos)[0]
+            pos += 8
+            return bytes(data[pos:pos + size]), pos + size
+        if code in self.ITER_CLASSES:
+            size = _UINT32.unpack_from(data, pos)[0]
+            pos += 4
+            items = []
+            decode = self.decode
+            for _ in range(size):
+                item, pos = decode(data, pos)
+                items.append(item)
+            return self.ITER_CLASSES[code](items), pos
+        if code == self.DICT_CODE or code == self.ODICT_CODE:
+            size = _UINT32.unpack_from(data, pos)[0]
+            pos += 4
+            items = []
+            decode = self.decode
+            for _ in range(size):
+                key, pos = decode(data, pos)
+                value, pos = decode(data, pos)
+                items.append((key, value))
+            return (dict if code == self.DICT_CODE else OrderedDict)(items), pos
+        if code == self.NP_CODE:
+            return self._decode_numpy(data, pos)
+        if code == self.CONST_CODE:
+            return self.TRANSLATE_KEY2OBJ[data[pos]], pos + 1
+        if code == self.BIG_INT_CODE:
+            size = _UINT32.unpack_from(data, pos)[0]
+            pos += 4
+            return int(str(data[pos:pos + size], 'ascii')), pos + size
+        if code == self.JSON_CODE:
+            size = _UINT32.unpack_from(data, pos)[0]
+            pos += 4
+            json_data = bytes(data[pos:pos + size])
+            return self.convert_from_json_obj(self._parse_json(json_data)), pos + size
+        raise SyntaxError('Unknown type code %i found in binary data' % code)
+
+    def _decode_numpy(self, data, pos):
+        if not np_loaded:
+            raise ImportError('numpy is required to load the numpy arrays stored in the data')
+        size = data[pos]
+        pos += 1
+        dtype = np.dtype(str(data[pos:pos + size], 'ascii'))
+        pos += size
+        ndim = data[pos]
+        pos += 1
+        shape = struct.unpack_from('<%iQ' % ndim, data, pos)
+        pos += 8 * ndim
+        size = _UINT64.unpack_from(data, pos)[0]
+        pos += 8
+        # the array is a view on the record buffer (no copy)
+        array = np.frombuffer(data, dtype, size // dtype.itemsize, pos).reshape(shape)
+        return array, pos + size
+
+    # --- dump -------------------------------------------------------------------------------------
+
+    def _create_header(self, data_hash=None):
+        """
+        create the binary header (magic bytes and JSON dict with type and version)
+
+        :param data_hash: not used (the hash is stored in the trailer)
+
+        :return: bytes
+        """
+        class_name = self.itree_class.__name__
+        if class_name == 'iTree':
+            full_name = 'itertree.iTree'
+        else:
+            full_name = self.itree_class.__module__ + '.' + class_name
+        header = JSON.dumps({'TYPE': full_name, 'VERSION': BIN_SERIALIZE_VERSION})
+        if type(header) is str:
+            header = header.encode('utf8')
+        return _MAGIC + _UINT32.pack(len(header)) + header
+
+    def _iter_record_parts(self, o, filter_method=None):
+        """
+        generator delivering the encoded item records as output lists (bytearrays and raw buffers)
+
+        :param o: iTree object to be serialized
+        :param filter_method: filter method for the items to be serialized
+
+        :return: iterator over tuples (depth, list of bytes-like objects)
+        """
+        get_args = o.__class__._get_args_skip_subtree
+        encode = self.encode
+        if filter_method:
+            items = o.__class__._iter_deep_locals_add_placeholders_filtered(o, filter_method)
+        else:
+            items = o.__class__._iter_deep_locals_add_placeholders(o)
+        for depth, _, item in chain(((0, 0, o),), items):
+            args = get_args(item)
+            head = bytearray(_UINT64.size)
+            head += _RECORD_HEAD.pack(depth, len(args))
+            out = [head]
+            for arg in args:
+                encode(arg, out)
+            if len(out) == 1:
+                size = len(head) - _UINT64.size
+            else:
+                size = sum(len(i) for i in out) - _UINT64.size
+            _UINT64.pack_into(head, 0, size)
+            yield depth, out
+
+    def _iter_data_blocks(self, o, filter_method=None, index=None):
+        """
+        generator delivering the serialized records in blocks of about `DUMP_BLOCK_SIZE` bytes, large raw buffers
+        are delivered as separate blocks (without copy)
+
+        :param o: iTree object to be serialized
+        :param filter_method: filter method for the items to be serialized
+        :param index: `_iTBinaryIndex` object the records are added to (or None)
+
+        :return: iterator over bytes-like objects
+        """
+        block_size = self.DUMP_BLOCK_SIZE
+        raw_size = self.RAW_SIZE
+        block = bytearray()
+        add = index.add if index is not None else None
+        unpack_size = _UINT64.unpack_from
+        for depth, out in self._iter_record_parts(o, filter_method):
+            if add is not None:
+                add(depth, unpack_size(out[0], 0)[0] + 8)
+            for data in out:
+                if len(data) >= raw_size and type(data) is not bytearray:
+                    if block:
+                        yield block
+                        block = bytearray()
+                    yield data
+                else:
+                    block += data
+            if len(block) >= block_size:
+                yield block
+                block = bytearray()
+        block += _UINT64.pack(0)  # end mark
+        yield block
+
+    def dumps(self, o, add_header=True, calc_hash=False, filter_method=None):
+        """
+        serialize the iTree object into bytes
+
+        :param o: iTree object to be serialized
+        :param add_header: not used; the binary data contains always the header
+        :param calc_hash: True - A sha256 hash is calculated over the records and added in the trailer
+                          False - no hash will be calculated
+        :param filter_method: filter method for the items to be serialized
+
+        :rtype: Union[bytes,tuple]
+        :return: bytes containing the serialized data or (hash, bytes) in case the hash is calculated
+        """
+        index = _iTBinaryIndex()
+        blocks = list(self._iter_data_blocks(o, filter_method, index))
+        if calc_hash:
+            sha = hashlib.sha256()
+            for block in blocks:
+                sha.update(block)
+            data_hash = sha.hexdigest()
+            blocks.append(_UINT8.pack(1) + sha.digest())
+        else:
+            blocks.append(_UINT8.pack(0))
+        blocks.append(index.to_bytes())
+        data = self._create_header() + b''.join(blocks)
+        if calc_hash:
+            return data_hash, data
+        return data
+
+    def _dump_into_hdl(self, o, fh, pack, calc_hash, filter_method):
+        """
+        write the serialized iTree object into the given file handle
+
+        :param o: iTree object to be serialized
+        :param fh: binary file handle
+        :param pack: True - gzip the data, False - do not zip
+        :param calc_hash: True - the hash is calculated and added in the trailer
+        :param filter_method: filter method for the items to be serialized
+
+        :return: hash of the records or None
+        """
+        if pack:
+            # the given file handle is not closed by the GzipFile
+            with gzip.GzipFile(filename='', mode='wb', compresslevel=self.COMPRESS_LEVEL, fileobj=fh) as gz_fh:
+                # packed data cannot be loaded lazy -> no index
+                return self._write_data(o, gz_fh, calc_hash, filter_method, None)
+        return self._write_data(o, fh, calc_hash, filter_method, _iTBinaryIndex())
+
+    def _write_data(self, o, fh, calc_hash, filter_method, index):
+        """
+        write the binary data (header, records, trailer and index) into the given file handle
+
+        :param o: iTree object to be serialized
+        :param fh: binary file handle
+        :param calc_hash: True - the hash is calculated and added in the trailer
+        :param filter_method: filter method for the items to be serialized
+        :param index: `_iTBinaryIndex` object or None (no index is written)
+
+        :return: hash of the records or None
+        """
+        write = fh.write
+        write(self._create_header())
+        if not calc_hash:
+            for block in self._iter_data_blocks(o, filter_method, index):
+                write(block)
+            write(_UINT8.pack(0))
+            data_hash = None
+        else:
+            sha = hashlib.sha256()
+            update = sha.update
+            for block in self._iter_data_blocks(o, filter_method, index):
+                update(block)
+                write(block)
+            write(_UINT8.pack(1) + sha.digest())
+            data_hash = sha.hexdigest()
+        if index is not None:
+            write(index.to_bytes())
+        return data_hash
+
+    # --- load -------------------------------------------------------------------------------------
+
+    def load(self, file_path, check_hash=True, load_links=True, lazy=False, target_path=None):
+        """
+        create an iTree object by loading from a file
+
+        In lazy mode the file is memory mapped and only the root item is created. The children are created
+        level by level in the moment they are accessed (e.g. via `get()`, iteration or `deep`), the not accessed
+        subtrees are not read. The file must not be changed by others as long as the tree is in use (`dump()`
+        into the source file is possible, the file is replaced after the new data is written).
+
+        If a target path is given only the targeted subtree is loaded. The path is resolved via the index of the
+        file (only the tags of the siblings on the path are decoded), afterwards the records of the subtree are
+        decoded. The targeted item is delivered as root of the new tree.
+
+        .. note:: Lazy loading and the loading of target paths requires a not packed file
+                  (`dump(..., pack=False)`). The hash cannot be checked in those modes (the data is not read
+                  completely) and the links are loaded in the moment the related link items are created.
+
+        :param file_path: file path to the file that contains the iTree information (or a binary file handle)
+        :param check_hash: True the hash of the file will be checked and the loading will be stopped if it doesn't match
+                           False - do not check the iTree hash (ignored in lazy mode and for target paths)
+        :param load_links: True - linked iTree objects will be loaded
+        :param lazy: True - create the items in the moment they are accessed
+                     False - load the whole tree
+        :type target_path: Union[list,tuple,None]
+        :param target_path: None - the whole tree is loaded
+                            list or tuple of targets (per level: absolute index, key (family-tag, family-index)
+                            or family-tag of a family with one item only) e.g. `item.tag_idx_path`
+        :return: iTree object loaded from file
+        """
+        if not lazy and target_path is None:
+            return super(iTStdBinarySerializer, self).load(file_path, check_hash, load_links)
+        if type(file_path) is str:
+            if not os.path.exists(file_path):
+                raise FileNotFoundError('Error file "%s" not found' % file_path)
+            with open(file_path, 'rb') as fh:
+                data = self._map_file(fh)
+        else:
+            # file handle
+            data = self._map_file(file_path)
+        if data[:2] == b'\x1f\x8b':  # gzip magic number
+            raise ValueError('Lazy loading and loading of target paths requires a not packed file '
+                             '(use dump(..., pack=False))')
+        lazy_file = _iTLazyBinaryFile(self, data, load_links)
+        if target_path is None:
+            return lazy_file.create_item(0)
+        record = lazy_file.find_record(target_path)
+        if lazy:
+            return lazy_file.create_item(record)
+        new_tree = self._create_itree_from_records(lazy_file.iter_subtree_records(record))
+        if load_links:
+            new_tree.load_links()
+        return new_tree
+
+    @staticmethod
+    def _map_file(fh):
+        """
+        map the file of the given file handle into memory (read only); if the file cannot be mapped the data
+        is read
+
+        :param fh: binary file handle (positioned at the beginning of the iTree data)
+        :return: mmap object or bytes
+        """
+        try:
+            fileno = fh.fileno()
+            if fh.tell() == 0:
+                # the file handle can be closed, the mapping stays valid
+                return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # no real file (or empty file)
+            pass
+        return fh.read()
+
+    def loads(self, source_str, check_hash=True, load_links=True, _source=None):
+        """
+        create an iTree object from the given binary data
+
+        :param source_str: bytes that contains the serialized iTree (packed or not packed)
+        :param check_hash: True the hash will be checked and the loading will be stopped if it doesn't match
+                           False - do not check the iTree hash
+        :param load_links: True - linked iTree objects will be loaded
+        :param _source: Path of a loaded source file (for internal use)
+
+        :return: iTree object
+        """
+        new_tree = self._load_from_hdl(io.BytesIO(source_str), check_hash)
+        if load_links:
+            new_tree.load_links()
+        return new_tree
+
+    def _load_from_hdl(self, fh, check_hash=True):
+        """
+        create an iTree object from the given file handle (packed or not packed data)
+
+        :param fh: binary file handle
+        :param check_hash: True the hash will be checked
+        :return: iTree object (links not loaded)
+        """
+        magic = self._read(fh, 2)
+        if magic == b'\x1f\x8b':  # gzip magic number
+            if hasattr(fh, 'seekable') and fh.seekable():
+                fh.seek(-2, 1)
+                packed_fh = fh
+            else:
+                packed_fh = _PrefixedReader(magic, fh)
+            # the given file handle is not closed by the GzipFile
+            with gzip.GzipFile(filename='', mode='rb', fileobj=packed_fh) as gz_fh:
+                return self._load_records(gz_fh, check_hash, self._read(gz_fh, 2))
+        return self._load_records(fh, check_hash, magic)
+
+    @staticmethod
+    def _read(fh, size):
+        """
+        read exactly the given number of bytes
+
+        :param fh: binary file handle
+        :param size: number of bytes
+
+        :return: bytearray
+        """
+        data = bytearray(size)
+        view = memoryview(data)
+        pos = 0
+        while pos < size:
+            n = fh.readinto(view[pos:])
+            if not n:
+                raise SyntaxError('Unexpected end of binary iTree data')
+            pos += n
+        return data
+
+    def _check_header(self, fh, start):
+        read = self._read
+        magic = start + read(fh, len(_MAGIC) - len(start))
+        if magic != _MAGIC:
+            raise SyntaxError('Unknown input file format')
+        size = _UINT32.unpack(read(fh, 4))[0]
+        header_dict = self._parse_json(bytes(read(fh, size)))
+        version = header_dict['VERSION']
+        i = version.rindex('.')
+        if version[:i] != DT_SERIALIZE_MAJOR_VERSION:
+            raise SyntaxError('Wrong version of serialization file please convert first!')
+        return header_dict
+
+    def _iter_binary_records(self, fh, sha=None, rest=None):
+        """
+        generator delivering the decoded item records (depth, arguments)
+
+        The file handle is read in blocks of `DUMP_BLOCK_SIZE`, the records are copied from the block buffer into
+        their own record buffers (larger records are read directly into the record buffer).
+
+        :param fh: binary file handle (positioned behind the header)
+        :param sha: hash object to be updated with the record data or None
+        :param rest: list the bytes read behind the end mark are appended to (or None)
+
+        :return: iterator over tuples (depth, arguments)
+        """
+        read = fh.read
+        block_size = self.DUMP_BLOCK_SIZE
+        decode = self.decode
+        record_head_size = _RECORD_HEAD.size
+        block = memoryview(b'')
+        pos = 0
+        while True:
+            if len(block) - pos < 8:
+                buffer = bytearray(block[pos:])
+                while len(buffer) < 8:
+                    new_data = read(block_size)
+                    if not new_data:
+                        raise SyntaxError('Unexpected end of binary iTree data')
+                    buffer += new_data
+                block = memoryview(buffer)
+                pos = 0
+            end = pos + 8
+            if sha is not None:
+                sha.update(block[pos:end])
+            size = _UINT64.unpack_from(block, pos)[0]
+            pos = end
+            if size == 0:
+                # end mark
+                if rest is not None:
+                    rest.append(bytes(block[pos:]))
+                return
+            end = pos + size
+            if end <= len(block):
+                data = bytearray(block[pos:end])
+                pos = end
+            else:
+                data = bytearray(size)
+                view = memoryview(data)
+                cnt = len(block) - pos
+                view[:cnt] = block[pos:]
+                while cnt < size:
+                    n = fh.readinto(view[cnt:])
+                    if not n:
+                        raise SyntaxError('Unexpected end of binary iTree data')
+                    cnt += n
+                block = memoryview(b'')
+                pos = 0
+            if sha is not None:
+                sha.update(data)
+            depth, arg_cnt = _RECORD_HEAD.unpack_from(data, 0)
+            data_pos = record_head_size
+            args = []
+            for _ in range(arg_cnt):
+                arg, data_pos = decode(data, data_pos)
+                args.append(arg)
+            yield depth, args
+
+    def _load_records(self, fh, check_hash, start):
+        """
+        create an iTree object from the records in the file handle
+
+        :param fh: binary file handle (positioned behind the given start bytes)
+        :param check_hash: True the hash will be checked
+        :param start: bytes already read from the file handle
+        :return: iTree object (links not loaded)
+        """
+        self._check_header(fh, start)
+        sha = hashlib.sha256() if check_hash else None
+        rest = []
+        new_tree = self._create_itree_from_records(self._iter_binary_records(fh, sha, rest))
+        trailer = rest[0] if rest else b''
+        if not trailer:
+            trailer = self._read(fh, 1)
+        if trailer[0] and sha is not None:
+            if len(trailer) < 33:
+                trailer += self._read(fh, 33 - len(trailer))
+            if trailer[1:33] != sha.digest():
+                raise PermissionError('Given tree data is corrupted (wrong hash)!')
+        return new_tree
+
+
+class _PrefixedReader(object):
+    """
+    read only file handle delivering the given prefix bytes followed by the data of the given file handle
+    (used for not seekable file handles)
+    """
+
+    def __init__(self, prefix, fh):
+        self._prefix = bytes(prefix)
+        self._fh = fh
+
+    def read(self, size=-1):
+        prefix = self._prefix
+        if not prefix:
+            return self._fh.read(size)
+        if size is None or size < 0:
+            self._prefix = b''
+            return prefix + self._fh.read()
+        self._prefix = prefix[size:]
+        prefix = prefix[:size]
+        if len(prefix) < size:
+            prefix = prefix + self._fh.read(size - len(prefix))
+        return prefix
+
+
+class _iTBinaryIndex(object):
+    """
+    offset index of the item records (stored behind the trailer, used for the lazy loading)
+
+    For each record the offset (relative to the first record), the number of the record behind the subtree
+    (next sibling) and the number of children is stored.
+    """
+    __slots__ = ('offsets', 'ends', 'counts', '_stack', '_pos')
+
+    def __init__(self):
+        self.offsets = array('Q')
+        self.ends = array('Q')
+        self.counts = array('I')
+        self._stack = []  # open records per depth
+        self._pos = 0
+
+    def add(self, depth, size):
+        """
+        add the next record in the index
+
+        :param depth: depth of the item
+        :param size: size of the record in bytes (incl. the length field)
+        """
+        stack = self._stack
+        offsets = self.offsets
+        number = len(offsets)
+        if depth != len(stack):
+            if depth > len(stack) or not depth:
+                raise SyntaxError('Implausible depth found in the binary iTree data (record %i)' % number)
+            # the subtrees of the last items are complete
+            ends = self.ends
+            while len(stack) > depth:
+                ends[stack.pop()] = number
+        if depth:
+            self.counts[stack[-1]] += 1
+        stack.append(number)
+        offsets.append(self._pos)
+        self.ends.append(0)
+        self.counts.append(0)
+        self._pos += size
+
+    def close(self):
+        """
+        close the subtrees which are still open (after the last record)
+        """
+        number = len(self.offsets)
+        ends = self.ends
+        for record in self._stack:
+            ends[record] = number
+        del self._stack[:]
+
+    def to_bytes(self):
+        """
+        deliver the binary index data (incl. footer)
+
+        :return: bytes
+        """
+        self.close()
+        parts = []
+        for data in (self.offsets, self.ends, self.counts):
+            if sys.byteorder != 'little':
+                data = array(data.typecode, data)
+                data.byteswap()
+            parts.append(data.tobytes())
+        parts.append(_INDEX_FOOTER.pack(len(self.offsets), _INDEX_MAGIC))
+        return b''.join(parts)
+
+    @staticmethod
+    def from_buffer(data, start):
+        """
+        deliver the index stored at the end of the given data
+
+        :param data: binary iTree data (bytes-like object)
+        :param start: position of the first record in the data
+        :return: tuple (offsets, ends, counts) or None if no valid index is found
+        """
+        size = len(data)
+        if size - start < _INDEX_FOOTER.size:
+            return None
+        number, magic = _INDEX_FOOTER.unpack_from(data, size - _INDEX_FOOTER.size)
+        index_start = size - _INDEX_FOOTER.size - number * 20
+        if magic != _INDEX_MAGIC or number == 0 or index_start <= start:
+            return None
+        view = memoryview(data)
+        pos = index_start + number * 16
+        parts = ((view[index_start:index_start + number * 8], 'Q'),
+                 (view[index_start + number * 8:pos], 'Q'),
+                 (view[pos:pos + number * 4], 'I'))
+        if sys.byteorder == 'little':
+            # no copy, the index is read directly from the buffer (memory map)
+            return tuple(part.cast(typecode) for part, typecode in parts)
+        result = []
+        for part, typecode in parts:
+            data = array(typecode, part.tobytes())
+            data.byteswap()
+            result.append(data)
+        return tuple(result)
+
+
+class _iTLazyBinaryFile(object):
+    """
+    binary iTree data of a lazy loaded iTree (memory map and index); the records are decoded
+    in the moment the related items are created
+    """
+
+    def __init__(self, serializer, data, load_links):
+        """
+        :param serializer: `iTStdBinarySerializer` object used for the decoding
+        :param data: mmap or bytes containing the not packed binary iTree data
+        :param load_links: True - the links are loaded in the moment the link items are created
+        """
+        self._serializer = serializer
+        self._view = view = memoryview(data)
+        self._load_links = load_links
+        if len(data) < len(_MAGIC) + _UINT32.size:
+            raise SyntaxError('Unknown input file format')
+        start = len(_MAGIC) + _UINT32.size + _UINT32.unpack_from(data, len(_MAGIC))[0]
+        serializer._check_header(io.BytesIO(view[:start]), b'')
+        self._start = start
+        index = _iTBinaryIndex.from_buffer(data, start)
+        if index is None:
+            # older file without index -> the index is created from the record heads
+            index = self._scan_records()
+        self._offsets, self._ends, self._counts = index
+
+    def _scan_records(self):
+        """
+        create the index by reading the length and the depth of each record (the arguments are not decoded)
+
+        :return: tuple (offsets, ends, counts)
+        """
+        view = self._view
+        pos = self._start
+        index = _iTBinaryIndex()
+        add = index.add
+        while True:
+            if pos + _UINT64.size > len(view):
+                raise SyntaxError('Unexpected end of binary iTree data')
+            size = _UINT64.unpack_from(view, pos)[0]
+            if size == 0:
+                # end mark
+                break
+            add(_UINT32.unpack_from(view, pos + _UINT64.size)[0], size + _UINT64.size)
+            pos += size + _UINT64.size
+        index.close()
+        if not index.offsets:
+            raise SyntaxError('No item data found')
+        return index.offsets, index.ends, index.counts
+
+    def read_record(self, record):
+        """
+        read and decode the given record
+
+        :param record: number of the record
+        :return: tuple (depth, arguments)
+        """
+        view = self._view
+        pos = self._start + self._offsets[record] + _UINT64.size
+        size = _UINT64.unpack_from(view, pos - _UINT64.size)[0]
+        # the record is copied (the numpy arrays are views on the record buffer)
+        data = bytearray(view[pos:pos + size])
+        depth, arg_cnt = _RECORD_HEAD.unpack_from(data, 0)
+        decode = self._serializer.decode
+        data_pos = _RECORD_HEAD.size
+        args = []
+        for _ in range(arg_cnt):
+            arg, data_pos = decode(data, data_pos)
+            args.append(arg)
+        return depth, args
+
+    def iter_subtree_records(self, record):
+        """
+        generator delivering the records of the whole subtree (the depth is relative to the given record)
+
+        :param record: number of the first record
+        :return: iterator over tuples (depth, arguments)
+        """
+        read_record = self.read_record
+        base_depth = None
+        for number in range(record, self._ends[record]):
+            depth, args = read_record(number)
+            if base_depth is None:
+                base_depth = depth
+            yield depth - base_depth, args
+
+    def read_tag(self, record):
+        """
+        decode the tag of the given record only (the record is not copied)
+
+        :param record: number of the record
+        :return: tag object
+        """
+        pos = self._start + self._offsets[record] + _UINT64.size + _RECORD_HEAD.size
+        return self._serializer.decode(self._view, pos)[0]
+
+    def iter_children(self, record):
+        """
+        iterate over the record numbers of the children of the given record
+
+        :param record: number of the record
+        :return: iterator over record numbers
+        """
+        ends = self._ends
+        child = record + 1
+        end = ends[record]
+        while child < end:
+            yield child
+            child = ends[child]
+
+    def find_record(self, target_path):
+        """
+        find the record of the given target path
+
+        :type target_path: Union[list,tuple]
+        :param target_path: targets per level (absolute index, key (family-tag, family-index) or family-tag of a
+                            family with one item only)
+
+        :except: IndexError or KeyError in case no matching item is found
+        :return: number of the record
+        """
+        if type(target_path) is not list and type(target_path) is not tuple:
+            target_path = [target_path]
+        read_tag = self.read_tag
+        record = 0
+        for target in target_path:
+            t = type(target)
+            if t is int:
+                size = self._counts[record]
+                idx = target + size if target < 0 else target
+                if not 0 <= idx < size:
+                    raise IndexError('Index {} of target path is out of range'.format(target))
+                record = next(islice(self.iter_children(record), idx, None))
+                continue
+            if t is Tag:
+                tag, fam_idx = target.tag, None
+            elif t is tuple and len(target) == 2 and type(target[1]) is int:
+                tag, fam_idx = target
+            else:
+                tag, fam_idx = target, None
+            if fam_idx is not None and fam_idx >= 0:
+                # we stop at the targeted family member
+                members = (child for child in self.iter_children(record) if read_tag(child) == tag)
+                record = next(islice(members, fam_idx, None), None)
+                if record is None:
+                    raise KeyError('Key {} of target path not found'.format(repr(target)))
+                continue
+            members = [child for child in self.iter_children(record) if read_tag(child) == tag]
+            if fam_idx is None:
+                if not members:
+                    raise KeyError('Family-tag {} of target path not found'.format(repr(tag)))
+                if len(members) != 1:
+                    raise KeyError('Family-tag {} of target path does not target a single item'.format(repr(tag)))
+                fam_idx = 0
+            try:
+                record = members[fam_idx]
+            except IndexError:
+                raise KeyError('Key {} of target path not found'.format(repr(target)))
+        return record
+
+    def create_item(self, record, deep_flags=0):
+        """
+        create the item of the given record, the children are not created (placeholders are set)
+
+        :param record: number of the record
+        :param deep_flags: flags taken over from the parent
+        :return: iTree object
+        """
+        serializer = self._serializer
+        itree_class = serializer.itree_class
+        args = self.read_record(record)[1]
+        if len(args) > 3 and args[3] is not None:
+            # link roots are created completely (including the local items) via the standard procedure
+            item = serializer._create_itree_from_records(self.iter_subtree_records(record))
+            if deep_flags:
+                for i in chain((item,), itree_class._iter_created(item)):
+                    i._flags = i._flags | deep_flags
+            if self._load_links:
+                item.load_links()
+            return item
+        item = itree_class(*args)
+        if deep_flags:
+            item._flags = item._flags | deep_flags
+        if self._counts[record]:
+            itree_class._set_lazy_children(item, _iTLazyRecord(self, record))
+        return item
+
+    def create_children(self, itree_item, record):
+        """
+        create the children of the given record and put them in the `iTree`-object
+
+        :param itree_item: `iTree`-object in placeholder state
+        :param record: number of the record of the `iTree`-object
+        """
+        deep_flags = itree_item._flags & itree_item._DEEP_FLAG_MASK
+        create_item = self.create_item
+        sl = [create_item(child, deep_flags) for child in self.iter_children(record)]
+        itree_item._set_created_children(itree_item, sl)
+
+
+class _iTLazyRecord(object):
+    """
+    source of the not yet created children of a lazy loaded item
+    """
+    __slots__ = ('_file', '_record')
+
+    def __init__(self, lazy_file, record):
+        self._file = lazy_file
+        self._record = record
+
+    def __len__(self):
+        return self._file._counts[self._record]
+
+    def create_children(self, itree_item):
+        self._file.create_children(itree_item, self._record)
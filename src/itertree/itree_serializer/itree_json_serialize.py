@@ -21,10 +21,15 @@ This part of code contains the standard iTree serializers (JSON and rendering)
 
 from __future__ import absolute_import
 
+import gc
 import gzip
 import hashlib
+import re
+import shutil
+import tempfile
 import traceback
 from collections import OrderedDict, deque
+from itertools import chain
 
 # For serializing we (try) to import some modules:
 
@@ -73,6 +78,9 @@ import itertree
 DT_SERIALIZE_VERSION = "2.0.1"
 DT_SERIALIZE_MAJOR_VERSION = "2.0"
 
+# JSON strings (serialized strings cannot contain line breaks and can be matched line by line)
+_JSON_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"')
+
 
 class iTStdJSONSerializer2(object):
     """
@@ -152,6 +160,14 @@ class iTStdJSONSerializer2(object):
                                                    str(o.dtype),
                                                    list(o.shape)]
 
+    # in dump() the data section is collected in blocks of this size before it is written
+    DUMP_BLOCK_SIZE = 1 << 16
+    # in dump() with hash calculation the data section is buffered in memory up to this size,
+    # larger data is buffered in a temporary file (the hash must be written before the data)
+    DUMP_SPOOL_SIZE = 1 << 24
+    # gzip compression level used in dump()
+    COMPRESS_LEVEL = 9
+
     def __init__(self, itree_class):
         self.itree_class = itree_class
         self.json = JSON
@@ -265,44 +281,93 @@ class iTStdJSONSerializer2(object):
         :rtype: tuple
         :return: hash,string containing the serialized data -> if no hash calculation requested hash will be None
         """
-        if IS_ORJSON:
-            convert = self.convert_single_itree_to_json_obj
-        else:
-            convert = self.convert_single_itree_to_json_obj2
-
-        if filter_method:
-            tree_json = [convert(d, i, fidx) for d, fidx, i in
-                         o.__class__._iter_deep_locals_add_placeholders_filtered(o, filter_method)]
-        else:
-            tree_json = [convert(d, i, fidx) for d, fidx, i in o.__class__._iter_deep_locals_add_placeholders(o)]
-        dt_str = b'[\n' + convert(0, o, 0) + b',\n' + b',\n'.join(tree_json) + b'\n]'
+        dt_str = b''.join(self._iter_data_section(o, filter_method))
         if calc_hash:
             data_hash = hashlib.sha256(dt_str).hexdigest()
         if add_header:
-            class_name = self.itree_class.__name__
-            if class_name == 'iTree':
-                full_name = 'itertree.iTree'
-            else:
-                module = self.itree_class.__module__
-                full_name = module + '.' + class_name
-            header_dict = {'TYPE': full_name, 'VERSION': DT_SERIALIZE_VERSION}
-            if calc_hash:
-                header_dict['HASH'] = data_hash
-            if IS_ORJSON:
-                header_str = JSON.dumps(header_dict)
-            else:
-                header_str = bytes(JSON.dumps(header_dict, indent=2).encode('utf8', errors='backslashreplace'))
-            dt_str = b'[\n' + header_str + b',\n' + dt_str + b']'
+            dt_str = self._create_header(data_hash if calc_hash else None) + dt_str + b']'
         if calc_hash:
             return data_hash, dt_str
         return dt_str
 
+    def _iter_data_section(self, o, filter_method=None):
+        """
+        generator delivering the serialized data section of the iTree object in parts (one part per item)
+
+        :param o: iTree object to be serialized
+        :param filter_method: filter method for the items to be serialized
+
+        :return: iterator over bytes
+        """
+        if IS_ORJSON:
+            convert = self.convert_single_itree_to_json_obj
+        else:
+            convert = self.convert_single_itree_to_json_obj2
+        if filter_method:
+            items = o.__class__._iter_deep_locals_add_placeholders_filtered(o, filter_method)
+        else:
+            items = o.__class__._iter_deep_locals_add_placeholders(o)
+        yield b'[\n' + convert(0, o, 0)
+        for d, fidx, i in items:
+            yield b',\n' + convert(d, i, fidx)
+        yield b'\n]'
+
+    def _create_header(self, data_hash=None):
+        """
+        create the header of the serialized data (including the opening bracket of the outer list)
+
+        :param data_hash: hash of the data section or None (no hash)
+
+        :return: bytes
+        """
+        class_name = self.itree_class.__name__
+        if class_name == 'iTree':
+            full_name = 'itertree.iTree'
+        else:
+            module = self.itree_class.__module__
+            full_name = module + '.' + class_name
+        header_dict = {'TYPE': full_name, 'VERSION': DT_SERIALIZE_VERSION}
+        if data_hash is not None:
+            header_dict['HASH'] = data_hash
+        if IS_ORJSON:
+            header_str = JSON.dumps(header_dict)
+        else:
+            header_str = bytes(JSON.dumps(header_dict, indent=2).encode('utf8', errors='backslashreplace'))
+        return b'[\n' + header_str + b',\n'
+
+    def _iter_data_blocks(self, o, filter_method=None):
+        """
+        generator delivering the serialized data section in blocks of about `DUMP_BLOCK_SIZE` bytes
+        (the number of write calls is reduced)
+
+        :param o: iTree object to be serialized
+        :param filter_method: filter method for the items to be serialized
+
+        :return: iterator over bytes
+        """
+        block_size = self.DUMP_BLOCK_SIZE
+        block = []
+        size = 0
+        for data in self._iter_data_section(o, filter_method):
+            block.append(data)
+            size += len(data)
+            if size >= block_size:
+                yield b''.join(block)
+                block.clear()
+                size = 0
+        if block:
+            yield b''.join(block)
+
     def dump(self, o, file_path, pack=True, calc_hash=True, overwrite=False, filter_method=None):
         """
         Serialize iTree object into a file
 
+        The data is written item by item into the file (the serialized data is not collected in memory).
+        In case the hash is calculated the data is buffered in a temporary file (the hash is stored in the header
+        in front of the data). An existing file is replaced after the data is written completely.
+
         :param o: iTree object to be serialized
-        :param file_path: target file path where to store the data in
+        :param file_path: target file path where to store the data in (or a binary file handle)
         :param pack: True - gzip the data, False - do not zip
         :param overwrite: True - an existing fie will be overwritten
                           False (default) - in case the file exists an FileExistsError Exception will be raised
@@ -310,27 +375,65 @@ class iTStdJSONSerializer2(object):
                           False - no hash will be calculated
         :return: None
         """
-        is_hdl = True
-        if type(file_path) is str:
-            is_hdl = False
-            if os.path.exists(file_path):
-                if not overwrite:
-                    raise FileExistsError('Error file "%s" exists already' % file_path)
-                if os.path.isdir(file_path):
-                    raise FileExistsError('Error dir with name "%s" exists already' % file_path)
-        if calc_hash:
-            data_hash, data = self.dumps(o, add_header=True, calc_hash=calc_hash, filter_method=filter_method)
-        else:
-            data = self.dumps(o, add_header=True, calc_hash=calc_hash, filter_method=filter_method)
-        if pack:
-            data = gzip.compress(data)
-        if is_hdl:
-            file_path.write(data)
-        else:
+        if type(file_path) is not str:
+            # file handle
+            data_hash = self._dump_into_hdl(o, file_path, pack, calc_hash, filter_method)
+        elif not os.path.exists(file_path):
             with open(file_path, 'wb') as fh:
-                fh.write(data)
+                data_hash = self._dump_into_hdl(o, fh, pack, calc_hash, filter_method)
+        else:
+            if not overwrite:
+                raise FileExistsError('Error file "%s" exists already' % file_path)
+            if os.path.isdir(file_path):
+                raise FileExistsError('Error dir with name "%s" exists already' % file_path)
+            # the existing file might still be read during the dump (e.g. a lazy loaded tree is dumped into its
+            # source file) -> the data is written into a temporary file which replaces the existing file afterwards
+            tmp_path = file_path + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as fh:
+                    data_hash = self._dump_into_hdl(o, fh, pack, calc_hash, filter_method)
+                shutil.copymode(file_path, tmp_path)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
         return data_hash if calc_hash else True
 
+    def _dump_into_hdl(self, o, fh, pack, calc_hash, filter_method):
+        """
+        write the serialized iTree object into the given file handle
+
+        :param o: iTree object to be serialized
+        :param fh: binary file handle
+        :param pack: True - gzip the data, False - do not zip
+        :param calc_hash: True - the hash is calculated and added in the header
+        :param filter_method: filter method for the items to be serialized
+
+        :return: hash of the data section or None
+        """
+        if pack:
+            # the given file handle is not closed by the GzipFile
+            with gzip.GzipFile(filename='', mode='wb', compresslevel=self.COMPRESS_LEVEL, fileobj=fh) as gz_fh:
+                return self._dump_into_hdl(o, gz_fh, False, calc_hash, filter_method)
+        if not calc_hash:
+            fh.write(self._create_header())
+            for block in self._iter_data_blocks(o, filter_method):
+                fh.write(block)
+            fh.write(b']')
+            return None
+        sha = hashlib.sha256()
+        with tempfile.SpooledTemporaryFile(max_size=self.DUMP_SPOOL_SIZE) as tmp_fh:
+            for block in self._iter_data_blocks(o, filter_method):
+                sha.update(block)
+                tmp_fh.write(block)
+            data_hash = sha.hexdigest()
+            fh.write(self._create_header(data_hash))
+            tmp_fh.seek(0)
+            shutil.copyfileobj(tmp_fh, fh)
+        fh.write(b']')
+        return data_hash
+
     def create_itree_from_raw(self, raw_o):
         convert_from_json_obj = self.convert_from_json_obj
         itree_class = self.itree_class
@@ -384,7 +487,9 @@ class iTStdJSONSerializer2(object):
                              *[convert_from_json_obj(arg) for arg in main_args[5:]])
             del level_datas[-1]
             level_datas[-1][-1] = it
-
+        if type(level_datas[0][0]) is list:
+            # tree without children
+            it = itree_class(*[convert_from_json_obj(arg) for arg in level_datas[0][0][2:]])
         return it
 
     def create_itree_from_raw2(self, raw_o):
@@ -440,32 +545,241 @@ class iTStdJSONSerializer2(object):
             new_tree.load_links()
         return new_tree
 
-    def load(self, file_path, check_hash=True, load_links=True):
+    def load(self, file_path, check_hash=True, load_links=True, lazy=False, target_path=None):
         """
         create an iTree object by loading from a file
 
-        :param file_path: file path to the file that contains the iTree information
+        The file is read line by line (decompressed incrementally), each item is created and appended directly after
+        parsing its line. The serialized data is not collected in memory.
+
+        :param file_path: file path to the file that contains the iTree information (or a binary file handle)
         :param check_hash: True the hash of the file will be checked and the loading will be stopped if it doesn't match
                            False - do not check the iTree hash
         :param load_links: True - linked iTree objects will be loaded
+        :param lazy: lazy loading is not supported by the JSON format (use `iTStdBinarySerializer`)
+        :param target_path: loading of target paths is not supported by the JSON format
+                            (use `iTStdBinarySerializer`)
         :return: iTree object loaded from file
         """
+        if lazy or target_path is not None:
+            raise ValueError('Lazy loading and loading of target paths is not supported by %s, '
+                             'use iTStdBinarySerializer (not packed files)' % self.__class__.__name__)
         if type(file_path) is str:
             if not os.path.exists(file_path):
                 raise FileNotFoundError('Error file "%s" not found' % file_path)
             with open(file_path, 'rb') as fh:
-                data = fh.read()
+                new_tree = self._load_from_hdl(fh, check_hash)
         else:
             # file handle
-            data = file_path.read()
-        try:
-            data = gzip.decompress(data)
-        except OSError:
-            # we might have an already unzipped file!
-            pass
-        # data=data.decode(decode)
+            new_tree = self._load_from_hdl(file_path, check_hash)
+        if load_links:
+            new_tree.load_links()
+        return new_tree
+
+    def _load_from_hdl(self, fh, check_hash=True):
+        """
+        create an iTree object from the given file handle (packed or not packed data)
+
+        :param fh: binary file handle
+        :param check_hash: True the hash of the file will be checked
+        :return: iTree object (links not loaded)
+        """
+        if not (hasattr(fh, 'seekable') and fh.seekable()):
+            # we cannot check the packing without reading -> load all data
+            data = fh.read()
+            try:
+                data = gzip.decompress(data)
+            except OSError:
+                # we might have an already unzipped file!
+                pass
+            return self.loads(data, check_hash, load_links=False)
+        pos = fh.tell()
+        is_packed = fh.read(2) == b'\x1f\x8b'  # gzip magic number
+        fh.seek(pos)
+        if is_packed:
+            # the given file handle is not closed by the GzipFile
+            with gzip.GzipFile(filename='', mode='rb', fileobj=fh) as gz_fh:
+                return self._load_lines(gz_fh, check_hash)
+        return self._load_lines(fh, check_hash)
+
+    def _parse_json(self, data):
+        if DECODE:
+            return JSON.loads(data.decode('utf-8'))
+        return JSON.loads(data)
+
+    def _iter_records(self, lines):
+        """
+        generator delivering the parsed item records of the serialized data section (one record per item)
+
+        With orjson each record is stored in a single line, the standard json stores the records with indentation
+        over multiple lines. The record boundaries are found by counting the brackets outside of the strings
+        in each line, the lines of a record are joined and parsed once.
+
+        :param lines: iterator over the lines following the opening line of the data section
+        :return: iterator over the records (lists)
+        """
+        parse = self._parse_json
+        sub_strings = _JSON_STRING.sub
+        record = []
+        depth = 0
+        for line in lines:
+            if record:
+                record.append(line)
+            else:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                if stripped == b']' or stripped == b']]':
+                    # end of data section
+                    return
+                record = [line]
+            if b'"' in line:
+                line = sub_strings(b'""', line)
+            depth += line.count(b'[') + line.count(b'{') - line.count(b']') - line.count(b'}')
+            if depth > 0:
+                # record not complete
+                continue
+            data = b''.join(record).rstrip()
+            if data.endswith(b','):
+                data = data[:-1]
+            try:
+                item_data = parse(data)
+            except ValueError as e:
+                raise SyntaxError('Invalid item data found: %s (%s)' % (repr(data[:100]), e))
+            record = []
+            depth = 0
+            yield item_data
+        if record:
+            raise SyntaxError('Incomplete item data found at the end of the file: %s' %
+                              repr(b''.join(record)[:100]))
+
+    def _load_lines(self, lines, check_hash=True):
+        """
+        create an iTree object from the lines of the serialized data
+
+        The items are appended via `_append_item()` in the moment they are parsed, the parents are taken from
+        a stack of the last items per depth.
+
+        :param lines: iterable over the lines of the serialized data (bytes)
+        :param check_hash: True the hash of the file will be checked
+        :return: iTree object (links not loaded)
+        """
+        lines = iter(lines)
+        line = next(lines, b'')
+        if line.strip() != b'[':
+            raise SyntaxError('Unknown input file format')
+        line = next(lines, b'')
+        sha = None
+        if line.lstrip().startswith(b'{'):
+            # header found
+            header = line
+            while not header.rstrip().endswith(b'},'):
+                line = next(lines, None)
+                if line is None:
+                    raise SyntaxError('Unknown input file format')
+                header = header + line
+            header_dict = self._parse_json(header.rstrip()[:-1])
+            version = header_dict['VERSION']
+            i = version.rindex('.')
+            if version[:i] != DT_SERIALIZE_MAJOR_VERSION:
+                raise SyntaxError('Wrong version of serialization file please convert first!')
+            if check_hash and ('HASH' in header_dict):
+                sha = hashlib.sha256()
+                lines = self._iter_hashed_lines(lines, sha)
+            line = next(lines, b'')
+            if line.strip() != b'[':
+                raise SyntaxError('Unknown input file format')
+            records = self._iter_records(lines)
+        else:
+            # no header -> the first line was the opening line of the data section
+            records = self._iter_records(chain((line,), lines))
+        convert_from_json_obj = self.convert_from_json_obj
+        new_tree = self._create_itree_from_records(
+            (item_data[0], [convert_from_json_obj(arg) for arg in item_data[2:]]) for item_data in records)
+        if sha is not None:
+            # the remaining lines must be hashed too
+            for _ in lines:
+                pass
+            if sha.hexdigest() != header_dict['HASH']:
+                raise PermissionError('Given tree data is corrupted (wrong hash)!')
+        return new_tree
+
+    @staticmethod
+    def _iter_hashed_lines(lines, sha):
+        """
+        generator delivering the given lines and updating the hash with the data section
+        (the last character of the file (closing bracket of the outer list) is not part of the data section)
+
+        :param lines: iterator over the lines
+        :param sha: hash object to be updated
+        :return: iterator over the lines
+        """
+        update = sha.update
+        last = None
+        for line in lines:
+            if last is not None:
+                update(last)
+            last = line
+            yield line
+        if last is not None:
+            update(last.rstrip()[:-1])
+
+    def _create_itree_from_records(self, records):
+        """
+        create the iTree object from the decoded item records
+
+        :param records: iterator over the item records (depth, [tag, value, ...]) (arguments for the instance)
+        :return: iTree object
+        """
+        itree_class = self.itree_class
+        append_item = itree_class._append_item
+        deep_flag_mask = itree_class._DEEP_FLAG_MASK
+        load_links_flag = itree_class._LOAD_LINKS
+        # last item per depth
+        stack = []
+        link_items = []
+        new_tree = None
+        # the garbage collector is paused during the build because it would be triggered very often by the
+        # large number of new container objects (without finding any garbage)
+        gc_enabled = gc.isenabled()
+        gc.disable()
         try:
-            file_path = os.path.abspath(file_path)
-        except:
-            pass
-        return self.loads(data, check_hash, load_links, file_path)
+            for depth, args in records:
+                try:
+                    flags = args[4] if len(args) > 4 else 0
+                    if flags and flags & load_links_flag and args[3] is not None:
+                        # the links are loaded when the subtree is complete
+                        args[4] = flags & ~load_links_flag
+                        item = itree_class(*args)
+                        item._flags = item._flags | load_links_flag
+                        link_items.append(item)
+                    else:
+                        item = itree_class(*args)
+                    if depth == 0:
+                        if new_tree is not None:
+                            raise SyntaxError('Second root item found')
+                        new_tree = item
+                    else:
+                        if depth > len(stack) or new_tree is None:
+                            raise SyntaxError('During build of {} from serialized data '
+                                              'an implausible depth step upwards was found'.format(
+                                               itree_class.__name__))
+                        del stack[depth:]
+                        parent = stack[-1]
+                        flags = parent._flags & deep_flag_mask
+                        if flags:
+                            item._flags = item._flags | flags
+                        append_item(parent, item)
+                    stack.append(item)
+                except:
+                    print('Issue in {}'.format(args))
+                    raise
+        finally:
+            if gc_enabled:
+                gc.enable()
+        if new_tree is None:
+            raise SyntaxError('No item data found')
+        # inner links first
+        for item in reversed(link_items):
+            item.load_links()
+        return new_tree
@@ -39,7 +39,7 @@ class iTreeRender(object):
         self._heading = '> '
         self._link_heading='>>'
 
-    def renders(self, itree_object, filter_method=None,enumerate=False):
+    def renders(self, itree_object, filter_method=None,enumerate=False,max_lines=None):
         """
          creates a pretty print string from iTree object and returns it in a string
 
@@ -52,9 +52,74 @@ class iTreeRender(object):
 
         :param enumerate: add enumeration before the items
 
+        :param max_lines: None - no limit; integer - maximal number of rendered item lines
+                          (a truncation line is added in case the limit is reached)
+
          :return: string containing the pretty print output
          """
-        return self._render_main(itree_object,filter_method,enumerate,False)
+        return ''.join(self.iter_lines(itree_object,filter_method,enumerate,max_lines))
+
+    def render(self, itree_object, stream, filter_method=None,enumerate=False,max_lines=None):
+        """
+        writes the pretty print output of the iTree object line by line into the given stream
+        (the output is not collected in memory)
+
+        :param itree_object: iTree object to be converted
+
+        :param stream: file-like object (text mode) the lines are written in
+
+        :param filter_method: item filter method or filter-constant to filter specific items out
+
+        :param enumerate: add enumeration before the items
+
+        :param max_lines: None - no limit; integer - maximal number of rendered item lines
+                          (a truncation line is added in case the limit is reached)
+
+        :return: number of written lines
+        """
+        write=stream.write
+        cnt=0
+        for line in self.iter_lines(itree_object,filter_method,enumerate,max_lines):
+            write(line)
+            cnt += 1
+        return cnt
+
+    def iter_lines(self, itree_object, filter_method=None,enumerate=False,max_lines=None):
+        """
+        generator delivering the lines of the pretty print output (each line ends with a newline)
+
+        :param itree_object: iTree object to be converted
+
+        :param filter_method: item filter method or filter-constant to filter specific items out
+
+        :param enumerate: add enumeration before the items
+
+        :param max_lines: None - no limit; integer - maximal number of rendered item lines
+                          (a truncation line is added in case the limit is reached)
+
+        :return: iterator over the output lines
+        """
+        lines=self._render_main(itree_object,filter_method,enumerate)
+        if max_lines is None:
+            return lines
+        return self._limit_lines(lines,max_lines)
+
+    @staticmethod
+    def _limit_lines(lines,max_lines):
+        """
+        internal generator limiting the number of lines
+
+        :param lines: iterator over the output lines
+        :param max_lines: maximal number of lines
+        :return: iterator over the limited output lines (plus truncation line)
+        """
+        cnt=0
+        for line in lines:
+            if cnt>=max_lines:
+                yield ' ... output truncated after %i lines\n'%max_lines
+                return
+            yield line
+            cnt += 1
 
     def _build_item_str(self,itree_object,enum_cnt=None):
         out = ['%s('%itree_object.__class__.__name__]
@@ -89,56 +154,51 @@ class iTreeRender(object):
             out=['%i. '%enum_cnt]+out
         return ''.join(out)
 
-    def _render_main(self, itree_object, filter_method=None,enumerate=False,level=0):
+    def _render_main(self, itree_object, filter_method=None,enumerate=False):
         """
-        internal function for rendering the itertree
+        internal generator for rendering the itertree
+
+        The tree is iterated without recursion (stack of children iterators), so that very deep trees can be
+        rendered too.
 
         :param itree_object: iTree object to be converted
         :param filter_method: item filter method or filter-constant to filter specific items out
         :param enumerate: add enumeration before the items
-        :param level: helper parameter for indentation-level
-        :return: rendered tree output string
+        :return: iterator over the rendered output lines
         """
-        output=[]
-        if level==0:
-            if filter_method:
-                if filter_method(itree_object):
-                    if enumerate:
-                        output.append(self._build_item_str(itree_object,0))
-                    else:
-                        output.append(self._build_item_str(itree_object))
-            else:
-                if enumerate:
-                    output.append(self._build_item_str(itree_object, 0))
-                else:
-                    output.append(self._build_item_str(itree_object))
+        build_item_str=self._build_item_str
+        if not filter_method or filter_method(itree_object):
+            yield build_item_str(itree_object,0 if enumerate else None)
         if filter_method:
-            cnt=0
-            for item in filter(filter_method,itree_object):
-                if item.is_linked:
-                    out = [' ', '.  ' * (level), self._link_heading]
-                else:
-                    out=[' ','.  '*(level),self._heading]
+            get_children=lambda item: filter(filter_method,item)
+        else:
+            get_children=iter
+        iterators=[get_children(itree_object)]
+        counters=[0]
+        # line headings for each level (normal and linked items)
+        headings=[]
+        while iterators:
+            level=len(iterators)-1
+            if level==len(headings):
+                indent=' '+'.  '*level
+                headings.append((indent+self._heading,indent+self._link_heading))
+            heading,link_heading=headings[level]
+            for item in iterators[-1]:
                 if enumerate:
-                    out.append(self._build_item_str(item, cnt))
-                    cnt = cnt + 1
+                    cnt=counters[-1]
+                    counters[-1]=cnt+1
+                    item_str=build_item_str(item,cnt)
                 else:
-                    out.append(self._build_item_str(item))
-                output.append(''.join(out))
-                output.extend(self._render_main(item,filter_method,enumerate=enumerate,level=level+1))
-
-        else:
-            for item in itree_object:
+                    item_str=build_item_str(item)
                 if item.is_linked:
-                    out = [' ', '.  ' * (level), self._link_heading]
-                else:
-                    out = [' ', '.  ' * (level), self._heading]
-                if enumerate:
-                    out.append(self._build_item_str(item, cnt))
-                    cnt = cnt + 1
+                    yield link_heading+item_str
                 else:
-                    out.append(self._build_item_str(item))
-                output.append(''.join(out))
-                output.extend(self._render_main(item, filter_method, enumerate=enumerate, level=level + 1))
-        return ''.join(output)
-
+                    yield heading+item_str
+                if item:
+                    # first the children
+                    iterators.append(get_children(item))
+                    counters.append(0)
+                    break
+            else:  # for loop is finished and not broken
+                del iterators[-1]
+                del counters[-1]
@@ -0,0 +1,165 @@
+"""
+This code is taken from the itertree package:
+  _ _____ _____ _____ _____ _____ _____ _____
+ | |_   _|   __| __  |_   _| __  |   __|   __|
+ |-| | | |   __|    -| | | |    -|   __|   __|
+ |_| |_| |_____|__|__| |_| |__|__|_____|_____|
+
+https://pypi.org/project/itertree/
+GIT Home:
+https://github.com/BR1py/itertree
+The documentation can be found here:
+https://itertree.readthedocs.io/en/latest/index.html
+
+The code is published under MIT license
+For more information see: https://en.wikipedia.org/wiki/MIT_License
+
+CONTENT DESCRIPTION:
+
+This part of code contains the sorted secondary indexes over the numerical values of the in-depth children of
+an iTree (see `iTree().deep.enable_sorted_index()`)
+
+The index stores the numerical values in a sorted list (and the related items in a parallel list). Range
+queries given as `mSetInterval` or `mSetRoster` are answered by bisection in O(log n + k) instead of checking
+each item.
+"""
+
+from bisect import bisect_left, bisect_right
+from numbers import Real
+from operator import itemgetter
+
+from .itree_helpers import NoKey, NoValue
+from .itree_mathsets import mSetInterval, mSetRoster
+
+
+class _iTreeSortedIndex():
+    __slots__ = ('_key', '_values', '_items', '_item_dict')
+
+    def __init__(self, key, items):
+        """
+        create the index over the given items
+
+        :param key: `NoKey` - the value of the items is indexed; other objects - key of the dict (or index of the
+                    list) stored as value; the related sub-value is indexed
+
+        :type items: Iterable
+        :param items: iterable of `iTree`-objects to be indexed
+        """
+        self._key = key
+        get_index_value = self.get_index_value
+        pairs = []
+        for item in items:
+            value = get_index_value(item, key)
+            if value is not NoValue:
+                pairs.append((value, item))
+        pairs.sort(key=itemgetter(0))
+        self._values = [value for value, _ in pairs]
+        self._items = [item for _, item in pairs]
+        self._item_dict = {id(item): value for value, item in pairs}
+
+    @staticmethod
+    def get_index_value(item, key=NoKey):
+        """
+        deliver the indexed value of the item
+
+        Only real numbers are indexed (same as in the `is_item_value_in` filters non-numerical values are ignored),
+        NaN values cannot be sorted and are ignored too.
+
+        :type item: iTree
+        :param item: `iTree`-object
+
+        :param key: `NoKey` or key/index of the sub-value
+
+        :return: numerical value or `NoValue` if the item has no matching value
+        """
+        value = item._value
+        if hasattr(value, 'is_iTValueModel'):
+            value = value.value
+        if key is not NoKey:
+            try:
+                value = value[key]
+            except (TypeError, KeyError, IndexError, AttributeError):
+                return NoValue
+            if hasattr(value, 'is_iTValueModel'):
+                value = value.value
+        if isinstance(value, Real) and value == value:
+            return value
+        return NoValue
+
+    def add(self, items):
+        """
+        add the given items in the index
+
+        :type items: Iterable
+        :param items: iterable of `iTree`-objects
+        """
+        values, sl, item_dict = self._values, self._items, self._item_dict
+        key = self._key
+        for item in items:
+            value = self.get_index_value(item, key)
+            if value is NoValue:
+                continue
+            idx = bisect_right(values, value)
+            values.insert(idx, value)
+            sl.insert(idx, item)
+            item_dict[id(item)] = value
+
+    def remove(self, items):
+        """
+        remove the given items from the index (not indexed items are ignored)
+
+        :type items: Iterable
+        :param items: iterable of `iTree`-objects
+        """
+        values, sl, item_dict = self._values, self._items, self._item_dict
+        for item in items:
+            # we use the stored value, the value of the item might be changed already
+            value = item_dict.pop(id(item), NoValue)
+            if value is NoValue:
+                continue
+            for idx in range(bisect_left(values, value), bisect_right(values, value)):
+                if sl[idx] is item:
+                    del values[idx]
+                    del sl[idx]
+                    break
+
+    def find(self, value_set):
+        """
+        deliver the items with values in the given set
+
+        :type value_set: Union[mSetInterval,mSetRoster]
+        :param value_set: set the values should be in
+
+        :rtype: Optional[list]
+        :return: list of matching items (sorted by value); None in case the set cannot be evaluated via the index
+                 (other objects or sets with variables)
+        """
+        t = type(value_set)
+        if (t is not mSetInterval and t is not mSetRoster) or value_set.has_vars:
+            return None
+        values, sl = self._values, self._items
+        if t is mSetInterval:
+            if value_set.is_int_only and value_set.is_complement:
+                # non integer values inside of the limits are part of the complement too
+                return None
+            lower, upper = value_set.lower_value, value_set.upper_value
+            if value_set.is_complement:
+                # values below and above the interval
+                stop = bisect_right(values, lower) if value_set.is_lower_open else bisect_left(values, lower)
+                start = bisect_left(values, upper) if value_set.is_upper_open else bisect_right(values, upper)
+                result = sl[:stop] + sl[start:]
+            else:
+                start = bisect_left(values, lower) if value_set.is_lower_closed else bisect_right(values, lower)
+                stop = bisect_right(values, upper) if value_set.is_upper_closed else bisect_left(values, upper)
+                result = sl[start:stop]
+            if value_set.is_int_only:
+                # the limits are checked already but the values must be integers too
+                key = self._key
+                result = [item for item in result if self.get_index_value(item, key) in value_set]
+            return result
+        if value_set.is_complement:
+            return None
+        result = []
+        for value in sorted(i.value for i in value_set.items() if isinstance(i.value, Real)):
+            result.extend(sl[bisect_left(values, value):bisect_right(values, value)])
+        return result
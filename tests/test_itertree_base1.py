@@ -22,6 +22,7 @@ the integration tests related to the base iTree functionalities
 
 """
 
+import io
 import os
 import timeit
 import copy
@@ -375,6 +376,88 @@ class Test1_iTreeInstance:
 
         print('\nRESULT OF TEST: add items to iTree -> PASS')
 
+    def test2b_insert_items_in_large_family(self):
+        if not 2 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: insert items in large family')
+        root = iTree('root', subtree=[iTree('fam', i) for i in range(100)])
+        root.insert(50, iTree('other'))
+        values = list(range(100))
+        values.insert(50, None)
+        for pos in (1, 99, 33, 75, 2, 60, 101, 50):
+            root.insert(pos, iTree('fam', -pos))
+            values.insert(pos, -pos)
+            family = [i for i in root if i.tag == 'fam']
+            assert [i.value for i in family] == [v for v in values if v is not None]
+            assert [i.tag_idx for i in family] == [('fam', idx) for idx in range(len(family))]
+            assert [i.idx for i in root] == list(range(len(root)))
+        # rename and replace into the large family
+        other = root.get.single('other')
+        other.rename('fam')
+        assert root[other.tag_idx] is other
+        assert root[('fam', other.tag_idx[1] - 1)].idx == other.idx - 1
+        assert root[('fam', other.tag_idx[1] + 1)].idx == other.idx + 1
+        root.append(iTree('other2'))
+        new = root.__setitem__(len(root) - 1, iTree('fam', 'last'))
+        assert new.tag_idx == ('fam', len(root) - 1)
+        root[10] = iTree('other3')
+        new = root.__setitem__(10, iTree('fam', 'middle'))
+        assert root[('fam', 10)] is new
+        assert [i.tag_idx for i in root] == [('fam', idx) for idx in range(len(root))]
+
+        print('\nRESULT OF TEST: insert items in large family -> PASS')
+
+    def test2c_build_iTree_from_columns(self):
+        if not 2 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: build iTree from columns')
+        size = 1000
+        tags = ['%i' % (i % 7) for i in range(size)]
+        values = list(range(size))
+        root = iTree.from_columns(tags, values, 'root', 'root_value')
+        ref = iTree('root', 'root_value', subtree=[iTree(t, v) for t, v in zip(tags, values)])
+        assert root == ref
+        assert root.tag == 'root' and root.value == 'root_value'
+        assert [i.idx for i in root] == list(range(size))
+        assert [i.tag_idx for i in root] == [i.tag_idx for i in ref]
+        assert root[('3', 10)].value == ref[('3', 10)].value
+        assert all(i.parent is root for i in root)
+        # children are normal leafs
+        leaf = root[0]
+        assert len(leaf) == 0 and leaf.value == 0 and not leaf.flags
+        leaf.append(iTree('sub'))
+        assert leaf[0].parent is leaf
+        root.append(iTree('new'))
+        assert root[-1].tag_idx == ('new', 0)
+        # columns given as iterables or without values
+        root = iTree.from_columns((t for t in tags), range(size))
+        assert [i.value for i in root] == values
+        root = iTree.from_columns(tags)
+        assert all(i.value is NoValue for i in root)
+        assert len(iTree.from_columns([])) == 0
+        if np is not None:
+            root = iTree.from_columns(np.array(tags), np.arange(size))
+            assert root == iTree(subtree=[iTree(t, v) for t, v in zip(tags, values)])
+            assert type(root[1].value) is int
+        # deep flags are given to the children
+        root = iTree.from_columns(tags, values, flags=iTFLAG.READ_ONLY_TREE)
+        assert root.is_tree_read_only and root[0].is_tree_read_only
+        with pytest.raises(PermissionError):
+            root.append(iTree('x'))
+        # subclasses are created via __init__()
+        class MyTree(iTree):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+        root = MyTree.from_columns(tags, values)
+        assert type(root[0]) is MyTree and root[5].value == 5
+        # invalid columns
+        with pytest.raises(ValueError):
+            iTree.from_columns(tags, values[:-1])
+        with pytest.raises(TypeError):
+            iTree.from_columns([[1], 2], [1, 2])
+
+        print('\nRESULT OF TEST: build iTree from columns -> PASS')
+
     def test3_get_items_from_iTree(self):
 
         if not 3 in TEST_SELECTION:
@@ -1044,6 +1127,167 @@ class Test1_iTreeInstance:
 
         print('\nRESULT OF TEST: get items from iTree -> PASS')
 
+    def test3c_get_items_path_cache(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: get items with path cache')
+
+        root = iTree('root', subtree=[iTree('a' if i % 2 else 'b', i,
+                                            subtree=[iTree('x', j, subtree=[iTree('y', 0), iTree('y', 1)])
+                                                     for j in range(3)])
+                                      for i in range(6)])
+        root.get.enable_path_cache()
+        assert root._path_cache_cnt == 1
+        item = root.get(('a', 1), ('x', 2), 1)
+        assert item is root[3][2][1]
+        assert root.get(('a', 1), ('x', 2), 1) is item
+        assert len(root.get._path_cache) == 1
+        # not unique results and unhashable targets are not cached
+        assert root.get('a', ('x', 0)) == [root[1][0], root[3][0], root[5][0]]
+        assert root.get([0, 1], 0) == [root[0][0], root[1][0]]
+        assert len(root.get._path_cache) == 1
+        assert root.get(-1).value == 5
+        assert root.get(('zz', 0), default=None) is None
+
+        # structural changes in the subtree invalidate the cache
+        root[3][2].insert(0, iTree('y', 'new'))
+        assert root.get._path_cache == {}
+        assert root.get(('a', 1), ('x', 2), 1) is root[3][2][1]
+        assert root.get(('a', 1), ('x', 2), 1).value == 0
+        root.append(iTree('a', 6))
+        assert root.get(-1).value == 6
+        root[3].rename('c')
+        assert root.get(('a', 1), ('x', 2), 1, default=None) is root[5][2][1]
+        del root[5]
+        assert root.get(('a', 1)).value == 6
+        assert root.get(('a', 2), default=None) is None
+        root.sort(key=lambda i: i.value, reverse=True)
+        assert root.get(0).value == 6
+        root.deep.reverse()
+        assert root.get(0).value == 0
+        # value changes keep the cache
+        root.get(0).set_value('changed')
+        assert root.get(0).value == 'changed'
+
+        # caches in sub-items
+        sub = root[1]
+        sub.get.enable_path_cache()
+        assert root._path_cache_cnt == 2
+        assert sub.get(0, 0) is sub[0][0]
+        sub[0].clear()
+        assert sub.get(0, 0, default=None) is None
+        sub.get.disable_path_cache()
+        root.get.disable_path_cache()
+        assert root._path_cache_cnt == 0
+
+        # equal targets of different types (index vs. tag) are cached separately
+        mixed = iTree('mixed', subtree=[iTree(1, 'a'), iTree(True, 'b'), iTree('x', 'c'), iTree(1.0, 'd')])
+        expected = [mixed.get(t) for t in (1, True, 1.0, (1, 0), (True, 1))]
+        assert [i.value for i in expected[1]] == ['a', 'b', 'd']
+        mixed.get.enable_path_cache()
+        for _ in range(2):
+            assert [mixed.get(t) for t in (1, True, 1.0, (1, 0), (True, 1))] == expected
+        # the types inside of the (tag, family-index) pairs are considered too
+        assert mixed.get((True, 1)).value == 'b'
+        assert mixed.get((True, 1.0), default=None) is None
+        assert mixed.get(TagIdx(True, 1)).value == 'b'
+        mixed.get.disable_path_cache()
+
+        print('\nRESULT OF TEST: get items with path cache -> PASS')
+
+    def test3d_get_items_compiled_path(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: get items via compiled path')
+
+        root = iTree('root', subtree=[iTree('a' if i % 2 else 'b', i,
+                                            subtree=[iTree('x', j, subtree=[iTree('y', 0), iTree('y', 1)])
+                                                     for j in range(3)])
+                                      for i in range(6)])
+        root.append(iTree(('a', 0), 'tuple_tag'))
+        root.append(iTree(3, 'int_tag'))
+
+        # unique paths deliver the item (same as get())
+        for targets in [(0,), (-1,), (('a', 1), ('x', 2), 1), (2, ('x', -1), -2), (TagIdx('a', 0), 0)]:
+            path = iTree.compile_path(*targets)
+            assert path.get(root) is root.get(*targets)
+            assert path.exists(root)
+            assert list(path.iter(root)) == [root.get(*targets)]
+        # not unique paths deliver lists
+        for targets in [('a',), (('a', slice(0, 2)),), ({'a', 'b'}, 0), ([0, ('a', 1)], ('x', 0)),
+                        (..., lambda item: item.value == 1), (iter, ('x', 2), 0), (('b', [0, 2]),)]:
+            path = iTree.compile_path(*targets)
+            assert path.get(root) == root.get(*targets)
+            assert list(path.iter(root)) == root.get(*targets)
+            assert path.exists(root)
+        # targets interpreted by type; tags looking like index or key must be marked
+        assert iTree.compile_path(3).get(root) is root[3]
+        assert iTree.compile_path(Tag(3)).get(root) == [root[-1]]
+        assert iTree.compile_path(('a', 0)).get(root) is root[1]
+        assert iTree.compile_path(Tag(('a', 0))).get(root) == [root[-2]]
+        assert iTree.compile_path(('a', 0, 1)).get(root, default=None) is None
+
+        # not found
+        for targets in [(99,), (('a', 5),), ('z',), (0, 0, 0, 0), (('b', 0), ('x', 0), ('y', 0), 0), ({'z'},),
+                        (lambda item: False,)]:
+            path = iTree.compile_path(*targets)
+            assert not path.exists(root)
+            assert list(path.iter(root)) == []
+            assert path.get(root, default=None) is None
+            with pytest.raises(KeyError):
+                path.get(root)
+        # compiled path parts are skipped if not existing
+        assert iTree.compile_path(('b', [0, 99])).get(root) == [root[0]]
+        with pytest.raises(TypeError):
+            iTree.compile_path({'unhashable': 1})
+
+        # paths are reusable after changes
+        path = iTree.compile_path(('a', 1), ('x', 0))
+        item = path.get(root)
+        root.insert(0, iTree('a', 'new', subtree=[iTree('x')]))
+        assert path.get(root) is not item
+        assert path.get(root) is root.get(('a', 1), ('x', 0))
+
+        print('\nRESULT OF TEST: get items via compiled path -> PASS')
+
+    def test3e_get_many_items(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: get many items')
+
+        root = iTree('root', subtree=[iTree('a' if i % 2 else 'b', i,
+                                            subtree=[iTree('x', j, subtree=[iTree('y', 0), iTree('y', 1)])
+                                                     for j in range(3)])
+                                      for i in range(6)])
+        paths = [(('a', 1), ('x', 2), 1), (('a', 1), ('x', 2), 0), (('a', 1), ('x', 0)), (('a', 1),), (0, 0, 0),
+                 ('a',), (('b', 0), 'x'), ([0, 1], 0), ({'a'}, ('x', 0)), (lambda i: i.value == 3, 1),
+                 (('a', 1), ('x', 2), 1), (), [-1, -1]]
+        result = root.get.many(paths)
+        assert result == [root.get(*path) for path in paths]
+        assert result[0] is root[3][2][1]
+        assert result[-2] is root
+        # the order of the paths is kept
+        result = root.get.many(reversed(paths))
+        assert result == [root.get(*path) for path in reversed(paths)]
+
+        # not matching paths
+        paths = [(0, 0), (('z', 0), 0), (('a', 0), ('x', 5)), (0, 0, 0, 0), (('a', 9),), (('a', 0), 1)]
+        assert root.get.many(paths, default=None) == [root[0][0], None, None, None, None, root[1][1]]
+        with pytest.raises(KeyError):
+            root.get.many(paths)
+        with pytest.raises(IndexError):
+            root.get.many([(99,)])
+        assert root.get.many([]) == []
+
+        # equal targets of different types (index vs. tag) are not merged
+        mixed = iTree('mixed', subtree=[iTree(1, 'a', subtree=[iTree(0)]), iTree(True, 'b', subtree=[iTree(1)]),
+                                        iTree('x', 'c'), iTree(1.0, 'd')])
+        paths = [(1,), (True,), (1.0,), (1, 0), ((True, 0), 0), ((1, 1), 0), ((1.0, 0),)]
+        assert mixed.get.many(paths) == [mixed.get(*path) for path in paths]
+        assert mixed.get.many([(1,), (True,)])[0].value == 'b'
+
+        print('\nRESULT OF TEST: get many items -> PASS')
+
     def test4_delete_items_from_iTree(self):
         if not 4 in TEST_SELECTION:
             return
@@ -1271,6 +1515,69 @@ class Test1_iTreeInstance:
 
         print('\nRESULT OF TEST: delete items from iTree - PASS')
 
+    def test4b_delete_many_items_from_iTree(self):
+        if not 4 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: bulk delete items from iTree')
+        size = 1000
+        root = iTree('root', subtree=[iTree('%i' % (i % 3), i) for i in range(size)])
+        deleted = root.delete_many(lambda i: i.value % 2)
+        assert len(deleted) == size // 2
+        assert all(i.parent is None for i in deleted)
+        assert [i.value for i in root] == list(range(0, size, 2))
+        assert all(i.idx == idx for idx, i in enumerate(root))
+        for tag in ('0', '1', '2'):
+            family = root.get.by_tag(tag)
+            assert all(i.tag_idx == (tag, idx) for idx, i in enumerate(family))
+            assert [i.value for i in family] == [i.value for i in root if i.tag == tag]
+
+        # mixed targets (double targets are deleted only once)
+        item = root[-1]
+        deleted = root.delete_many([0, ('0', 0), ('1', 1), item, slice(1, 3)])
+        assert len(deleted) == 5
+        assert item not in root
+        assert [i.value for i in root][:3] == [6, 8, 12]
+        with pytest.raises(KeyError):
+            root.delete_many([('x', 0)])
+        with pytest.raises(ValueError):
+            root.delete_many([iTree('x')])
+        assert len(root) == size // 2 - 5
+
+        # delete all
+        deleted = root.delete_many(lambda i: True)
+        assert len(root) == 0
+        assert not root.is_tag_in('0')
+        assert root.delete_many(lambda i: True) == []
+        root.append(iTree('new'))
+        assert root.get.by_tag_idx(('new', 0)).idx == 0
+
+        # protected trees
+        ro_root = iTree('root', subtree=[iTree('a'), iTree('b')], flags=iTFLAG.READ_ONLY_TREE)
+        with pytest.raises(PermissionError):
+            ro_root.delete_many(lambda i: True)
+        with pytest.raises(PermissionError):
+            ro_root.remove(list(ro_root))
+        assert len(ro_root) == 2
+
+        # linked items are protected; local items that cover linked items are replaced by the linked item
+        root = iTree('root', subtree=[iTree('A', subtree=[iTree('a', 0), iTree('b', 1), iTree('c', 2)]),
+                                      iTree('link', link=iTLink(None, [('A', 0)]))])
+        link_root = root[-1]
+        link_root.append(iTree('local', 3))
+        link_root.append(iTree('b', 'local_b'))
+        root.load_links()
+        assert link_root[('b', 0)].value == 'local_b'
+        with pytest.raises(PermissionError):
+            link_root.delete_many([('a', 0), ('local', 0)])
+        assert len(link_root) == 4
+        deleted = link_root.delete_many([('local', 0), ('b', 0)])
+        assert [i.value for i in deleted] == [3, 'local_b']
+        assert [(i.tag, i.value) for i in link_root] == [('a', 0), ('b', 1), ('c', 2)]
+        assert all(i.is_linked for i in link_root)
+        assert [i.idx for i in link_root] == [0, 1, 2]
+
+        print('\nRESULT OF TEST: bulk delete items from iTree - PASS')
+
     def test5_rearrange_items_from_iTree(self):
         if not 5 in TEST_SELECTION:
             return
@@ -1513,6 +1820,216 @@ class Test1_iTreeInstance:
 
         print('\nRESULT OF TEST: set(replace)/rearrange items in iTree -> PASS')
 
+    def test5b_rotate_items_in_iTree(self):
+        if not 5 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: rotate items in iTree')
+        size = 100
+        root = iTree('root', subtree=[iTree('%i' % (i % 3), i) for i in range(size)])
+        values = list(range(size))
+        for n in (1, 2, 37, -1, -55, 0, size, 3 * size + 7, -2 * size - 3):
+            root.rotate(n)
+            values = values[-(n % size):] + values[:-(n % size)]
+            assert [i.value for i in root] == values
+            # caches and families are consistent with the new order
+            assert [i.idx for i in root] == list(range(size))
+            for tag in ('0', '1', '2'):
+                family = root.get.by_tag(tag)
+                assert [i.value for i in family] == [v for v in values if v % 3 == int(tag)]
+                assert [i.tag_idx for i in family] == [(tag, idx) for idx in range(len(family))]
+            assert root[0].parent is root
+        # trees with less than two children are not changed
+        leaf = iTree('leaf')
+        leaf.rotate(3)
+        assert len(leaf) == 0
+        single = iTree('single', subtree=[iTree('a')])
+        single.rotate(-3)
+        assert single[0].tag_idx == ('a', 0)
+        # protected tree
+        root.set_tree_read_only()
+        with pytest.raises(PermissionError):
+            root.rotate(1)
+        assert [i.value for i in root] == values
+
+        print('\nRESULT OF TEST: rotate items in iTree -> PASS')
+
+    def test5c_sort_items_in_iTree(self):
+        if not 5 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: sort items in iTree')
+        size = 300
+        values = [(i * 7) % 11 for i in range(size)]
+        root = iTree('root', subtree=[iTree('%i' % (i % 3), v) for i, v in enumerate(values)])
+        children = list(root)
+        sub = root[5].append(iTree('sub'))
+        calls = []
+
+        def key(item):
+            calls.append(item)
+            return item.value
+
+        for reverse in (False, True):
+            del calls[:]
+            root.sort(key=key, reverse=reverse)
+            # key is evaluated once per child
+            assert len(calls) == size
+            # sorting is stable and the children are not copied
+            expected = sorted(children, key=lambda i: i.value, reverse=reverse)
+            assert all(a is b for a, b in zip(root, expected))
+            assert [i.idx for i in root] == list(range(size))
+            assert all(i._itree_prt_idx[1] == idx for idx, i in enumerate(root))
+            for tag in ('0', '1', '2'):
+                family = root.get.by_tag(tag)
+                assert [i for i in family] == [i for i in expected if i.tag == tag]
+                assert all(i._itree_prt_idx[2] == idx for idx, i in enumerate(family))
+                assert all(root[i.tag_idx] is i for i in family)
+            assert sub.parent.parent is root
+            assert root.get(*sub.idx_path) is sub
+        # mixed key types use the build-in sorting
+        root.sort(key=lambda i: i.value if i.tag != '0' else float(i.value))
+        assert [i.value for i in root] == sorted(values)
+        # default sorting (len of the items)
+        root.sort(reverse=True)
+        assert root[0] is sub.parent
+
+        print('\nRESULT OF TEST: sort items in iTree -> PASS')
+
+    def test5d_move_items_in_iTree(self):
+        if not 5 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: move items in iTree')
+        size = 60
+        root = iTree('root', subtree=[iTree('%i' % (i % 3), i) for i in range(size)])
+        values = list(range(size))
+
+        def check():
+            assert [i.value for i in root] == values
+            assert all(i._itree_prt_idx[1] == idx for idx, i in enumerate(root))
+            for tag in ('0', '1', '2'):
+                family = root.get.by_tag(tag)
+                assert [i.value for i in family] == [v for v in values if v % 3 == int(tag)]
+                assert all(i._itree_prt_idx[2] == idx for idx, i in enumerate(family))
+
+        # the move is equal to a delete followed by an insert
+        for src, target in ((0, 10), (10, 0), (5, 6), (6, 5), (3, 3), (59, 0), (0, 59), (20, -1), (30, -30),
+                            (40, 1000), (7, None)):
+            item = root[src]
+            assert item.move(target) is item
+            v = values.pop(src)
+            if target is None:
+                values.append(v)
+            else:
+                values.insert(target, v)
+            check()
+        # target given as item or key
+        item = root[3]
+        target = root[('1', 5)]
+        target_idx = target.idx
+        item.move(target)
+        values.insert(target_idx, values.pop(3))
+        check()
+
+        # move many
+        items = [root[0], root[10], root[('2', 3)]]
+        moved = root.move_many([(items[0], 5), (10, -1), (('2', 3), 0)])
+        assert moved == items
+        assert root[5] is items[0] and root[-1] is items[1] and root[0] is items[2]
+        moved_values = [i.value for i in items]
+        others = [v for v in values if v not in moved_values]
+        values = others[:]
+        values.insert(0, moved_values[2])
+        values.insert(5, moved_values[0])
+        values.append(moved_values[1])
+        check()
+        # dict with index keys
+        root.move_many({0: 1, 1: 0})
+        values[0], values[1] = values[1], values[0]
+        check()
+        assert root.move_many([]) == []
+        # invalid moves do not change the tree
+        with pytest.raises(ValueError):
+            root.move_many([(0, 1), (1, 1)])
+        with pytest.raises(ValueError):
+            root.move_many([(0, 1), (root[0], 2)])
+        with pytest.raises(IndexError):
+            root.move_many([(0, size)])
+        with pytest.raises(ValueError):
+            root.move_many([(iTree('no_child'), 0)])
+        with pytest.raises(LookupError):
+            root.move_many([('1', 0)])
+        check()
+        root.set_tree_read_only()
+        with pytest.raises(PermissionError):
+            root.move_many([(0, 1)])
+        with pytest.raises(PermissionError):
+            root[0].move(1)
+        check()
+
+        print('\nRESULT OF TEST: move items in iTree -> PASS')
+
+    def test5e_rename_items_in_iTree(self):
+        if not 5 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: rename items in iTree')
+        size = 60
+        # all children have the same content -> rename must not depend on equality
+        root = iTree('root', subtree=[iTree('%i' % (i % 3)) for i in range(size)])
+        children = list(root)
+
+        def check():
+            assert list(root) == children
+            assert all(a is b for a, b in zip(root, children))
+            assert [i.idx for i in root] == list(range(size))
+            tags = {i.tag for i in root}
+            assert set(root.tags()) == tags
+            for tag in tags:
+                family = root.get.by_tag(tag)
+                assert all(a is b for a, b in zip(family, [i for i in children if i.tag == tag]))
+                assert [i.tag_idx for i in family] == [(tag, idx) for idx in range(len(family))]
+
+        item = children[30]
+        assert item.rename('1') is item
+        assert root[item.tag_idx] is item
+        check()
+        item = children[4]
+        assert item.rename('new') is item
+        assert item.tag_idx == ('new', 0)
+        check()
+        assert iTree('no_parent').rename('x').tag == 'x'
+
+        # rename many by mapping
+        renamed = root.rename_many({'0': 'zero', '2': 'two', 'unknown': 'x'})
+        assert len(renamed) == 39
+        assert all(i.tag in ('zero', 'two') for i in renamed)
+        check()
+        # swap of two families
+        renamed = root.rename_many({'zero': 'two', 'two': 'zero'})
+        assert len(renamed) == 39
+        check()
+        # rename many by callable (unchanged tags are not reported)
+        renamed = root.rename_many(lambda i: 'even' if i.idx % 2 == 0 else i.tag)
+        assert len(renamed) == size // 2
+        assert root.get.by_tag('even')[-1] is children[-2]
+        check()
+        # invalid tags do not change the tree
+        with pytest.raises(TypeError):
+            root.rename_many(lambda i: [] if i.idx == 10 else 'a')
+        check()
+        root.set_tree_read_only()
+        with pytest.raises(PermissionError):
+            root.rename_many({'even': 'odd'})
+        check()
+        # items without children
+        empty = iTree('empty')
+        assert empty.rename_many({'a': 'b'}) == []
+        assert empty.rename_many(lambda i: 'b') == []
+        assert len(empty) == 0
+        empty.append(iTree('a'))
+        assert empty.rename_many({'a': 'b'}) == [empty[0]]
+        assert empty.get.by_tag('b')[0] is empty[0]
+
+        print('\nRESULT OF TEST: rename items in iTree -> PASS')
+
     def test6_iTree_properties(self):
         if not 6 in TEST_SELECTION:
             return
@@ -1707,6 +2224,136 @@ class Test1_iTreeInstance:
 
         print('\nRESULT OF TEST: iTree properties(b) -> PASS')
 
+    def test6c_iTree_index_cache(self):
+        if not 6 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree index cache')
+        size = 1000
+        root = iTree('root', subtree=[iTree('%i' % (i % 3), i) for i in range(size)])
+        sub = root[500].append(iTree('sub'))
+        # large shifts of the siblings
+        for _ in range(100):
+            del root[0]
+        for _ in range(50):
+            root.appendleft(iTree('0', -1))
+        for i in range(0, 100, 3):
+            del root[('1', 0)]
+        items = list(root)
+        assert [i.idx for i in reversed(items)] == list(range(len(items) - 1, -1, -1))
+        # all siblings are updated in one pass
+        assert all(i._itree_prt_idx[1] == idx for idx, i in enumerate(root))
+        for tag in ('0', '1', '2'):
+            family = root.get.by_tag(tag)
+            assert [i.tag_idx for i in reversed(family)] == [(tag, idx) for idx in range(len(family) - 1, -1, -1)]
+        assert sub.idx_path == (sub.parent.idx, 0)
+        assert sub.tag_idx_path == (sub.parent.tag_idx, ('sub', 0))
+        assert root.get(*sub.idx_path) is sub
+        assert root.get(*sub.tag_idx_path) is sub
+
+        print('\nRESULT OF TEST: iTree index cache -> PASS')
+
+    def test6d_iTree_subtree_aggregates(self):
+        if not 6 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree subtree aggregates')
+        root = iTree('root', subtree=[iTree('a', i, subtree=[iTree('b', subtree=[iTree('c')] if j == 1 else [])
+                                                             for j in range(3)]) for i in range(10)])
+
+        def depth(item):
+            return 1 + max(depth(i) for i in item) if item else 0
+
+        def check():
+            for item in [root] + list(root.deep):
+                assert len(item.deep) == sum(1 for _ in item.deep)
+                assert item.max_depth == depth(item)
+
+        assert len(root.deep) == 50
+        assert root.max_depth == 3
+        root.deep.enable_aggregates()
+        check()
+        assert len(root.deep) == 50
+        assert root.max_depth == 3
+        # changes are tracked
+        root[0][0].append(iTree('d', subtree=[iTree('e')]))
+        assert root.max_depth == 4
+        assert len(root.deep) == 52
+        check()
+        del root[0][0]
+        assert root.max_depth == 3
+        assert len(root.deep) == 49
+        root.insert(1, iTree('ins'))
+        root.extend([iTree('ext', subtree=[iTree('x')])])
+        root.extendleft([iTree('ext_left')])
+        root[3].delete_many([0, 1])
+        root[4][1].clear()
+        check()
+        assert root[4].max_depth == 1
+        root[2] = iTree('replaced', subtree=[iTree('x', subtree=[iTree('y', subtree=[iTree('z')])])])
+        assert root.max_depth == 4
+        check()
+        root.deep.disable_aggregates()
+        check()
+
+        print('\nRESULT OF TEST: iTree subtree aggregates -> PASS')
+
+    def test6e_iTree_position_cache(self):
+        if not 6 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree position cache')
+        root = iTree('root', subtree=[iTree('a', i, subtree=[iTree('b', subtree=[iTree('c')] if j == 1 else [])
+                                                             for j in range(3)]) for i in range(10)])
+
+        def positions():
+            return [(item.level, item.idx_path, item.tag_idx_path) for item in [root] + list(root.deep)]
+
+        def check():
+            result = positions()
+            iTree.disable_position_cache()
+            try:
+                assert result == positions()
+            finally:
+                iTree.enable_position_cache()
+
+        iTree.enable_position_cache()
+        try:
+            check()
+            item = root[3][1][0]
+            assert item.level == 3
+            assert item.idx_path == (3, 1, 0)
+            # interned tuples
+            assert item.idx_path is item.idx_path
+            assert item.tag_idx_path is item.tag_idx_path
+            path = item.idx_path
+            # structural changes outdate the cache
+            root.insert(0, iTree('ins'))
+            assert item.idx_path == (4, 1, 0)
+            assert item.idx_path is not path
+            check()
+            # re-parented subtree
+            sub = root[4]
+            del root[4]
+            assert item.level == 2
+            assert item.idx_path == (1, 0)
+            root[1][0].append(sub)
+            assert item.level == 5
+            assert item.idx_path == (1, 0, 0, 1, 0)
+            check()
+            root[1].rename('new')
+            root[2].move(0)
+            root[0].sort(key=lambda i: -i.idx)
+            check()
+            root[2] = iTree('replaced', subtree=[iTree('x', subtree=[iTree('y')])])
+            assert root[2][0][0].level == 3
+            check()
+            # siblings with negative levels are based on the levels
+            siblings = list(root.deep.siblings(-2))
+            iTree.disable_position_cache()
+            assert siblings == list(root.deep.siblings(-2))
+        finally:
+            iTree.disable_position_cache()
+
+        print('\nRESULT OF TEST: iTree position cache -> PASS')
+
     def test7_iTree_internals_methods(self):
         if not 7 in TEST_SELECTION:
             return
@@ -1731,6 +2378,227 @@ class Test1_iTreeInstance:
 
         print('\nRESULT OF TEST: iTree internals-> PASS')
 
+    def test7b_iTree_compact_leafs(self):
+        if not 7 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree compact leafs')
+
+        # leafs share the empty children container and the helper objects are created on first usage
+        root = iTree('root', subtree=[iTree('a', 1), iTree('b', 2), iTree('a', 3)])
+        leaf1, leaf2 = root[0], root[1]
+        assert leaf1._items is leaf2._items
+        assert not hasattr(leaf1, '_hc_get')
+        assert not hasattr(leaf1, '_hc_tree')
+        assert not hasattr(leaf1, '_families')
+        assert len(leaf1) == 0
+        assert not leaf1
+        assert list(leaf1) == []
+        assert leaf1.getitem_by_idx(slice(None)) == []
+        assert leaf1.get.by_idx(0, default=None) is None
+        assert leaf1.get('x', default=None) is None
+        assert hasattr(leaf1, '_hc_get')
+        assert not hasattr(leaf2, '_hc_get')
+        with pytest.raises(KeyError):
+            leaf1[0]
+
+        # an already created getter helper must follow the first child
+        get = leaf1.get
+        leaf1.append(iTree('x', 1))
+        assert leaf1.get is get
+        assert get.by_idx(0).value == 1
+        assert get.by_tag_idx(('x', 0)).value == 1
+        assert leaf1._items is not leaf2._items
+        leaf2.extend([iTree('y', 1), iTree('y', 2)])
+        assert leaf2.get.by_tag_idx(('y', 1)).value == 2
+        assert len(leaf2) == 2
+
+        # clear and rebuild
+        leaf2.clear()
+        assert leaf2._items is root[2]._items
+        assert leaf2.get('y', default=None) is None
+        assert leaf2.get.by_tag('y', default=None) is None
+        leaf2.append(iTree('z', 1))
+        assert leaf2.get.by_tag_idx(('z', 0)).value == 1
+        assert leaf2.get.by_idx(0).value == 1
+
+        # in-place operations on empty trees
+        empty = iTree()
+        empty.reverse()
+        empty.sort()
+        empty.extend([])
+        empty.extendleft([])
+        assert len(empty) == 0
+        empty.extendleft([iTree('b', 2), iTree('c', 3)])
+        empty.extendleft([iTree('a', 1)])
+        assert [i.tag for i in empty] == ['a', 'b', 'c']
+        assert empty.get.by_tag_idx(('c', 0)).idx == 2
+        empty.sort(key=lambda i: i.value, reverse=True)
+        assert [i.tag for i in empty] == ['c', 'b', 'a']
+
+        # copies and pickle deliver compact leafs too
+        root2 = pickle.loads(pickle.dumps(root))
+        assert root2 == root
+        assert root2[2]._items is root[2]._items
+        assert root.copy()[2]._items is root[2]._items
+
+        print('\nRESULT OF TEST: iTree compact leafs -> PASS')
+
+    def test7c_iTree_copy_on_write(self):
+        if not 7 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree copy-on-write')
+
+        source = iTree('root', subtree=[iTree('a' if i % 2 else 'b', i,
+                                              subtree=[iTree('x', j, subtree=[iTree('y', 0), iTree('y', 1)])
+                                                       for j in range(3)])
+                                        for i in range(5)])
+        compare = source.copy()
+
+        # source must be tree read-only
+        with pytest.raises(ValueError):
+            source.copy(copy_on_write=True)
+        source.set_tree_read_only()
+
+        # copy is equal but the children are not created yet
+        cow_copy = source.copy(copy_on_write=True)
+        assert not cow_copy.is_tree_read_only
+        assert len(cow_copy) == 5
+        assert cow_copy._items is not source._items
+        assert not isinstance(cow_copy._items, list)
+        assert cow_copy == source
+        # the representation creates the children
+        assert repr(cow_copy) == repr(compare)
+        assert repr(source.copy(copy_on_write=True)[1]) == repr(compare[1])
+        assert len(list(cow_copy.deep)) == len(list(source.deep))
+        assert cow_copy.copy() == compare
+
+        # a change in the deep creates only the items on the path
+        cow_copy = source.copy(copy_on_write=True)
+        cow_copy[2][1].append(iTree('new', 'value'))
+        assert isinstance(cow_copy[2][1]._items, list)
+        assert not isinstance(cow_copy[2][0]._items, list)
+        assert not isinstance(cow_copy[0]._items, list)
+        assert cow_copy[2][1][-1].idx_path == (2, 1, 2)
+        assert cow_copy[2][1][-1].tag_idx_path == (('b', 1), ('x', 1), ('new', 0))
+        assert cow_copy.get.by_tag_idx(('a', 1)).tag_idx == ('a', 1)
+        assert cow_copy != source
+        assert source == compare
+
+        # structural changes in the copy
+        cow_copy = source.copy(copy_on_write=True)
+        del cow_copy[0]
+        cow_copy.insert(1, iTree('z'))
+        cow_copy[0].rename('k')
+        assert [i.tag for i in cow_copy] == ['k', 'z', 'b', 'a', 'b']
+        assert cow_copy[3].tag_idx == ('a', 0)
+        cow_copy = source.copy(copy_on_write=True)
+        cow_copy.sort(key=lambda i: i.value, reverse=True)
+        assert [i.value for i in cow_copy] == [4, 3, 2, 1, 0]
+        cow_copy[4].clear()
+        assert len(cow_copy[4]) == 0
+        assert source == compare
+
+        # the source protection cannot be removed anymore
+        with pytest.raises(PermissionError):
+            source.unset_tree_read_only()
+        with pytest.raises(PermissionError):
+            source.deep.unset_tree_read_only()
+        source.set_value_read_only()
+        source.unset_value_read_only()
+        assert source.is_tree_read_only
+
+        # the values of the source cannot be changed anymore (the copy takes them over in the moment the children
+        # are created)
+        cow_copy = source.copy(copy_on_write=True)
+        for item in (source, source[1], source[1][2][0]):
+            with pytest.raises(PermissionError):
+                item.set_value(100)
+            with pytest.raises(PermissionError):
+                item.del_value()
+        with pytest.raises(PermissionError):
+            source[2].set_key_value(0, 200)
+        assert [i.value for i in cow_copy.deep] == [i.value for i in compare.deep]
+        assert source == compare
+        assert pickle.loads(pickle.dumps(source.copy(copy_on_write=True))) == compare
+
+        # empty source
+        empty = iTree('empty')
+        empty.set_tree_read_only()
+        empty_copy = empty.copy(copy_on_write=True)
+        empty_copy.append(iTree('a'))
+        assert len(empty_copy) == 1
+        empty.unset_tree_read_only()
+
+        print('\nRESULT OF TEST: iTree copy-on-write -> PASS')
+
+    def test7d_iTree_persistent_versions(self):
+        if not 7 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree persistent versions')
+
+        live = iTree('cfg', subtree=[iTree('sec%i' % i, i, subtree=[iTree('k', {'v': j}) for j in range(5)])
+                                     for i in range(10)])
+        # the updates require a frozen version
+        with pytest.raises(ValueError):
+            live.persistent.append(iTree('new'))
+        v1 = live.copy()
+        v1.set_tree_read_only()
+
+        v2 = v1.persistent.append(iTree('new', 1), ('sec3', 0))
+        v3 = v2.persistent.set_value({'v': 99}, ('sec3', 0), ('k', 0))
+        v4 = v3.persistent.delete(('sec0', 0))
+        v5 = v4.persistent.insert(0, iTree('first'))
+        v6 = v5.persistent.evolve(lambda item: item.rename('renamed'), ('sec9', 0))
+        with pytest.raises(ValueError):
+            v6.persistent.delete()
+
+        # old versions are untouched
+        assert v1 == live
+        assert len(v1[('sec3', 0)]) == 5
+        assert len(v2[('sec3', 0)]) == 6
+        assert v2[('sec3', 0)][-1].tag_idx == ('new', 0)
+        assert v2[('sec3', 0)][0].value == {'v': 0}
+        assert v3[('sec3', 0)][0].value == {'v': 99}
+        assert len(v3) == 10
+        assert len(v4) == 9
+        assert v4[0].tag == 'sec1'
+        assert [i.tag for i in v5][:2] == ['first', 'sec1']
+        assert v6[-1].tag_idx == ('renamed', 0)
+        assert v5[-1].tag_idx == ('sec9', 0)
+        assert v6[3][0].value == {'v': 99}
+
+        # all versions are frozen
+        for version in (v2, v3, v4, v5, v6):
+            assert version.is_tree_read_only
+            assert version[-1].is_tree_read_only
+            assert version[-1][0].is_tree_read_only
+            with pytest.raises(PermissionError):
+                version[-1].append(iTree('x'))
+        with pytest.raises(PermissionError):
+            v1.unset_tree_read_only()
+
+        # the values of all versions are frozen too (a change in an old version cannot leak into newer versions)
+        v7 = v6.persistent.set_value(200, ('sec5', 0), ('k', 2))
+        for version in (v1, v2, v6, v7):
+            for target_path in ((('sec5', 0), ('k', 2)), (('sec5', 0), ('k', 3)), (('sec5', 0),)):
+                with pytest.raises(PermissionError):
+                    version.get.single(*target_path).set_value(300)
+        assert v6[('sec5', 0)][2].value == {'v': 2}
+        assert v7[('sec5', 0)][2].value == 200
+        assert v7[('sec5', 0)][3].value == {'v': 3}
+        assert v1 == live
+
+        # chain of many versions
+        version = v1
+        for i in range(100):
+            version = version.persistent.set_value(i, ('sec%i' % (i % 10), 0), ('k', i % 5))
+        assert version[('sec9', 0)][4].value == 99
+        assert version[('sec0', 0)][0].value == 90
+        assert v1[('sec9', 0)][4].value == {'v': 4}
+        assert len(list(version.deep)) == len(list(v1.deep))
+
+        print('\nRESULT OF TEST: iTree persistent versions -> PASS')
+
     def test8_iTree_value_related_methods(self):
         if not 7 in TEST_SELECTION:
             return
@@ -1864,6 +2732,133 @@ class Test1_iTreeInstance:
 
         print('\nRESULT OF TEST: iTree value methods-> PASS')
 
+    def test8b_iTree_value_index(self):
+        if not 8 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree value index')
+
+        root = iTree('root', subtree=[iTree('sec', i % 3, subtree=[iTree('k', (i, j % 2)) for j in range(4)])
+                                      for i in range(6)])
+
+        def check():
+            for value in (0, 1, 2, (0, 0), (1, 1), (5, 0), 'new', 99, [1]):
+                expected = [i for i in root.deep if i.value == value]
+                result = root.deep.find_by_value(value)
+                assert len(result) == len(expected)
+                assert all(any(i is j for j in expected) for i in result)
+
+        # without index the result is searched
+        assert root.deep.find_by_value((1, 1)) == [root[1][1], root[1][3]]
+        assert root.deep.find_by_value('new') == []
+
+        root.deep.enable_value_index()
+        check()
+        # the order is not defined in the index
+        assert {id(i) for i in root.deep.find_by_value(2)} == {id(root[2]), id(root[5])}
+        # changes are tracked
+        root[0].set_value(99)
+        check()
+        root[1][0].del_value()
+        check()
+        root[1].append(iTree('new', 'new'))
+        root.insert(2, iTree('ins', 'new', subtree=[iTree('sub', 99)]))
+        root.appendleft(iTree('left', 1))
+        check()
+        root.extend([iTree('ext', 0), iTree('ext', 'new')])
+        root.extendleft([iTree('ext_left', 'new')])
+        check()
+        del root[3]
+        root.remove(root[2])
+        root.pop()
+        check()
+        root[4] = iTree('replaced', 'new')
+        check()
+        root[5].clear()
+        check()
+        root[3].set_value([1])
+        root[3].set_key_value(0, 2)
+        check()
+        assert root.deep.find_by_value([2]) == [root[3]]
+        # subtree indexes are updated together with the root index
+        root[4].deep.enable_value_index()
+        root[4].append(iTree('sub_new', 'new'))
+        assert root[4].deep.find_by_value('new') == [root[4][-1]]
+        check()
+        root[4].deep.disable_value_index()
+        root.deep.disable_value_index()
+        check()
+
+        # equal values of different types do not match (same result with and without index)
+        mixed = iTree('mixed', subtree=[iTree('a', 1), iTree('b', True), iTree('c', 1.0), iTree('d', (1, 2)),
+                                        iTree('e', 2)])
+        if np is not None:
+            mixed.append(iTree('f', np.float64(2.0)))
+        values = (1, True, 1.0, 2, 2.0, (1, 2), (True, 2)) + ((np.float64(2.0),) if np is not None else ())
+        expected = [mixed.deep.find_by_value(value) for value in values]
+        assert expected[:4] == [[mixed[0]], [mixed[1]], [mixed[2]], [mixed[4]]]
+        mixed.deep.enable_value_index()
+        assert [mixed.deep.find_by_value(value) for value in values] == expected
+        mixed[0].set_value(True)
+        assert mixed.deep.find_by_value(True) in ([mixed[0], mixed[1]], [mixed[1], mixed[0]])
+        assert mixed.deep.find_by_value(1) == []
+        mixed.deep.disable_value_index()
+
+        print('\nRESULT OF TEST: iTree value index-> PASS')
+
+    def test8c_iTree_sorted_index(self):
+        if not 8 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree sorted value index')
+        mSetInterval, mSetRoster = Filters.mSetInterval, Filters.mSetRoster
+        root = iTree('root', subtree=[iTree('m', i % 7, subtree=[iTree('t', {'time': i + j / 10}) for j in range(3)])
+                                      for i in range(10)])
+        root.append(iTree('text', 'no number'))
+        root.append(iTree('nan', float('nan')))
+        queries = (mSetInterval('[2,5)'), mSetInterval('(2,5]'), mSetInterval('[2..5]'), mSetInterval('![2,5]'),
+                   mSetInterval('[0.5,3.5)'), mSetRoster(items=[1, 3, 7.2]))
+
+        def get_value(item, key):
+            value = item.value
+            if key is not NoKey:
+                value = value.get(key) if type(value) is dict else None
+            return value if type(value) in (int, float) and value == value else None
+
+        def check():
+            for key in (NoKey, 'time'):
+                for query in queries:
+                    expected = [i for i in root.deep if get_value(i, key) is not None and get_value(i, key) in query]
+                    result = root.deep.find_by_value_in(query, key)
+                    assert len(result) == len(expected)
+                    assert all(any(i is j for j in expected) for i in result)
+
+        # without index
+        result = root.deep.find_by_value_in(mSetInterval('[2,4)'))
+        assert [i.value for i in result] == [2, 2, 3]
+        assert [i.value['time'] for i in root.deep.find_by_value_in(mSetInterval('[2,3)'), 'time')] == [2, 2.1, 2.2]
+
+        root.deep.enable_sorted_index()
+        root.deep.enable_sorted_index('time')
+        check()
+        # results are sorted by value
+        result = root.deep.find_by_value_in(mSetInterval('[-1,7)'))
+        assert [i.value for i in result] == sorted(i.value for i in result)
+        # changes are tracked
+        root[0].set_value(4)
+        root[1][0].set_key_value('time', 4.5)
+        root[2].append(iTree('new', 3, subtree=[iTree('t', {'time': 3.3})]))
+        root.insert(0, iTree('ins', 2.5))
+        check()
+        del root[3]
+        root[4] = iTree('replaced', 3)
+        root[5].clear()
+        check()
+        assert root.deep.find_by_value_in(mSetRoster(items=[2.5]))[0] is root[0]
+        root.deep.disable_sorted_index('time')
+        root.deep.disable_sorted_index()
+        check()
+
+        print('\nRESULT OF TEST: iTree sorted value index-> PASS')
+
     def test8_iTree_other_methods(self):
         if not 8 in TEST_SELECTION:
             return
@@ -1907,6 +2902,43 @@ class Test1_iTreeInstance:
         assert sum(1 for _ in filter(myfilter, largetree.deep)) == size
         print('\nRESULT OF TEST: iTree other methods-> PASS')
 
+    def test8d_iTree_render_stream(self):
+        if not 8 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: iTree render into stream')
+        root = iTree('root', 1, subtree=[iTree('a', i, subtree=[iTree('b', j) for j in range(2)]) for i in range(3)])
+        output = root.renders()
+        assert output.count('\n') == 10
+        assert output.startswith("iTree('root', value=1)\n > iTree('a', value=0)\n .  > iTree('b', value=0)\n")
+        stream = io.StringIO()
+        root.render(stream=stream)
+        assert stream.getvalue() == output
+        # filtered and enumerated
+        stream = io.StringIO()
+        root.render(lambda i: i.value != 1, enumerate=True, stream=stream)
+        assert stream.getvalue() == root.renders(lambda i: i.value != 1, enumerate=True)
+        assert stream.getvalue() == " > 0. iTree('a', value=0)\n .  > 0. iTree('b', value=0)\n" \
+                                    " > 1. iTree('a', value=2)\n .  > 0. iTree('b', value=0)\n"
+        # enumeration without filter
+        assert ' .  > 1. ' in root.renders(enumerate=True)
+        # line limit
+        stream = io.StringIO()
+        root.render(stream=stream, max_lines=3)
+        lines = stream.getvalue().splitlines(True)
+        assert len(lines) == 4
+        assert ''.join(lines[:3]) == ''.join(output.splitlines(True)[:3])
+        assert 'truncated' in lines[3]
+        assert root.renders(max_lines=11) == output
+        # very deep trees are rendered without recursion
+        deep_root = item = iTree('deep')
+        for i in range(sys.getrecursionlimit() + 100):
+            item = item.append(iTree(i))
+        lines = deep_root.renders().splitlines()
+        assert len(lines) == sys.getrecursionlimit() + 101
+        assert lines[-1].count('.  ') == sys.getrecursionlimit() + 99
+
+        print('\nRESULT OF TEST: iTree render into stream -> PASS')
+
     def test9_math_operations_iTree(self):
         if not 9 in TEST_SELECTION:
             return
@@ -2004,3 +3036,49 @@ class Test1_iTreeInstance:
         assert not root.deep.is_tag_in(5)
 
         print('\nRESULT OF TEST: contains operations with iTrees - pass')
+
+    def test10b_tag_index_iTree(self):
+        if not 10 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: deep tag index of iTrees')
+        root = iTree('root', subtree=[iTree('A', subtree=[iTree('a', 0), iTree('b', 1), iTree('c', 2)]),
+                                      iTree('B', subtree=[iTree('b', 3), iTree('d', 4)]),
+                                      iTree('link', link=iTLink(None, [('A', 0)]))])
+
+        def check():
+            for tag in ('A', 'B', 'a', 'b', 'c', 'd', 'e', 'x', 'link'):
+                expected = [i for i in root.deep if i.tag == tag]
+                result = root.deep.find_by_tag(tag)
+                assert len(result) == len(expected)
+                assert all(any(i is j for j in expected) for i in result)
+                assert root.deep.is_tag_in(tag) == bool(expected)
+            expected = [i for i in root.deep if i.tag in ('a', 'b')]
+            result = root.deep.find_by_tag_fnmatch('[ab]')
+            assert len(result) == len(expected)
+
+        # first level tags are found too
+        assert root.deep.is_tag_in('B')
+        assert root.deep.find_by_tag('b') == [root[0][1], root[1][0]]
+        assert root.deep.find_by_tag_fnmatch('[ab]') == [root[0][0], root[0][1], root[1][0]]
+
+        root.deep.enable_tag_index()
+        check()
+        root[0][0].rename('x')
+        root[1].rename_many({'b': 'e', 'd': 'a'})
+        check()
+        root[0].move(1)
+        root[0].append(iTree('e'))
+        del root[1][('c', 0)]
+        check()
+        # link loads
+        root.load_links()
+        assert len(root[-1]) == 2
+        check()
+        root[-1].append(iTree('x', 'local'))
+        check()
+        root[-1].clear()
+        check()
+        root.deep.disable_tag_index()
+        check()
+
+        print('\nRESULT OF TEST: deep tag index of iTrees - PASS')
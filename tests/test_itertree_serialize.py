@@ -242,6 +242,254 @@ class Test1_Serializers:
         assert load_tree==root
         print('\nRESULT OF TEST: save load serializers  iTree - pass')
 
+    def test3b_dump_stream_iTree(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: streamed dump of iTree')
+        import gzip
+        import io
+        from itertree.itree_serializer.itree_json_serialize import iTStdJSONSerializer2
+
+        class SmallBufferSerializer(iTStdJSONSerializer2):
+            # force multiple blocks and the temporary file buffering
+            DUMP_BLOCK_SIZE = 100
+            DUMP_SPOOL_SIZE = 1000
+
+        root = iTree('root', 0, subtree=[iTree('%i' % i, i, subtree=[iTree('sub', [i, 'data', b'bytes'])])
+                                         for i in range(500)])
+        data = iTStdJSONSerializer2(iTree).dumps(root, add_header=True, calc_hash=True)[1]
+        data_no_hash = iTStdJSONSerializer2(iTree).dumps(root, add_header=True)
+        for serializer in (iTStdJSONSerializer2, SmallBufferSerializer):
+            for pack in (True, False):
+                fh = io.BytesIO()
+                data_hash = root.dump(fh, pack=pack, itree_serializer=serializer)
+                dumped = gzip.decompress(fh.getvalue()) if pack else fh.getvalue()
+                # same data as the not streamed serialization
+                assert dumped == data
+                assert data_hash in dumped.decode()
+                fh.seek(0)
+                assert iTree().load(fh) == root
+                fh = io.BytesIO()
+                assert root.dump(fh, pack=pack, calc_hash=False, itree_serializer=serializer)
+                dumped = gzip.decompress(fh.getvalue()) if pack else fh.getvalue()
+                assert dumped == data_no_hash
+        # single item tree
+        fh = io.BytesIO()
+        iTree('single', 1).dump(fh)
+        fh.seek(0)
+        assert iTree().load(fh) == iTree('single', 1)
+
+        tmp_dir = get_tmp_path(True)
+        file_path = os.path.join(tmp_dir, 'test_stream.itz')
+        root.dump(file_path, itree_serializer=SmallBufferSerializer)
+        assert iTree().load(file_path) == root
+        with pytest.raises(FileExistsError):
+            root.dump(file_path)
+        print('\nRESULT OF TEST: streamed dump of iTree - pass')
+
+    def test3c_load_stream_iTree(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: streamed load of iTree')
+        import io
+
+        root = iTree('root', 0, subtree=[iTree('%i' % i, i, subtree=[iTree('sub', [i, {'data': b'bytes'}],
+                                                                           flags=iTFLAG.READ_ONLY_VALUE)])
+                                         for i in range(500)])
+        item = root[3]
+        for i in range(50):
+            item = item.append(iTree('level %i' % i))
+        root.append(iTree('read_only', subtree=[iTree('x', subtree=[iTree('y')])], flags=iTFLAG.READ_ONLY_TREE))
+        flags = [i.flags for i in root.deep]
+        for pack in (True, False):
+            for calc_hash in (True, False):
+                fh = io.BytesIO()
+                root.dump(fh, pack=pack, calc_hash=calc_hash)
+                fh.seek(0)
+                load_tree = iTree().load(fh)
+                assert load_tree == root
+                assert [i.flags for i in load_tree.deep] == flags
+                assert load_tree[-1][0][0].is_tree_read_only
+        # data without header
+        assert iTree().load(io.BytesIO(root.dumps())) == root
+        # corrupted data
+        fh = io.BytesIO()
+        root.dump(fh, pack=False)
+        with pytest.raises(PermissionError):
+            iTree().load(io.BytesIO(fh.getvalue().replace(b'level 4', b'level X')))
+        assert iTree().load(io.BytesIO(fh.getvalue().replace(b'level 4', b'level X')), check_hash=False)
+        with pytest.raises(SyntaxError):
+            iTree().load(io.BytesIO(b'{"no": "itree"}'))
+        print('\nRESULT OF TEST: streamed load of iTree - pass')
+
+    def test3d_binary_serializer_iTree(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: binary serializer iTree')
+        import io
+        values = [None, True, False, 0, -5, 2 ** 70, 1.5, 'data', b'', b'bytes' * 10000, ['data', b'bytes', 1, 12.45],
+                  ('data', b'bytes'), {1, 2}, collections.deque([1, 2]), {1: ('data', b'bytes'), (4, 0): [1]},
+                  OrderedDict([(2, 1), (1, 2)]), NoValue, NoKey, iTLink('file.itz', ['target'])]
+        root = iTree('root', 0, subtree=[iTree(i, value) for i, value in enumerate(values)])
+        root.append(iTree('read_only', subtree=[iTree('x', subtree=[iTree('y')])], flags=iTFLAG.READ_ONLY_TREE))
+        if np is not None:
+            root.append(iTree('numpy', np.arange(100000, dtype=np.float64)))
+            root.append(iTree('numpy', np.zeros((3, 4), dtype=np.int8)))
+            root.append(iTree('numpy', np.arange(12).reshape(3, 4)[:, 1]))
+        for pack in (True, False):
+            for calc_hash in (True, False):
+                fh = io.BytesIO()
+                root.dump(fh, pack=pack, calc_hash=calc_hash, itree_serializer=iTStdBinarySerializer)
+                fh.seek(0)
+                load_tree = iTree().load(fh, itree_serializer=iTStdBinarySerializer)
+                for item, loaded_item in zip(root.deep, load_tree.deep):
+                    assert item.tag == loaded_item.tag
+                    assert item.flags == loaded_item.flags
+                    assert type(item.value) is type(loaded_item.value)
+                    if np is not None and type(item.value) is np.ndarray:
+                        assert item.value.dtype == loaded_item.value.dtype
+                        assert (item.value == loaded_item.value).all()
+                    else:
+                        assert item.value == loaded_item.value
+        if np is not None:
+            # the raw array data is stored (no list of integers)
+            data = iTStdBinarySerializer(iTree).dumps(iTree('numpy', np.zeros(100000)))
+            assert len(data) < 800200
+        # corrupted data
+        data = bytearray(iTStdBinarySerializer(iTree).dumps(root, calc_hash=True)[1])
+        data[data.index(b'data')] = ord('D')
+        with pytest.raises(PermissionError):
+            iTStdBinarySerializer(iTree).loads(bytes(data))
+        assert iTStdBinarySerializer(iTree).loads(bytes(data), check_hash=False, load_links=False)
+        with pytest.raises(SyntaxError):
+            iTree().load(io.BytesIO(iTree("json").dumps()), itree_serializer=iTStdBinarySerializer)
+
+        tmp_dir = get_tmp_path(True)
+        file_path = os.path.join(tmp_dir, 'test_binary.itb')
+        root.dump(file_path, itree_serializer=iTStdBinarySerializer)
+        assert len(iTree().load(file_path, itree_serializer=iTStdBinarySerializer, load_links=False).deep) == \
+               len(root.deep)
+        print('\nRESULT OF TEST: binary serializer iTree - pass')
+
+    def test3e_lazy_load_iTree(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: lazy load iTree')
+        import io
+        root = iTree('root', 0, subtree=[iTree('a', i, subtree=[iTree('b', j, subtree=[iTree('c', b'data')])
+                                                                 for j in range(3)]) for i in range(4)])
+        root.append(iTree('read_only', subtree=[iTree('x', subtree=[iTree('y')])], flags=iTFLAG.READ_ONLY_TREE))
+        root.append(iTree('leaf'))
+        tmp_dir = get_tmp_path(True)
+        file_path = os.path.join(tmp_dir, 'test_lazy.itb')
+        root.dump(file_path, pack=False, itree_serializer=iTStdBinarySerializer)
+        lazy_tree = iTree().load(file_path, itree_serializer=iTStdBinarySerializer, lazy=True)
+        # only the root is created, the length is taken from the index
+        assert len(lazy_tree) == len(root)
+        assert not list(lazy_tree._iter_created(lazy_tree))
+        assert lazy_tree.get(('a', 2), ('b', 1)).value == 1
+        # only the items on the path and their siblings are created
+        assert len(list(lazy_tree._iter_created(lazy_tree))) == len(root) + 3
+        assert lazy_tree.get(('a', 2), ('b', 1), 0).value == b'data'
+        assert repr(lazy_tree) == repr(root)
+        assert lazy_tree == root
+        assert [i.tag_idx_path for i in lazy_tree.deep] == [i.tag_idx_path for i in root.deep]
+        assert lazy_tree.get(('read_only', 0), ('x', 0)).is_tree_read_only
+        with pytest.raises(PermissionError):
+            lazy_tree.get(('read_only', 0), ('x', 0)).append(iTree('z'))
+        # the lazy loaded tree can be changed
+        lazy_tree = iTree().load(file_path, itree_serializer=iTStdBinarySerializer, lazy=True)
+        lazy_tree[0].append(iTree('new'))
+        assert lazy_tree[0][-1].idx_path == (0, 3)
+        assert len(lazy_tree.deep) == len(root.deep) + 1
+        # the changed lazy loaded tree can be stored in its source file (not created children are read during dump)
+        expected = root.copy()
+        for calc_hash in (False, True):
+            lazy_tree = iTree().load(file_path, itree_serializer=iTStdBinarySerializer, lazy=True)
+            lazy_tree[0].set_value(100 + calc_hash)
+            lazy_tree.append(iTree('new'))
+            lazy_tree.dump(file_path, pack=False, calc_hash=calc_hash, overwrite=True,
+                           itree_serializer=iTStdBinarySerializer)
+            assert lazy_tree.get(('a', 3), ('b', 2), 0).value == b'data'
+            expected[0].set_value(100 + calc_hash)
+            expected.append(iTree('new'))
+            assert lazy_tree == expected
+            assert iTree().load(file_path, itree_serializer=iTStdBinarySerializer) == expected
+            assert not os.path.exists(file_path + '.tmp')
+        root.dump(file_path, pack=False, overwrite=True, itree_serializer=iTStdBinarySerializer)
+        # data without index (e.g. older files) and data in memory
+        data = iTStdBinarySerializer(iTree).dumps(root)
+        size = len(data) - 16 - (len(root.deep) + 1) * 20
+        assert data.endswith(b'ITREEIDX')
+        for source in (data, data[:size]):
+            assert iTree().load(io.BytesIO(source), itree_serializer=iTStdBinarySerializer, lazy=True) == root
+        # packed files and JSON files cannot be loaded lazy
+        root.dump(file_path, overwrite=True, itree_serializer=iTStdBinarySerializer)
+        with pytest.raises(ValueError):
+            iTree().load(file_path, itree_serializer=iTStdBinarySerializer, lazy=True)
+        with pytest.raises(ValueError):
+            iTree().load(file_path, lazy=True)
+        print('\nRESULT OF TEST: lazy load iTree - pass')
+
+    def test3f_load_target_path_iTree(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: load target path iTree')
+        root = iTree('root', subtree=[iTree('config', subtree=[iTree('node', i, subtree=[iTree('leaf', b'data')])
+                                                               for i in range(5)]),
+                                      iTree('node', 99), iTree('node', 100)])
+        tmp_dir = get_tmp_path(True)
+        file_path = os.path.join(tmp_dir, 'test_target_path.itb')
+        root.dump(file_path, pack=False, itree_serializer=iTStdBinarySerializer)
+        sub_tree = iTree().load(file_path, itree_serializer=iTStdBinarySerializer, target_path=['config', ('node', 3)])
+        assert sub_tree.is_root
+        assert sub_tree == root.get('config', ('node', 3))[0]
+        for item in root.deep:
+            loaded_item = iTree().load(file_path, itree_serializer=iTStdBinarySerializer,
+                                       target_path=item.tag_idx_path)
+            assert loaded_item == item
+            assert iTree().load(file_path, itree_serializer=iTStdBinarySerializer,
+                                target_path=item.idx_path, lazy=True) == item
+        assert iTree().load(file_path, itree_serializer=iTStdBinarySerializer, target_path=[0, -1]).value == 4
+        assert iTree().load(file_path, itree_serializer=iTStdBinarySerializer,
+                            target_path=[('node', -1)]).value == 100
+        assert iTree().load(file_path, itree_serializer=iTStdBinarySerializer, target_path=[]) == root
+        with pytest.raises(IndexError):
+            iTree().load(file_path, itree_serializer=iTStdBinarySerializer, target_path=[3])
+        with pytest.raises(KeyError):
+            iTree().load(file_path, itree_serializer=iTStdBinarySerializer, target_path=['config', ('node', 5)])
+        with pytest.raises(KeyError):
+            # family with multiple items
+            iTree().load(file_path, itree_serializer=iTStdBinarySerializer, target_path=['node'])
+        with pytest.raises(ValueError):
+            iTree().load(file_path, target_path=['config'])
+        print('\nRESULT OF TEST: load target path iTree - pass')
+
+    def test3g_load_indented_records_iTree(self):
+        if not 3 in TEST_SELECTION:
+            return
+        print('\nRESULT OF TEST: load indented records iTree')
+        import io
+        import json
+        from itertree.itree_serializer import itree_json_serialize
+
+        # the standard json stores each record over many indented lines (one line per list element)
+        root = iTree('root', list(range(20000)),
+                     subtree=[iTree('sub', ['[{"quoted\\" ]}', {'key': '}]'}, list(range(1000))]),
+                              iTree('x', 'y', subtree=[iTree('z', [[1, [2, [3]]], {'a': [4]}])])])
+        json_module, is_orjson = itree_json_serialize.JSON, itree_json_serialize.IS_ORJSON
+        itree_json_serialize.JSON, itree_json_serialize.IS_ORJSON = json, False
+        try:
+            serializer = itree_json_serialize.iTStdJSONSerializer2(iTree)
+            data = serializer.dumps(root, add_header=True, calc_hash=True)[1]
+            assert data.count(b'\n') > 21000
+            t = timeit.default_timer()
+            assert serializer._load_lines(io.BytesIO(data)) == root
+            assert timeit.default_timer() - t < 5
+        finally:
+            itree_json_serialize.JSON, itree_json_serialize.IS_ORJSON = json_module, is_orjson
+        print('\nRESULT OF TEST: load indented records iTree - pass')
+
 
 class Test2_Converter:
 